@@ -8,25 +8,35 @@ bl_info = {
     "category": "3D View",
 }
 
+import time
+
+_import_started = time.perf_counter()
+
 import bpy
+from .profiling import logger, record_registration
+from .registration import register_modules, unregister_modules
 from . import cinematography
+from . import render
 from . import ui
 
+_import_ms = (time.perf_counter() - _import_started) * 1000.0
+
+modules = (cinematography, render, ui)
+
 def register():
-    print("Registering SciBlend Compositor") 
+    record_registration("import", _import_ms)
+    started = time.perf_counter()
     try:
-        cinematography.register()
-        ui.register()
+        register_modules(modules)
     except Exception as e:
-        print(f"Error registering SciBlend Compositor: {str(e)}")
+        logger.exception("Error registering SciBlend Compositor: %s", e)
+    logger.info("Registered SciBlend Compositor in %.1f ms", (time.perf_counter() - started) * 1000.0)
 
 def unregister():
-    print("Unregistering SciBlend Compositor")
     try:
-        ui.unregister()
-        cinematography.unregister()
+        unregister_modules(modules)
     except Exception as e:
-        print(f"Error unregistering SciBlend Compositor: {str(e)}")
+        logger.exception("Error unregistering SciBlend Compositor: %s", e)
 
 if __name__ == "__main__":
     register()
\ No newline at end of file
@@ -1,13 +1,17 @@
 from . import render_settings
 from . import camera_manager
 from . import cinema_formats
+from . import focal_lengths
+from . import framing
+from . import rigs
+from . import baking
+from . import trajectory
+from ..registration import register_modules, unregister_modules
+
+modules = (render_settings, camera_manager, cinema_formats, focal_lengths, framing, rigs, baking, trajectory)
 
 def register():
-    render_settings.register()
-    camera_manager.register()
-    cinema_formats.register()
+    register_modules(modules)
 
 def unregister():
-    cinema_formats.unregister()
-    camera_manager.unregister()
-    render_settings.unregister()
\ No newline at end of file
+    unregister_modules(modules)
\ No newline at end of file
@@ -0,0 +1,190 @@
+import time
+
+import bpy
+import numpy as np
+
+from .camera_manager import EDIT_CAMERA_KEY, list_item_camera, shot_table
+from ..core.baking import CONSTANT_INTERPOLATION, LINEAR_INTERPOLATION, held_keys, keyframe_coords, matrix_to_euler
+from ..profiling import timed
+from ..registration import register_classes, unregister_classes
+
+# Camera data channels copied from each shot
+DATA_CHANNELS = ('lens', 'ortho_scale', 'clip_start', 'clip_end')
+
+def is_animated(obj):
+    # Objects whose camera can move or change within a shot; they are keyed
+    # on every frame of their shot, everything else is read once
+    if obj.parent is not None or len(obj.constraints):
+        return True
+    for id_data in (obj, obj.data):
+        animation_data = id_data.animation_data
+        if animation_data is not None and (animation_data.action is not None or len(animation_data.drivers)):
+            return True
+    return False
+
+def shot_samples(scene, edit_camera):
+    # (frames, world matrices (N, 4, 4), data channels (N, len(DATA_CHANNELS)),
+    # camera types, interpolation (N,)) for every segment of the shot table,
+    # in timeline order. A static camera is sampled once per segment; an
+    # animated one on every frame, linear inside the segment and constant on
+    # its last frame so the cut stays hard.
+    table = shot_table(scene)
+    frames, matrices, channels, types, interpolation = [], [], [], [], []
+    cached = {}
+    frame_current, subframe = scene.frame_current, scene.frame_subframe
+
+    def sample(camera_obj):
+        camera_data = camera_obj.data
+        return (
+            np.array(camera_obj.matrix_world, dtype=np.float64),
+            [getattr(camera_data, name) for name in DATA_CHANNELS],
+            camera_data.type,
+        )
+
+    def append(frame, values, mode):
+        frames.append(frame)
+        matrices.append(values[0])
+        channels.append(values[1])
+        types.append(values[2])
+        interpolation.append(mode)
+
+    try:
+        for start, end, index in zip(table.starts, table.ends, table.shots):
+            if index >= len(scene.camera_list):
+                continue
+            camera_obj = list_item_camera(scene.camera_list[index])
+            if camera_obj is None or camera_obj == edit_camera:
+                continue
+            key = camera_obj.as_pointer()
+            if key in cached:
+                append(start, cached[key], CONSTANT_INTERPOLATION)
+            elif is_animated(camera_obj):
+                for frame in range(start, end + 1):
+                    scene.frame_set(frame)
+                    append(frame, sample(camera_obj), LINEAR_INTERPOLATION if frame < end else CONSTANT_INTERPOLATION)
+            else:
+                cached[key] = sample(camera_obj)
+                append(start, cached[key], CONSTANT_INTERPOLATION)
+    finally:
+        if scene.frame_current != frame_current or scene.frame_subframe != subframe:
+            scene.frame_set(frame_current, subframe=subframe)
+    return (
+        np.array(frames, dtype=np.float64),
+        np.array(matrices, dtype=np.float64).reshape(-1, 4, 4),
+        np.array(channels, dtype=np.float64).reshape(-1, len(DATA_CHANNELS)),
+        types,
+        np.array(interpolation, dtype=np.int32),
+    )
+
+def ensure_action(id_data, name):
+    animation_data = id_data.animation_data_create()
+    if animation_data.action is None:
+        animation_data.action = bpy.data.actions.new(name)
+    return animation_data.action
+
+def write_fcurve(action, data_path, index, frames, values, interpolation=CONSTANT_INTERPOLATION):
+    # Replaces the channel with keys added and filled in bulk; interpolation
+    # is one value for every key or one per key
+    fcurves = action.fcurves
+    fcurve = fcurves.find(data_path, index=index)
+    if fcurve is not None:
+        fcurves.remove(fcurve)
+    fcurve = fcurves.new(data_path, index=index)
+    points = fcurve.keyframe_points
+    points.add(len(frames))
+    points.foreach_set("co", keyframe_coords(frames, values))
+    modes = np.empty(len(frames), dtype=np.int32)
+    modes[:] = interpolation
+    points.foreach_set("interpolation", modes)
+    fcurve.update()
+    return len(frames)
+
+def write_held_fcurve(action, data_path, index, frames, values, interpolation=CONSTANT_INTERPOLATION):
+    return write_fcurve(action, data_path, index, *held_keys(frames, values, interpolation))
+
+def edit_camera_object(scene, name):
+    camera_obj = bpy.data.objects.get(name)
+    if camera_obj is None or camera_obj.type != 'CAMERA':
+        camera_obj = bpy.data.objects.new(name, bpy.data.cameras.new(name))
+        scene.collection.objects.link(camera_obj)
+    camera_obj[EDIT_CAMERA_KEY] = True
+    return camera_obj
+
+def bake_edit_camera(scene, camera_obj):
+    # Returns (shots baked, keys written, camera types seen)
+    frames, matrices, channels, types, interpolation = shot_samples(scene, camera_obj)
+    if not len(frames):
+        return 0, 0, set()
+    locations, eulers = matrix_to_euler(matrices)
+    # Continuous angles keep the curves readable if the keys are later eased
+    eulers = np.unwrap(eulers, axis=0)
+    camera_obj.rotation_mode = 'XYZ'
+    camera_obj.parent = None
+
+    keys = 0
+    action = ensure_action(camera_obj, f"{camera_obj.name}Action")
+    for data_path, values in (("location", locations), ("rotation_euler", eulers)):
+        for index in range(3):
+            keys += write_held_fcurve(action, data_path, index, frames, values[:, index], interpolation)
+    camera_data = camera_obj.data
+    camera_data.type = types[0]
+    action = ensure_action(camera_data, f"{camera_data.name}Action")
+    for column, data_path in enumerate(DATA_CHANNELS):
+        keys += write_held_fcurve(action, data_path, 0, frames, channels[:, column], interpolation)
+    # Every segment ends on exactly one constant key
+    return int(np.count_nonzero(interpolation == CONSTANT_INTERPOLATION)), keys, set(types)
+
+class CINEMATOGRAPHY_OT_bake_edit_camera(bpy.types.Operator):
+    bl_idname = "cinematography.bake_edit_camera"
+    bl_label = "Bake Edit Camera"
+    bl_description = "Bake the shot list into one camera whose transform, lens and clipping cut from shot to shot"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    name: bpy.props.StringProperty(
+        name="Camera",
+        description="Name of the camera to bake into, created if it does not exist",
+        default="EditCamera"
+    )
+    make_active: bpy.props.BoolProperty(
+        name="Make Active",
+        description="Use the baked camera as the scene camera and turn off shot switching",
+        default=True
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return len(context.scene.camera_list) > 0
+
+    @timed
+    def execute(self, context):
+        scene = context.scene
+        started = time.perf_counter()
+        camera_obj = edit_camera_object(scene, self.name)
+        shots, keys, types = bake_edit_camera(scene, camera_obj)
+        if not shots:
+            self.report({'WARNING'}, "No shots to bake")
+            return {'CANCELLED'}
+        if self.make_active:
+            scene.camera = camera_obj
+            scene.use_shot_switching = False
+
+        elapsed = (time.perf_counter() - started) * 1000.0
+        warnings = []
+        if len(types) > 1:
+            warnings.append(f"mixed camera types, baked as {camera_obj.data.type}")
+        if self.make_active and any(marker.camera is not None for marker in scene.timeline_markers):
+            warnings.append("camera markers still switch cameras")
+        self.report({'WARNING'} if warnings else {'INFO'}, (
+            f"Baked {shots} shots into '{camera_obj.name}' with {keys} keys"
+            + "".join(f", {warning}" for warning in warnings)
+            + f" ({elapsed:.1f} ms)"
+        ))
+        return {'FINISHED'}
+
+classes = (CINEMATOGRAPHY_OT_bake_edit_camera,)
+
+def register():
+    register_classes(classes)
+
+def unregister():
+    unregister_classes(classes)
@@ -1,20 +1,206 @@
+import time
+
 import bpy
+import numpy as np
+from bpy.app.handlers import persistent
 from bpy.props import IntProperty, PointerProperty, CollectionProperty, StringProperty, BoolProperty
 from bpy.types import PropertyGroup, UIList, Operator
 
+from ..core.markers import marker_names, plan_camera_markers, plan_timeline_markers, scan_markers
+from ..core.shots import (
+    SORT_KEYS,
+    ShotArrays,
+    ShotTable,
+    covering_mask,
+    gap_after_mask,
+    list_sync_plan,
+    minimal_moves,
+    name_mask,
+    overlapping_mask,
+    sort_ranks,
+    timeline_order,
+)
+from ..profiling import timed
+from ..registration import (
+    add_handler,
+    register_classes,
+    register_properties,
+    remove_handler,
+    unregister_classes,
+    unregister_properties,
+)
+
+# scene pointer -> {camera pointer: [start marker name, end marker name]}
+_marker_index = {}
+_marker_sync_suspended = 0
+
+# scene pointer -> ShotTable / ShotArrays, rebuilt lazily after invalidate_shot_table()
+_shot_tables = {}
+_shot_arrays = {}
+_msgbus_owner = object()
+
+# ID property marking a baked edit camera, which never becomes a shot itself
+EDIT_CAMERA_KEY = "compositor_edit_camera"
+
+@timed
+def update_camera_range(self, context):
+    invalidate_shot_table(context.scene)
+    if _marker_sync_suspended:
+        return
+    camera = self.id_data
+    if camera is None or getattr(camera, "type", None) != 'CAMERA':
+        return
+    update_camera_markers(camera, context.scene)
+
+def screen_areas(context):
+    # No screen when running in background mode
+    screen = context.screen
+    return screen.areas if screen is not None else ()
+
+def list_item_camera(item):
+    camera_obj = item.camera
+    if camera_obj is None and item.name:
+        # Items saved before the list held object pointers
+        camera_obj = bpy.data.objects.get(item.name)
+    if camera_obj is not None and camera_obj.type == 'CAMERA':
+        return camera_obj
+    return None
+
+def shot_cameras(scene):
+    return [obj for obj in scene.objects if obj.type == 'CAMERA' and not obj.get(EDIT_CAMERA_KEY)]
+
+def _shot_rows(camera_list):
+    for item in camera_list:
+        camera_obj = list_item_camera(item)
+        if camera_obj is None:
+            yield item.name, 0, -1, False
+        else:
+            camera_range = camera_obj.camera_range
+            yield camera_obj.name, camera_range.start_frame, camera_range.end_frame, True
+
+def shot_arrays(scene):
+    key = scene.as_pointer()
+    arrays = _shot_arrays.get(key)
+    if arrays is None:
+        arrays = ShotArrays(_shot_rows(scene.camera_list))
+        _shot_arrays[key] = arrays
+    return arrays
+
+def shot_table(scene):
+    key = scene.as_pointer()
+    table = _shot_tables.get(key)
+    if table is None:
+        table = ShotTable(shot_arrays(scene).intervals())
+        _shot_tables[key] = table
+    return table
+
+def invalidate_shot_table(scene=None):
+    if scene is None:
+        _shot_tables.clear()
+        _shot_arrays.clear()
+    else:
+        _shot_tables.pop(scene.as_pointer(), None)
+        _shot_arrays.pop(scene.as_pointer(), None)
+
+def _sync_list_item_names():
+    for scene in bpy.data.scenes:
+        for item in scene.camera_list:
+            camera_obj = item.camera
+            if camera_obj is not None and item.name != camera_obj.name:
+                item.name = camera_obj.name
+    invalidate_shot_table()
+
+def subscribe_object_renames():
+    bpy.msgbus.clear_by_owner(_msgbus_owner)
+    if bpy.app.background:
+        # No event loop to deliver notifications
+        return
+    bpy.msgbus.subscribe_rna(
+        key=(bpy.types.Object, "name"),
+        owner=_msgbus_owner,
+        args=(),
+        notify=_sync_list_item_names,
+    )
+
+@persistent
+@timed
+def switch_camera_for_frame(scene, depsgraph=None):
+    if not scene.use_shot_switching:
+        return
+    index = shot_table(scene).shot_at(scene.frame_current)
+    if index is None or index >= len(scene.camera_list):
+        return
+    camera_obj = list_item_camera(scene.camera_list[index])
+    if camera_obj is not None and scene.camera != camera_obj:
+        scene.camera = camera_obj
+
+@timed
+def update_shot_switching(self, context):
+    invalidate_shot_table(context.scene)
+    if context.scene.use_shot_switching:
+        switch_camera_for_frame(context.scene)
+
+def _poll_camera_object(self, obj):
+    return obj.type == 'CAMERA'
+
 class CameraListItem(PropertyGroup):
     name: StringProperty()
+    camera: PointerProperty(type=bpy.types.Object, poll=_poll_camera_object)
 
 class CameraRangeProperties(PropertyGroup):
-    start_frame: IntProperty(name="Start Frame", default=1, min=1)
-    end_frame: IntProperty(name="End Frame", default=250, min=1)
+    start_frame: IntProperty(name="Start Frame", default=1, min=1, update=update_camera_range)
+    end_frame: IntProperty(name="End Frame", default=250, min=1, update=update_camera_range)
 
 class CAMERA_UL_list(UIList):
+    sort_by: bpy.props.EnumProperty(
+        name="Sort By",
+        items=SORT_KEYS,
+        default='LIST'
+    )
+    filter_mode: bpy.props.EnumProperty(
+        name="Show",
+        items=(
+            ('ALL', "All", "Show every camera"),
+            ('OVERLAPPING', "Overlapping", "Cameras whose range overlaps another camera"),
+            ('CURRENT', "Current Frame", "Cameras whose range covers the current frame"),
+            ('GAP_AFTER', "Gap After", "Cameras followed by frames no camera covers"),
+        ),
+        default='ALL'
+    )
+
+    def draw_filter(self, context, layout):
+        row = layout.row(align=True)
+        row.prop(self, "filter_name", text="")
+        row.prop(self, "use_filter_invert", text="", icon='ARROW_LEFTRIGHT')
+        row = layout.row(align=True)
+        row.prop(self, "filter_mode", text="")
+        row.prop(self, "sort_by", text="")
+        row.prop(self, "use_filter_sort_reverse", text="", icon='SORT_DESC' if self.use_filter_sort_reverse else 'SORT_ASC')
+
+    @timed
+    def filter_items(self, context, data, propname):
+        arrays = shot_arrays(context.scene)
+        if len(arrays) != len(getattr(data, propname)):
+            invalidate_shot_table(context.scene)
+            arrays = shot_arrays(context.scene)
+
+        shown = np.ones(len(arrays), dtype=bool)
+        if self.filter_name:
+            shown &= name_mask(arrays, self.filter_name)
+        if self.filter_mode == 'OVERLAPPING':
+            shown &= overlapping_mask(arrays)
+        elif self.filter_mode == 'CURRENT':
+            shown &= covering_mask(arrays, context.scene.frame_current)
+        elif self.filter_mode == 'GAP_AFTER':
+            shown &= gap_after_mask(arrays)
+        flags = np.where(shown, self.bitflag_filter_item, 0).tolist()
+        return flags, sort_ranks(arrays, self.sort_by)
+
     def draw_item(self, context, layout, data, item, icon, active_data, active_propname):
         if self.layout_type in {'DEFAULT', 'COMPACT'}:
             row = layout.row(align=True)
-            camera_obj = bpy.data.objects.get(item.name)
-            if camera_obj and camera_obj.type == 'CAMERA':
+            camera_obj = list_item_camera(item)
+            if camera_obj is not None:
                 row.prop(camera_obj, "name", text="", emboss=False, icon='CAMERA_DATA')
                 sub = row.row(align=True)
                 sub.scale_x = 0.5
@@ -32,6 +218,7 @@ class CAMERA_OT_add(Operator):
     bl_description = "Add a new camera to the scene"
     bl_options = {'REGISTER', 'UNDO'}
 
+    @timed
     def execute(self, context):
         bpy.ops.object.camera_add()
         new_camera = context.active_object
@@ -39,9 +226,11 @@ class CAMERA_OT_add(Operator):
         new_camera.camera_range.end_frame = context.scene.frame_end
         item = context.scene.camera_list.add()
         item.name = new_camera.name
+        item.camera = new_camera
+        invalidate_shot_table(context.scene)
         
         context.scene.camera = new_camera
-        for area in context.screen.areas:
+        for area in screen_areas(context):
             if area.type == 'VIEW_3D':
                 area.spaces[0].region_3d.view_perspective = 'CAMERA'
                 break
@@ -58,16 +247,18 @@ class CAMERA_OT_remove(Operator):
     def poll(cls, context):
         return context.scene.camera_list_index >= 0 and len(context.scene.camera_list) > 0
 
+    @timed
     def execute(self, context):
         scene = context.scene
         index = scene.camera_list_index
-        camera_name = scene.camera_list[index].name
-        camera_obj = bpy.data.objects.get(camera_name)
+        camera_obj = list_item_camera(scene.camera_list[index])
         
         if camera_obj:
+            forget_camera_markers(scene, camera_obj)
             bpy.data.objects.remove(camera_obj, do_unlink=True)
         
         scene.camera_list.remove(index)
+        invalidate_shot_table(scene)
         scene.camera_list_index = min(max(0, index - 1), len(scene.camera_list) - 1)
         return {'FINISHED'}
 
@@ -88,27 +279,40 @@ class CAMERA_OT_move(Operator):
     def poll(cls, context):
         return len(context.scene.camera_list) > 1
 
+    @timed
     def execute(self, context):
         scene = context.scene
         index = scene.camera_list_index
         neighbor = index + (-1 if self.direction == 'UP' else 1)
         scene.camera_list.move(neighbor, index)
+        invalidate_shot_table(scene)
         scene.camera_list_index = neighbor
         return {'FINISHED'}
 
 class CAMERA_OT_sort(Operator):
     bl_idname = "camera.sort_list"
     bl_label = "Sort Cameras"
-    bl_description = "Sort cameras by their start frame"
+    bl_description = "Sort cameras by start frame, then end frame, then name"
     bl_options = {'REGISTER', 'UNDO'}
 
+    @timed
     def execute(self, context):
         scene = context.scene
-        camera_list = [(item.name, bpy.data.objects[item.name].camera_range.start_frame) for item in scene.camera_list]
-        sorted_list = sorted(camera_list, key=lambda x: x[1])
-        scene.camera_list.clear()
-        for name, _ in sorted_list:
-            scene.camera_list.add().name = name
+        order = timeline_order(shot_arrays(scene))
+        moves = minimal_moves(order.tolist())
+        if not moves:
+            return {'FINISHED'}
+
+        active = scene.camera_list_index
+        for from_index, to_index in moves:
+            scene.camera_list.move(from_index, to_index)
+        invalidate_shot_table(scene)
+        if 0 <= active < len(order):
+            rank = np.empty(len(order), dtype=np.int64)
+            rank[order] = np.arange(len(order))
+            # Assign only when it changed, the index update callback switches cameras
+            if scene.camera_list_index != int(rank[active]):
+                scene.camera_list_index = int(rank[active])
         return {'FINISHED'}
 
 class CAMERA_OT_update_timeline(Operator):
@@ -117,58 +321,69 @@ class CAMERA_OT_update_timeline(Operator):
     bl_description = "Update timeline markers for camera ranges"
     bl_options = {'REGISTER', 'UNDO'}
 
+    @timed
     def execute(self, context):
-        scene = context.scene
-        for obj in scene.objects:
-            if obj.type == 'CAMERA':
-                update_camera_markers(obj, scene)
+        created, changed, removed = sync_timeline_markers(context.scene)
+        self.report({'INFO'}, f"Timeline markers: {created} created, {changed} updated, {removed} removed")
         return {'FINISHED'}
 
 class CAMERA_OT_erase_all_keyframes(Operator):
     bl_idname = "camera.erase_all_keyframes"
     bl_label = "Erase All Camera Keyframes"
-    bl_description = "Erase all camera keyframes, timeline markers, and reset camera ranges"
+    bl_description = "Erase all camera keyframes, camera timeline markers, and reset camera ranges"
     bl_options = {'REGISTER', 'UNDO'}
 
+    dry_run: BoolProperty(
+        name="Dry Run",
+        description="Only report what would be cleared, without changing the scene",
+        default=False
+    )
+
+    @timed
     def execute(self, context):
         scene = context.scene
-        
-        marker_count = len(scene.timeline_markers)
-        scene.timeline_markers.clear()
-        self.report({'INFO'}, f"Cleared {marker_count} timeline markers")
-        
-        camera_count = 0
-        for obj in scene.objects:
-            if obj.type == 'CAMERA':
-                camera_count += 1
-                self.report({'INFO'}, f"Processing camera: {obj.name}")
-                
-                if obj.animation_data:
-                    obj.animation_data_clear()
-                    self.report({'INFO'}, f"Cleared animation data for {obj.name}")
-                
-                if hasattr(obj, "camera_range"):
-                    obj.camera_range.start_frame = scene.frame_start
-                    obj.camera_range.end_frame = scene.frame_end
-                    self.report({'INFO'}, f"Reset camera range for {obj.name}")
-                
-                if obj.animation_data and obj.animation_data.action:
-                    obj.animation_data.action.fcurves.clear()
-                    self.report({'INFO'}, f"Removed all keyframes for {obj.name}")
-
-        self.report({'INFO'}, f"Processed {camera_count} cameras")
-        
-        scene.camera_list.clear()
-        for obj in scene.objects:
-            if obj.type == 'CAMERA':
-                item = scene.camera_list.add()
-                item.name = obj.name
-        scene.camera_list_index = 0 if len(scene.camera_list) > 0 else -1
-        
-        for area in context.screen.areas:
-            area.tag_redraw()
-        
-        self.report({'INFO'}, "All camera keyframes, timeline markers, and camera ranges have been reset")
+        started = time.perf_counter()
+
+        cameras = shot_cameras(scene)
+        animated = [obj for obj in cameras if obj.animation_data is not None]
+        keyframe_count = sum(
+            len(fcurve.keyframe_points)
+            for obj in animated if obj.animation_data.action is not None
+            for fcurve in obj.animation_data.action.fcurves
+        )
+        found, stale = _scan_camera_markers(scene)
+        markers = stale + [marker for entry in found.values() for marker in entry if marker is not None]
+        frame_start, frame_end = scene.frame_start, scene.frame_end
+        to_reset = [
+            obj for obj in cameras
+            if (obj.camera_range.start_frame, obj.camera_range.end_frame) != (frame_start, frame_end)
+        ]
+
+        if not self.dry_run:
+            for obj in animated:
+                obj.animation_data_clear()
+            for marker in markers:
+                scene.timeline_markers.remove(marker)
+            forget_camera_markers(scene)
+            with suspend_marker_sync():
+                for obj in to_reset:
+                    obj.camera_range.start_frame = frame_start
+                    obj.camera_range.end_frame = frame_end
+            added, removed = sync_camera_list(scene, cameras)
+            if not 0 <= scene.camera_list_index < len(scene.camera_list):
+                scene.camera_list_index = 0 if len(scene.camera_list) > 0 else -1
+            for area in screen_areas(context):
+                area.tag_redraw()
+        else:
+            added, removed = sync_camera_list(scene, cameras, dry_run=True)
+
+        elapsed = (time.perf_counter() - started) * 1000.0
+        prefix = "Dry run, would clear" if self.dry_run else "Cleared"
+        self.report({'INFO'}, (
+            f"{prefix}: {keyframe_count} keyframes on {len(animated)} of {len(cameras)} cameras, "
+            f"{len(markers)} camera markers, {len(to_reset)} camera ranges reset, "
+            f"camera list +{added}/-{removed} ({elapsed:.1f} ms)"
+        ))
         return {'FINISHED'}
 
 class CAMERA_OT_view_selected(Operator):
@@ -177,45 +392,183 @@ class CAMERA_OT_view_selected(Operator):
     bl_description = "Switch view to the selected camera"
     bl_options = {'REGISTER', 'UNDO'}
 
+    @timed
     def execute(self, context):
         scene = context.scene
         if scene.camera_list and scene.camera_list_index >= 0:
-            camera_item = scene.camera_list[scene.camera_list_index]
-            camera_obj = bpy.data.objects.get(camera_item.name)
-            if camera_obj and camera_obj.type == 'CAMERA':
+            camera_obj = list_item_camera(scene.camera_list[scene.camera_list_index])
+            if camera_obj is not None:
                 context.scene.camera = camera_obj
                 bpy.ops.view3d.view_camera()
         return {'FINISHED'}
 
-def update_camera_range(self, context):
-    scene = context.scene
-    for obj in scene.objects:
-        if obj.type == 'CAMERA':
-            update_camera_markers(obj, scene)
+def _marker_camera_key(marker):
+    camera = marker.camera
+    return camera.as_pointer() if camera is not None else None
 
-def update_camera_markers(camera, scene):
-    camera_name = camera.name
-    start_frame = camera.camera_range.start_frame
-    end_frame = camera.camera_range.end_frame
+def _bound_marker_names(scene, marker_list):
+    # {camera pointer: [(start, end)]} names the markers bound to each camera
+    # may carry: the ones last written for it, so a renamed camera keeps its
+    # markers, and the ones of its current name
+    index = _marker_index.get(scene.as_pointer(), {})
+    names = {}
+    for marker in marker_list:
+        camera = marker.camera
+        if camera is None:
+            continue
+        pointer = camera.as_pointer()
+        if pointer not in names:
+            previous = index.get(pointer)
+            names[pointer] = ([tuple(previous)] if previous else []) + [marker_names(camera.name)]
+    return names
 
-    markers_to_remove = [m for m in scene.timeline_markers if m.camera == camera]
-    for marker in markers_to_remove:
-        scene.timeline_markers.remove(marker)
+def _scan_camera_markers(scene):
+    # Timeline markers of this add-on: {camera pointer: [start, end]} and
+    # the duplicates that are stale.
+    marker_list = list(scene.timeline_markers)
+    found, stale = scan_markers(
+        ((marker.name, _marker_camera_key(marker)) for marker in marker_list),
+        _bound_marker_names(scene, marker_list),
+    )
+    found = {
+        key: [marker_list[i] if i is not None else None for i in entry]
+        for key, entry in found.items()
+    }
+    return found, [marker_list[i] for i in stale]
 
-    scene.timeline_markers.new(f"{camera_name}_start", frame=start_frame)
-    scene.timeline_markers.new(f"{camera_name}_end", frame=end_frame)
+def _scene_marker_index(scene):
+    key = scene.as_pointer()
+    index = _marker_index.get(key)
+    if index is None:
+        found, _stale = _scan_camera_markers(scene)
+        index = {
+            pointer: [marker.name if marker is not None else None for marker in entry]
+            for pointer, entry in found.items()
+        }
+        _marker_index[key] = index
+    return index
 
-    for marker in scene.timeline_markers:
-        if marker.name.startswith(camera_name):
+def _apply_marker_plan(camera, markers, found, plan):
+    created = changed = 0
+    for slot, name, frame, create in plan:
+        if create:
+            marker = markers.new(name, frame=frame)
             marker.camera = camera
+            created += 1
+        else:
+            marker = found[slot]
+            marker.frame = frame
+            marker.name = name
+            changed += 1
+    return list(marker_names(camera.name)), created, changed
 
+def update_camera_markers(camera, scene):
+    index = _scene_marker_index(scene)
+    pointer = camera.as_pointer()
+    markers = scene.timeline_markers
+    found = [None, None]
+    entry = index.get(pointer)
+    if entry is not None:
+        for slot, name in enumerate(entry):
+            marker = markers.get(name) if name else None
+            if marker is not None and marker.camera == camera:
+                found[slot] = marker
+    camera_range = camera.camera_range
+    plan = plan_camera_markers(
+        camera.name, camera_range.start_frame, camera_range.end_frame,
+        [(marker.name, marker.frame) if marker is not None else None for marker in found],
+    )
+    index[pointer], created, changed = _apply_marker_plan(camera, markers, found, plan)
+    return created, changed
+
+def sync_timeline_markers(scene):
+    markers = scene.timeline_markers
+    marker_list = list(markers)
+    cameras = shot_cameras(scene)
+    plans, stale, kept = plan_timeline_markers(
+        [
+            (obj.as_pointer(), obj.name, obj.camera_range.start_frame, obj.camera_range.end_frame)
+            for obj in cameras
+        ],
+        [(marker.name, marker.frame, _marker_camera_key(marker)) for marker in marker_list],
+        _bound_marker_names(scene, marker_list),
+    )
+    index = {}
+    created = changed = 0
+    for obj, (pointer, plan) in zip(cameras, plans):
+        found = [marker_list[i] if i is not None else None for i in kept[pointer]]
+        index[pointer], obj_created, obj_changed = _apply_marker_plan(obj, markers, found, plan)
+        created += obj_created
+        changed += obj_changed
+    for i in stale:
+        markers.remove(marker_list[i])
+    _marker_index[scene.as_pointer()] = index
+    return created, changed, len(stale)
+
+def sync_camera_list(scene, cameras, dry_run=False):
+    # Drop items whose camera is gone and append cameras missing from the
+    # list, keeping the order and data of everything else.
+    camera_list = scene.camera_list
+    listed = []
+    for item in camera_list:
+        camera_obj = list_item_camera(item)
+        listed.append(camera_obj.as_pointer() if camera_obj is not None else None)
+    missing, new_indices = list_sync_plan(listed, [obj.as_pointer() for obj in cameras])
+    new_cameras = [cameras[i] for i in new_indices]
+    if dry_run:
+        return len(new_cameras), len(missing)
+    for index in reversed(missing):
+        camera_list.remove(index)
+    for obj in new_cameras:
+        item = camera_list.add()
+        item.name = obj.name
+        item.camera = obj
+    if missing or new_cameras:
+        invalidate_shot_table(scene)
+    return len(new_cameras), len(missing)
+
+def forget_camera_markers(scene, camera=None):
+    if camera is None:
+        _marker_index.pop(scene.as_pointer(), None)
+    else:
+        _marker_index.get(scene.as_pointer(), {}).pop(camera.as_pointer(), None)
+
+class suspend_marker_sync:
+    def __enter__(self):
+        global _marker_sync_suspended
+        _marker_sync_suspended += 1
+        return self
+
+    def __exit__(self, *exc):
+        global _marker_sync_suspended
+        _marker_sync_suspended -= 1
+        return False
+
+@persistent
+def _clear_marker_index(*args):
+    _marker_index.clear()
+    invalidate_shot_table()
+
+def link_camera_list_items():
+    for scene in bpy.data.scenes:
+        for item in scene.camera_list:
+            if item.camera is None and item.name:
+                camera_obj = bpy.data.objects.get(item.name)
+                if camera_obj is not None and camera_obj.type == 'CAMERA':
+                    item.camera = camera_obj
+
+@persistent
+def _link_camera_list_items_on_load(*args):
+    link_camera_list_items()
+    subscribe_object_renames()
+
+@timed
 def update_camera_list_index(self, context):
     if context.scene.camera_list and context.scene.camera_list_index >= 0:
-        camera_item = context.scene.camera_list[context.scene.camera_list_index]
-        camera_obj = bpy.data.objects.get(camera_item.name)
-        if camera_obj and camera_obj.type == 'CAMERA':
+        camera_obj = list_item_camera(context.scene.camera_list[context.scene.camera_list_index])
+        if camera_obj is not None:
             context.scene.camera = camera_obj
-            for area in context.screen.areas:
+            for area in screen_areas(context):
                 if area.type == 'VIEW_3D':
                     area.spaces[0].region_3d.view_perspective = 'CAMERA'
                     break
@@ -233,19 +586,48 @@ classes = (
     CAMERA_OT_view_selected, 
 )
 
+index_handlers = (
+    bpy.app.handlers.load_post,
+    bpy.app.handlers.undo_post,
+    bpy.app.handlers.redo_post,
+)
+
 def register():
-    for cls in classes:
-        bpy.utils.register_class(cls)
-    bpy.types.Object.camera_range = PointerProperty(type=CameraRangeProperties)
-    bpy.types.Scene.camera_list = CollectionProperty(type=CameraListItem)
-    bpy.types.Scene.camera_list_index = IntProperty(update=update_camera_list_index)
+    register_classes(classes)
+    register_properties(bpy.types.Object, {
+        "camera_range": PointerProperty(type=CameraRangeProperties),
+    })
+    register_properties(bpy.types.Scene, {
+        "camera_list": CollectionProperty(type=CameraListItem),
+        "camera_list_index": IntProperty(update=update_camera_list_index),
+        "use_shot_switching": BoolProperty(
+            name="Auto Switch Cameras",
+            description="Make the camera whose range covers the current frame the active scene camera",
+            default=False,
+            update=update_shot_switching
+        ),
+    })
+    for handlers in index_handlers:
+        add_handler(handlers, _clear_marker_index)
+    add_handler(bpy.app.handlers.frame_change_pre, switch_camera_for_frame)
+    add_handler(bpy.app.handlers.load_post, _link_camera_list_items_on_load)
+    # bpy.data is restricted while the addon registers, so upgrade any
+    # name-only items of the open file once registration is done.
+    if not bpy.app.timers.is_registered(link_camera_list_items):
+        bpy.app.timers.register(link_camera_list_items, first_interval=0.0)
+    subscribe_object_renames()
 
 def unregister():
-    for cls in reversed(classes):
-        bpy.utils.unregister_class(cls)
-    del bpy.types.Object.camera_range
-    del bpy.types.Scene.camera_list
-    del bpy.types.Scene.camera_list_index
+    bpy.msgbus.clear_by_owner(_msgbus_owner)
+    remove_handler(bpy.app.handlers.load_post, _link_camera_list_items_on_load)
+    remove_handler(bpy.app.handlers.frame_change_pre, switch_camera_for_frame)
+    for handlers in index_handlers:
+        remove_handler(handlers, _clear_marker_index)
+    _marker_index.clear()
+    invalidate_shot_table()
+    unregister_properties(bpy.types.Scene, ("camera_list", "camera_list_index", "use_shot_switching"))
+    unregister_properties(bpy.types.Object, ("camera_range",))
+    unregister_classes(classes)
 
 if __name__ == "__main__":
     register()
\ No newline at end of file
@@ -1,6 +1,9 @@
 import bpy
 from bpy.types import Operator
 
+from ..profiling import logger, timed
+from ..registration import register_classes, unregister_classes
+
 class CINEMATOGRAPHY_OT_set_cinema_resolution(Operator):
     bl_idname = "cinematography.set_cinema_resolution"
     bl_label = "Set Cinema Resolution"
@@ -9,39 +12,19 @@ class CINEMATOGRAPHY_OT_set_cinema_resolution(Operator):
 
     format: bpy.props.StringProperty()
 
+    @timed
     def execute(self, context):
-        print(f"Setting cinema format to: {self.format}") 
+        logger.debug("Setting cinema format to: %s", self.format)
         context.scene.cinema_format = self.format
         return {'FINISHED'}
 
-class CINEMATOGRAPHY_OT_set_camera_type(Operator):
-    bl_idname = "cinematography.set_camera_type"
-    bl_label = "Set Camera Type"
-    bl_description = "Set the camera type to perspective or orthographic"
-    bl_options = {'REGISTER', 'UNDO'}
-
-    camera_type: bpy.props.StringProperty()
-
-    def execute(self, context):
-        camera = context.scene.camera
-        if camera and camera.type == 'CAMERA':
-            if self.camera_type == 'PERSP':
-                camera.data.type = 'PERSP'
-            elif self.camera_type == 'ORTHO':
-                camera.data.type = 'ORTHO'
-        return {'FINISHED'}
-
-classes = (CINEMATOGRAPHY_OT_set_cinema_resolution, CINEMATOGRAPHY_OT_set_camera_type)
+classes = (CINEMATOGRAPHY_OT_set_cinema_resolution,)
 
 def register():
-    print("Registering cinema_formats classes")  
-    for cls in classes:
-        bpy.utils.register_class(cls)
+    register_classes(classes)
 
 def unregister():
-    print("Unregistering cinema_formats classes") 
-    for cls in reversed(classes):
-        bpy.utils.unregister_class(cls)
+    unregister_classes(classes)
 
 if __name__ == "__main__":
     register()
\ No newline at end of file
@@ -1,6 +1,15 @@
 import bpy
 from mathutils import Vector
 
+from ..core.lens import CAMERA_TYPES, changed_settings, focal_length_settings, new_camera_settings
+from ..profiling import timed
+from ..registration import register_classes, register_properties, unregister_classes, unregister_properties
+
+def apply_camera_settings(camera_data, settings):
+    current = {name: getattr(camera_data, name) for name in settings}
+    for name, value in changed_settings(current, settings).items():
+        setattr(camera_data, name, value)
+
 def create_camera_from_view(length):
     for area in bpy.context.screen.areas:
         if area.type == 'VIEW_3D':
@@ -16,12 +25,7 @@ def create_camera_from_view(length):
     
     cam_obj.matrix_world = view3d.region_3d.view_matrix.inverted()
     
-    cam_obj.data.type = bpy.context.scene.camera_type
-    
-    if cam_obj.data.type == 'PERSP':
-        cam_obj.data.lens = length
-    else:
-        cam_obj.data.ortho_scale = 6.0  
+    apply_camera_settings(cam_obj.data, new_camera_settings(bpy.context.scene.camera_type, length))
     
     return cam_obj
 
@@ -30,11 +34,7 @@ def set_focal_length(length):
     if not camera or camera.type != 'CAMERA':
         camera = create_camera_from_view(length)
     else:
-        if camera.data.type == 'PERSP':
-            camera.data.lens = length
-        else:
-            camera.data.type = 'PERSP'
-            camera.data.lens = length
+        apply_camera_settings(camera.data, focal_length_settings(length))
     
     for area in bpy.context.screen.areas:
         if area.type == 'VIEW_3D':
@@ -48,28 +48,35 @@ class CINEMATOGRAPHY_OT_set_focal_length(bpy.types.Operator):
 
     length: bpy.props.FloatProperty(name="Focal Length")
 
+    @timed
     def execute(self, context):
         set_focal_length(self.length)
         return {'FINISHED'}
 
+@timed
+def update_camera_type(self, context):
+    camera = context.scene.camera
+    if camera and camera.type == 'CAMERA' and camera.data.type != self.camera_type:
+        camera.data.type = self.camera_type
+
 class CINEMATOGRAPHY_OT_set_camera_type(bpy.types.Operator):
     bl_idname = "cinematography.set_camera_type"
     bl_label = "Set Camera Type"
+    bl_description = "Set the camera type to perspective or orthographic"
     bl_options = {'REGISTER', 'UNDO'}
 
     camera_type: bpy.props.EnumProperty(
-        items=[
-            ('PERSP', "Perspective", "Perspective camera"),
-            ('ORTHO', "Orthographic", "Orthographic camera")
-        ],
+        items=CAMERA_TYPES,
         name="Camera Type"
     )
 
+    @timed
     def execute(self, context):
-        camera = context.scene.camera
-        if camera and camera.type == 'CAMERA':
-            camera.data.type = self.camera_type
-        context.scene.camera_type = self.camera_type
+        scene = context.scene
+        if scene.camera_type != self.camera_type:
+            scene.camera_type = self.camera_type
+        else:
+            update_camera_type(scene, context)
         return {'FINISHED'}
 
 classes = (
@@ -78,31 +85,16 @@ classes = (
 )
 
 def register():
-    for cls in classes:
-        try:
-            bpy.utils.register_class(cls)
-        except Exception as e:
-            print(f"Error registering {cls.__name__}: {str(e)}")
-
-def unregister():
-    for cls in reversed(classes):
-        try:
-            bpy.utils.unregister_class(cls)
-        except Exception as e:
-            print(f"Error unregistering {cls.__name__}: {str(e)}")
-
-def register_properties():
-    if not hasattr(bpy.types.Scene, "camera_type"):
-        bpy.types.Scene.camera_type = bpy.props.EnumProperty(
-            items=[
-                ('PERSP', "Perspective", "Perspective camera"),
-                ('ORTHO', "Orthographic", "Orthographic camera")
-            ],
+    register_classes(classes)
+    register_properties(bpy.types.Scene, {
+        "camera_type": bpy.props.EnumProperty(
+            items=CAMERA_TYPES,
             name="Camera Type",
             default='PERSP',
-            update=lambda self, context: bpy.ops.cinematography.set_camera_type(camera_type=self.camera_type)
-        )
+            update=update_camera_type
+        ),
+    })
 
-def unregister_properties():
-    if hasattr(bpy.types.Scene, "camera_type"):
-        del bpy.types.Scene.camera_type
\ No newline at end of file
+def unregister():
+    unregister_properties(bpy.types.Scene, ("camera_type",))
+    unregister_classes(classes)
@@ -0,0 +1,140 @@
+import time
+
+import bpy
+import numpy as np
+
+from .camera_manager import list_item_camera
+from .focal_lengths import apply_camera_settings
+from ..core.framing import CameraFrame, FrameExtent, framing_settings, transform_points, view_matrix
+from ..profiling import timed
+from ..registration import register_classes, unregister_classes
+
+# Object types with geometry that to_mesh() can evaluate
+GEOMETRY_TYPES = {'MESH', 'CURVE', 'SURFACE', 'FONT', 'META'}
+BOUNDED_TYPES = GEOMETRY_TYPES | {'CURVES', 'POINTCLOUD', 'VOLUME', 'GPENCIL', 'GREASEPENCIL', 'ARMATURE', 'LATTICE'}
+
+def camera_frame(scene, camera_data):
+    render = scene.render
+    aspect = (render.resolution_x * render.pixel_aspect_x) / (render.resolution_y * render.pixel_aspect_y)
+    return CameraFrame(
+        camera_data.type,
+        camera_data.lens,
+        camera_data.ortho_scale,
+        camera_data.sensor_width,
+        camera_data.sensor_height,
+        camera_data.sensor_fit,
+        aspect,
+        camera_data.shift_x,
+        camera_data.shift_y,
+        camera_data.clip_start,
+        camera_data.clip_end,
+    )
+
+def object_points(obj, depsgraph, use_vertices=False):
+    # (local points, world matrix) of the evaluated object: its vertices,
+    # the 8 bounding box corners, or its origin for objects without bounds
+    obj_eval = obj.evaluated_get(depsgraph)
+    matrix = np.array(obj_eval.matrix_world, dtype=np.float64)
+    if use_vertices and obj.type in GEOMETRY_TYPES:
+        mesh = obj_eval.to_mesh()
+        try:
+            coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+            mesh.vertices.foreach_get("co", coords)
+        finally:
+            obj_eval.to_mesh_clear()
+        if len(coords):
+            return coords.reshape(-1, 3), matrix
+    if obj.type in BOUNDED_TYPES:
+        return np.array(obj_eval.bound_box, dtype=np.float64), matrix
+    return np.zeros((1, 3)), matrix
+
+def frame_extent(camera_obj, point_sets):
+    extent = FrameExtent()
+    camera_matrix = np.array(camera_obj.matrix_world, dtype=np.float64)
+    for points, matrix in point_sets:
+        extent.add(transform_points(points, view_matrix(camera_matrix, matrix)))
+    return extent
+
+def frame_cameras(scene, cameras, point_sets, margin=0.0, fit_clipping=True):
+    # Fits every camera to the same objects; returns (framed, points behind a camera)
+    framed = behind = 0
+    for camera_obj in cameras:
+        extent = frame_extent(camera_obj, point_sets)
+        behind += extent.behind
+        settings = framing_settings(extent, camera_frame(scene, camera_obj.data), margin, fit_clipping)
+        if settings:
+            apply_camera_settings(camera_obj.data, settings)
+            framed += 1
+    return framed, behind
+
+class CINEMATOGRAPHY_OT_frame_selection(bpy.types.Operator):
+    bl_idname = "cinematography.frame_selection"
+    bl_label = "Frame Selection"
+    bl_description = "Fit the lens or orthographic scale and the clipping range of the camera to the selected objects"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    margin: bpy.props.FloatProperty(
+        name="Margin",
+        description="Extra space around the objects, as a fraction of the frame",
+        default=0.05,
+        min=0.0,
+        max=1.0,
+        subtype='FACTOR'
+    )
+    use_vertices: bpy.props.BoolProperty(
+        name="Use Vertices",
+        description="Fit the evaluated vertices instead of the bounding boxes, tighter but slower on dense meshes",
+        default=False
+    )
+    fit_clipping: bpy.props.BoolProperty(
+        name="Fit Clipping",
+        description="Set clip start and end tightly around the objects",
+        default=True
+    )
+    all_cameras: bpy.props.BoolProperty(
+        name="All Cameras",
+        description="Frame every camera in the camera list instead of the scene camera",
+        default=False
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return bool(context.selected_objects)
+
+    @timed
+    def execute(self, context):
+        scene = context.scene
+        started = time.perf_counter()
+        objects = [obj for obj in context.selected_objects if obj.type != 'CAMERA']
+        if not objects:
+            self.report({'WARNING'}, "Select the objects to frame")
+            return {'CANCELLED'}
+        if self.all_cameras:
+            cameras = [camera_obj for camera_obj in map(list_item_camera, scene.camera_list) if camera_obj is not None]
+        else:
+            cameras = [scene.camera] if scene.camera is not None and scene.camera.type == 'CAMERA' else []
+        if not cameras:
+            self.report({'WARNING'}, "No camera to frame")
+            return {'CANCELLED'}
+
+        # Read every object once and reuse it for all cameras
+        depsgraph = context.evaluated_depsgraph_get()
+        point_sets = [object_points(obj, depsgraph, self.use_vertices) for obj in objects]
+        framed, behind = frame_cameras(scene, cameras, point_sets, self.margin, self.fit_clipping)
+
+        elapsed = (time.perf_counter() - started) * 1000.0
+        points = sum(len(points) for points, _matrix in point_sets)
+        self.report({'WARNING'} if behind else {'INFO'}, (
+            f"Framed {len(objects)} objects ({points} points) in {framed} of {len(cameras)} cameras"
+            + (f", {behind} points behind a camera ignored" if behind else "")
+            + f" ({elapsed:.1f} ms)"
+        ))
+        return {'FINISHED'}
+
+classes = (CINEMATOGRAPHY_OT_frame_selection,)
+
+def register():
+    register_classes(classes)
+
+def unregister():
+    unregister_classes(classes)
@@ -0,0 +1,138 @@
+import glob
+import json
+import os
+import zlib
+
+import bpy
+
+from ..core.resolution import orient, print_pixels
+from ..profiling import logger
+
+BUILTIN_PRESETS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "builtin_presets.json")
+ORIENTATIONS = ('HORIZONTAL', 'VERTICAL')
+DEFAULT_FRAME_RATE = 24
+# Enum numbers of user presets start above any built-in position
+USER_ENUM_BASE = 1 << 16
+
+_registry = None
+
+class PresetRegistry:
+    # Cinema and print presets merged from the built-in file and the user's
+    # preset files, with everything the UI and update callbacks need
+    # precomputed. Later files override presets with the same id.
+    def __init__(self):
+        self.cinema_formats = {}
+        self.print_formats = {}
+        # id -> position in the built-in file
+        self.builtin_cinema = {}
+        self.builtin_print = {}
+        self.errors = []
+        self.cinema_items = []
+        self.print_items = []
+        self.cinema_sizes = {}
+        self.frame_rates = {}
+        self._print_sizes = {}
+
+    def load_file(self, path, builtin=False):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            cinema = {}
+            for preset in data.get("cinema", []):
+                width, height = int(preset["width"]), int(preset["height"])
+                fps = preset.get("fps", DEFAULT_FRAME_RATE)
+                if width <= 0 or height <= 0 or not fps > 0:
+                    self.errors.append((path, f"cinema preset {preset['id']} needs a positive size and frame rate"))
+                    continue
+                cinema[preset["id"]] = (preset.get("name", preset["id"]), width, height, fps)
+            prints = {}
+            for preset in data.get("print", []):
+                width_mm, height_mm = float(preset["width_mm"]), float(preset["height_mm"])
+                if not (width_mm > 0.0 and height_mm > 0.0):
+                    self.errors.append((path, f"print preset {preset['id']} needs a positive size"))
+                    continue
+                prints[preset["id"]] = (preset.get("name", preset["id"]), width_mm, height_mm)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            self.errors.append((path, str(e)))
+            return
+        self.cinema_formats.update(cinema)
+        self.print_formats.update(prints)
+        if builtin:
+            self.builtin_cinema = {identifier: i for i, identifier in enumerate(cinema)}
+            self.builtin_print = {identifier: i for i, identifier in enumerate(prints)}
+
+    def build(self):
+        numbers = enum_numbers(self.cinema_formats, self.builtin_cinema)
+        self.cinema_items = [
+            (identifier, name, f"{width}x{height}, {fps} fps", numbers[identifier])
+            for identifier, (name, width, height, fps) in self.cinema_formats.items()
+        ]
+        numbers = enum_numbers(self.print_formats, self.builtin_print)
+        self.print_items = [
+            (identifier, name, f"{width_mm:g}x{height_mm:g}mm", numbers[identifier])
+            for identifier, (name, width_mm, height_mm) in self.print_formats.items()
+        ]
+        self.cinema_sizes = {
+            orientation: {
+                identifier: orient(width, height, orientation)
+                for identifier, (_name, width, height, _fps) in self.cinema_formats.items()
+            }
+            for orientation in ORIENTATIONS
+        }
+        self.frame_rates = {identifier: preset[3] for identifier, preset in self.cinema_formats.items()}
+        self._print_sizes = {}
+        return self
+
+    def print_sizes(self, dpi, orientation):
+        # {id: (width, height)} in pixels, computed once per DPI/orientation
+        key = (dpi, orientation)
+        sizes = self._print_sizes.get(key)
+        if sizes is None:
+            sizes = self._print_sizes[key] = {
+                identifier: print_pixels(width_mm, height_mm, dpi, orientation)
+                for identifier, (_name, width_mm, height_mm) in self.print_formats.items()
+            }
+        return sizes
+
+def enum_numbers(identifiers, builtin):
+    # Blender saves an enum property by number. Built-in presets keep their
+    # position in the built-in file, the number files saved with earlier
+    # versions hold; user presets get one derived from their id, so adding or
+    # removing a preset file never renumbers another preset.
+    numbers = {identifier: builtin[identifier] for identifier in identifiers if identifier in builtin}
+    used = set(numbers.values())
+    for identifier in sorted(identifier for identifier in identifiers if identifier not in builtin):
+        number = USER_ENUM_BASE + zlib.crc32(identifier.encode("utf-8")) % (1 << 30)
+        while number in used:
+            number += 1
+        numbers[identifier] = number
+        used.add(number)
+    return numbers
+
+def user_preset_dirs():
+    dirs = []
+    package = __package__.rpartition(".")[0]
+    try:
+        dirs.append(bpy.utils.extension_path_user(package, path="presets"))
+    except (ValueError, AttributeError):
+        # Installed as a legacy add-on rather than an extension
+        pass
+    dirs.append(bpy.utils.user_resource('CONFIG', path=os.path.join("sciblend_compositor", "presets")))
+    return dirs
+
+def load_presets(extra_dirs=()):
+    global _registry
+    registry = PresetRegistry()
+    registry.load_file(BUILTIN_PRESETS, builtin=True)
+    for directory in list(user_preset_dirs()) + list(extra_dirs):
+        for path in sorted(glob.glob(os.path.join(directory, "*.json"))):
+            registry.load_file(path)
+    _registry = registry.build()
+    for path, error in registry.errors:
+        logger.warning("Preset file %s skipped: %s", path, error)
+    return _registry
+
+def registry():
+    if _registry is None:
+        return load_presets()
+    return _registry
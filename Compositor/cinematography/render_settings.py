@@ -1,101 +1,131 @@
 import bpy
 
+from . import presets
+from ..core.resolution import link_resolution
+from ..profiling import logger, timed
+from ..registration import register_classes, register_properties, unregister_classes, unregister_properties
+
+# scene pointer -> ResolutionTransaction open on that scene
+_transactions = {}
+
+class ResolutionTransaction:
+    # Collects the resolution and frame rate changes of one user action.
+    # Update callbacks fired while it is open only record what changed; the
+    # outermost transaction links X/Y and writes render.resolution_* and
+    # render.fps once when it closes.
+    def __init__(self, scene):
+        self.scene = scene
+        self.depth = 0
+        self.touched = []
+        self.fps = None
+        self.committing = False
+
+    def touch(self, axis):
+        if not self.committing and axis not in self.touched:
+            self.touched.append(axis)
+
+    def set_fps(self, fps):
+        if not self.committing:
+            self.fps = fps
+
+    def __enter__(self):
+        self.depth += 1
+        return self
+
+    def __exit__(self, *exc):
+        self.depth -= 1
+        # Callbacks fired by commit() itself re-enter with committing set
+        if self.depth == 0 and not self.committing:
+            self.committing = True
+            try:
+                if exc[0] is None:
+                    self.commit()
+            finally:
+                _transactions.pop(self.scene.as_pointer(), None)
+        return False
+
+    def commit(self):
+        scene = self.scene
+        x, y, aspect_ratio, last_updated = link_resolution(
+            scene.custom_resolution_x, scene.custom_resolution_y, scene.aspect_ratio,
+            self.touched, scene.last_updated, scene.resolution_linked,
+        )
+        if scene.last_updated != last_updated:
+            scene.last_updated = last_updated
+        if scene.aspect_ratio != aspect_ratio:
+            scene.aspect_ratio = aspect_ratio
+        if scene.custom_resolution_x != x:
+            scene.custom_resolution_x = x
+        if scene.custom_resolution_y != y:
+            scene.custom_resolution_y = y
+
+        render = scene.render
+        if render.resolution_x != scene.custom_resolution_x:
+            render.resolution_x = scene.custom_resolution_x
+        if render.resolution_y != scene.custom_resolution_y:
+            render.resolution_y = scene.custom_resolution_y
+        if self.fps is not None and render.fps != self.fps:
+            render.fps = self.fps
+
+def resolution_transaction(scene):
+    key = scene.as_pointer()
+    transaction = _transactions.get(key)
+    if transaction is None:
+        transaction = _transactions[key] = ResolutionTransaction(scene)
+    return transaction
+
+@timed
 def update_resolution(self, context):
-    format = context.scene.cinema_format
-    print(f"Selected cinema format: {format}") 
-    orientation = context.scene.resolution_orientation
-    resolutions = {
-        '2K_DCI': (2048, 1080),
-        '4K_DCI': (4096, 2160),
-        '8K_DCI': (8192, 4320),
-        'HD': (1280, 720),
-        'FULL_HD': (1920, 1080),
-        '2K': (2048, 1152),
-        '4K_UHD': (3840, 2160),
-        '8K_UHD': (7680, 4320),
-        'ACADEMY_2_39_1': (2048, 858),
-        'CINEMASCOPE': (2048, 858),
-        'IMAX': (4096, 3072),
-    }
-    frame_rates = {
-        '2K_DCI': 24,
-        '4K_DCI': 24,
-        '8K_DCI': 24,
-        'HD': 30,
-        'FULL_HD': 30,
-        '2K': 24,
-        '4K_UHD': 30,
-        '8K_UHD': 30,
-        'ACADEMY_2_39_1': 24,
-        'CINEMASCOPE': 24,
-        'IMAX': 24,
-    }
-    if format in resolutions:
-        width, height = resolutions[format]
-        print(f"Resolution for {format}: {width}x{height}")  
-        if orientation == 'VERTICAL' and width > height:
-            width, height = height, width
-        context.scene.custom_resolution_x = width
-        context.scene.custom_resolution_y = height
-        new_frame_rate = frame_rates.get(format, 24)
-        context.scene.frame_rate = new_frame_rate
-        context.scene.render.fps = new_frame_rate  
-        print(f"Frame rate set to: {new_frame_rate}")  
-    else:
-        print(f"Unknown format: {format}") 
-    update_linked_resolution(context.scene)
+    scene = context.scene
+    format = scene.cinema_format
+    orientation = scene.resolution_orientation
+    registry = presets.registry()
+    size = registry.cinema_sizes[orientation].get(format)
+    with resolution_transaction(scene):
+        if size is not None:
+            width, height = size
+            scene.custom_resolution_x = width
+            scene.custom_resolution_y = height
+            new_frame_rate = registry.frame_rates[format]
+            scene.frame_rate = new_frame_rate
+            logger.debug("Cinema format %s: %dx%d at %s fps", format, width, height, new_frame_rate)
+        else:
+            logger.warning("Unknown cinema format: %s", format)
 
+@timed
 def update_print_resolution(self, context):
-    print_format = context.scene.print_format
-    print(f"Selected print format: {print_format}") 
-    dpi = context.scene.print_dpi
-    orientation = context.scene.resolution_orientation
-    print_sizes = {
-        'A4': (210, 297),
-        'A3': (297, 420),
-        'A2': (420, 594),
-        'A1': (594, 841),
-        'A0': (841, 1189),
-        'LETTER': (216, 279),
-        'LEGAL': (216, 356),
-        'TABLOID': (279, 432),
-    }
-    if print_format in print_sizes:
-        width_mm, height_mm = print_sizes[print_format]
-        if orientation == 'VERTICAL' and width_mm > height_mm:
-            width_mm, height_mm = height_mm, width_mm
-        width_inches = width_mm / 25.4
-        height_inches = height_mm / 25.4
-        width_pixels = int(width_inches * dpi)
-        height_pixels = int(height_inches * dpi)
-        print(f"Resolution for {print_format}: {width_pixels}x{height_pixels}") 
-        context.scene.custom_resolution_x = width_pixels
-        context.scene.custom_resolution_y = height_pixels
-    else:
-        print(f"Unknown print format: {print_format}") 
-    update_linked_resolution(context.scene)
+    scene = context.scene
+    print_format = scene.print_format
+    dpi = scene.print_dpi
+    orientation = scene.resolution_orientation
+    size = presets.registry().print_sizes(dpi, orientation).get(print_format)
+    with resolution_transaction(scene):
+        if size is not None:
+            width_pixels, height_pixels = size
+            logger.debug("Print format %s at %d DPI: %dx%d", print_format, dpi, width_pixels, height_pixels)
+            scene.custom_resolution_x = width_pixels
+            scene.custom_resolution_y = height_pixels
+        else:
+            logger.warning("Unknown print format: %s", print_format)
 
 def update_linked_resolution(scene):
-    if scene.resolution_linked:
-        if scene.last_updated == 'X':
-            scene.custom_resolution_y = int(scene.custom_resolution_x / scene.aspect_ratio)
-        else:
-            scene.custom_resolution_x = int(scene.custom_resolution_y * scene.aspect_ratio)
-    
-    scene.render.resolution_x = scene.custom_resolution_x
-    scene.render.resolution_y = scene.custom_resolution_y
+    with resolution_transaction(scene):
+        pass
 
+@timed
 def update_resolution_x(self, context):
-    context.scene.last_updated = 'X'
-    update_linked_resolution(context.scene)
+    with resolution_transaction(context.scene) as transaction:
+        transaction.touch('X')
 
+@timed
 def update_resolution_y(self, context):
-    context.scene.last_updated = 'Y'
-    update_linked_resolution(context.scene)
+    with resolution_transaction(context.scene) as transaction:
+        transaction.touch('Y')
 
+@timed
 def update_frame_rate(self, context):
-    context.scene.render.fps = int(context.scene.frame_rate)
-    print(f"Frame rate updated to: {context.scene.render.fps}") 
+    with resolution_transaction(context.scene) as transaction:
+        transaction.set_fps(int(context.scene.frame_rate))
 
 class CINEMATOGRAPHY_OT_set_render_resolution(bpy.types.Operator):
     bl_idname = "cinematography.set_render_resolution"
@@ -105,10 +135,11 @@ class CINEMATOGRAPHY_OT_set_render_resolution(bpy.types.Operator):
     resolution_x: bpy.props.IntProperty(name="X Resolution")
     resolution_y: bpy.props.IntProperty(name="Y Resolution")
 
+    @timed
     def execute(self, context):
-        context.scene.custom_resolution_x = self.resolution_x
-        context.scene.custom_resolution_y = self.resolution_y
-        update_linked_resolution(context.scene)
+        with resolution_transaction(context.scene):
+            context.scene.custom_resolution_x = self.resolution_x
+            context.scene.custom_resolution_y = self.resolution_y
         return {'FINISHED'}
 
 class CINEMATOGRAPHY_OT_set_print_resolution(bpy.types.Operator):
@@ -118,9 +149,11 @@ class CINEMATOGRAPHY_OT_set_print_resolution(bpy.types.Operator):
 
     format: bpy.props.StringProperty()
 
+    @timed
     def execute(self, context):
-        context.scene.print_format = self.format
-        update_print_resolution(self, context)
+        with resolution_transaction(context.scene):
+            context.scene.print_format = self.format
+            update_print_resolution(self, context)
         return {'FINISHED'}
 
 class CINEMATOGRAPHY_OT_toggle_resolution_link(bpy.types.Operator):
@@ -128,6 +161,7 @@ class CINEMATOGRAPHY_OT_toggle_resolution_link(bpy.types.Operator):
     bl_label = "Toggle Resolution Link"
     bl_options = {'REGISTER', 'UNDO'}
 
+    @timed
     def execute(self, context):
         context.scene.resolution_linked = not context.scene.resolution_linked
         if context.scene.resolution_linked:
@@ -142,125 +176,91 @@ classes = (
 )
 
 def register():
-    print("Registering render_settings properties")  # Log
-    bpy.types.Scene.cinema_format = bpy.props.EnumProperty(
-        items=[
-            ('2K_DCI', "2K DCI", "2048x1080"),
-            ('4K_DCI', "4K DCI", "4096x2160"),
-            ('8K_DCI', "8K DCI", "8192x4320"),
-            ('HD', "HD", "1280x720"),
-            ('FULL_HD', "Full HD", "1920x1080"),
-            ('2K', "2K", "2048x1152"),
-            ('4K_UHD', "4K UHD", "3840x2160"),
-            ('8K_UHD', "8K UHD", "7680x4320"),
-            ('ACADEMY_2_39_1', "Academy 2.39:1", "2048x858"),
-            ('CINEMASCOPE', "Cinemascope", "2048x858"),
-            ('IMAX', "IMAX", "4096x3072"),
-        ],
-        name="Cinema Format",
-        default='FULL_HD',
-        update=update_resolution
-    )
-    bpy.types.Scene.resolution_orientation = bpy.props.EnumProperty(
-        items=[
-            ('HORIZONTAL', "Horizontal", "Horizontal orientation"),
-            ('VERTICAL', "Vertical", "Vertical orientation"),
-        ],
-        name="Resolution Orientation",
-        default='HORIZONTAL',
-        update=update_resolution
-    )
-    bpy.types.Scene.frame_rate = bpy.props.FloatProperty(
-        name="Frame Rate",
-        default=24.0,
-        min=1.0,
-        max=120.0,
-        precision=3,
-        step=100,
-        update=update_frame_rate 
-    )
-    for cls in classes:
-        try:
-            bpy.utils.register_class(cls)
-        except Exception as e:
-            print(f"Error registering {cls.__name__}: {str(e)}")
-    register_properties()
+    registry = presets.load_presets()
+    register_properties(bpy.types.Scene, {
+        "cinema_format": bpy.props.EnumProperty(
+            items=registry.cinema_items,
+            name="Cinema Format",
+            default='FULL_HD',
+            update=update_resolution
+        ),
+        "resolution_orientation": bpy.props.EnumProperty(
+            items=[
+                ('HORIZONTAL', "Horizontal", "Horizontal orientation"),
+                ('VERTICAL', "Vertical", "Vertical orientation"),
+            ],
+            name="Resolution Orientation",
+            default='HORIZONTAL',
+            update=update_resolution
+        ),
+        "frame_rate": bpy.props.FloatProperty(
+            name="Frame Rate",
+            default=24.0,
+            min=1.0,
+            max=120.0,
+            precision=3,
+            step=100,
+            update=update_frame_rate
+        ),
+        "print_dpi": bpy.props.IntProperty(
+            name="Print DPI",
+            description="DPI for print resolutions",
+            default=300,
+            min=72,
+            max=1200,
+            update=update_print_resolution
+        ),
+        "print_format": bpy.props.EnumProperty(
+            items=registry.print_items,
+            name="Print Format",
+            default='A4',
+            update=update_print_resolution
+        ),
+        "resolution_linked": bpy.props.BoolProperty(
+            name="Link Resolution",
+            description="Link X and Y resolutions",
+            default=False
+        ),
+        "aspect_ratio": bpy.props.FloatProperty(
+            name="Aspect Ratio",
+            description="Aspect ratio of the resolution",
+            default=1.0
+        ),
+        "last_updated": bpy.props.StringProperty(
+            name="Last Updated",
+            description="Which resolution was last updated",
+            default='Y'
+        ),
+        "custom_resolution_x": bpy.props.IntProperty(
+            name="X",
+            description="Number of horizontal pixels in the rendered image",
+            default=1920,
+            min=4,
+            max=65536,
+            update=update_resolution_x
+        ),
+        "custom_resolution_y": bpy.props.IntProperty(
+            name="Y",
+            description="Number of vertical pixels in the rendered image",
+            default=1080,
+            min=4,
+            max=65536,
+            update=update_resolution_y
+        ),
+    })
+    register_classes(classes)
 
 def unregister():
-    del bpy.types.Scene.cinema_format
-    del bpy.types.Scene.resolution_orientation
-    del bpy.types.Scene.frame_rate
-    for cls in reversed(classes):
-        try:
-            bpy.utils.unregister_class(cls)
-        except Exception as e:
-            print(f"Error unregistering {cls.__name__}: {str(e)}")
-    unregister_properties()
-
-def register_properties():
-    bpy.types.Scene.print_dpi = bpy.props.IntProperty(
-        name="Print DPI",
-        description="DPI for print resolutions",
-        default=300,
-        min=72,
-        max=1200,
-        update=update_print_resolution  
-    )
-    bpy.types.Scene.print_format = bpy.props.EnumProperty(
-        items=[
-            ('A4', "A4", "210x297mm"),
-            ('A3', "A3", "297x420mm"),
-            ('A2', "A2", "420x594mm"),
-            ('A1', "A1", "594x841mm"),
-            ('A0', "A0", "841x1189mm"),
-            ('LETTER', "Letter", "216x279mm"),
-            ('LEGAL', "Legal", "216x356mm"),
-            ('TABLOID', "Tabloid", "279x432mm"),
-        ],
-        name="Print Format",
-        default='A4',
-        update=update_print_resolution
-    )
-    bpy.types.Scene.resolution_linked = bpy.props.BoolProperty(
-        name="Link Resolution",
-        description="Link X and Y resolutions",
-        default=False
-    )
-    bpy.types.Scene.aspect_ratio = bpy.props.FloatProperty(
-        name="Aspect Ratio",
-        description="Aspect ratio of the resolution",
-        default=1.0
-    )
-    bpy.types.Scene.last_updated = bpy.props.StringProperty(
-        name="Last Updated",
-        description="Which resolution was last updated",
-        default='Y'
-    )
-    bpy.types.Scene.custom_resolution_x = bpy.props.IntProperty(
-        name="X",
-        description="Number of horizontal pixels in the rendered image",
-        default=1920,
-        min=4,
-        max=65536,
-        update=update_resolution_x
-    )
-    bpy.types.Scene.custom_resolution_y = bpy.props.IntProperty(
-        name="Y",
-        description="Number of vertical pixels in the rendered image",
-        default=1080,
-        min=4,
-        max=65536,
-        update=update_resolution_y
-    )
-
-def unregister_properties():
-    print("Unregistering render_settings properties") 
-    if hasattr(bpy.types.Scene, "cinema_format"):
-        del bpy.types.Scene.cinema_format
-    del bpy.types.Scene.print_dpi
-    del bpy.types.Scene.print_format
-    del bpy.types.Scene.resolution_linked
-    del bpy.types.Scene.aspect_ratio
-    del bpy.types.Scene.last_updated
-    del bpy.types.Scene.custom_resolution_x
-    del bpy.types.Scene.custom_resolution_y
\ No newline at end of file
+    unregister_classes(classes)
+    unregister_properties(bpy.types.Scene, (
+        "cinema_format",
+        "resolution_orientation",
+        "frame_rate",
+        "print_dpi",
+        "print_format",
+        "resolution_linked",
+        "aspect_ratio",
+        "last_updated",
+        "custom_resolution_x",
+        "custom_resolution_y",
+    ))
@@ -0,0 +1,181 @@
+import time
+
+import bpy
+import numpy as np
+
+from .camera_manager import invalidate_shot_table, shot_arrays, suspend_marker_sync, sync_timeline_markers
+from ..core.rigs import (
+    bezier_polyline,
+    consecutive_ranges,
+    fibonacci_positions,
+    grid_positions,
+    look_at_matrices,
+    orbit_positions,
+    path_positions,
+)
+from ..profiling import timed
+from ..registration import register_classes, unregister_classes
+
+RIG_LAYOUTS = [
+    ('ORBIT', "Orbit", "A ring of cameras around the target"),
+    ('SPLINE', "Spline", "Cameras spread evenly along the active curve"),
+    ('GRID', "Grid", "A grid of cameras above the target, looking straight down"),
+    ('SPHERE', "Fibonacci Sphere", "Cameras spread evenly over a sphere around the target"),
+]
+
+def _foreach_points(collection, attribute, width):
+    values = np.empty(len(collection) * width, dtype=np.float64)
+    collection.foreach_get(attribute, values)
+    return values.reshape(-1, width)
+
+def spline_points(obj, spline):
+    # World space polyline of one spline itself, whatever bevel or extrusion
+    # the curve has. NURBS splines follow their control polygon.
+    if spline.type == 'BEZIER':
+        bezier = spline.bezier_points
+        points = bezier_polyline(
+            _foreach_points(bezier, "co", 3),
+            _foreach_points(bezier, "handle_left", 3),
+            _foreach_points(bezier, "handle_right", 3),
+            spline.resolution_u,
+            spline.use_cyclic_u,
+        )
+    else:
+        points = _foreach_points(spline.points, "co", 4)[:, :3]
+        if spline.use_cyclic_u and len(points) > 1:
+            points = np.vstack((points, points[:1]))
+    matrix = np.array(obj.matrix_world, dtype=np.float64)
+    return points @ matrix[:3, :3].T + matrix[:3, 3]
+
+def next_free_frame(scene):
+    # First frame after every shot already in the list
+    arrays = shot_arrays(scene)
+    if not arrays.valid.any():
+        return scene.frame_start
+    return int(arrays.ends[arrays.valid].max()) + 1
+
+def create_rig_cameras(scene, matrices, starts, ends, name, lens, collection):
+    # One datablock pair per camera through bpy.data; ranges are written with
+    # marker sync suspended and the markers are laid out once afterwards
+    cameras = []
+    with suspend_marker_sync():
+        for index, (matrix, start, end) in enumerate(zip(matrices.tolist(), starts.tolist(), ends.tolist())):
+            camera_name = f"{name}.{index + 1:03d}"
+            camera_data = bpy.data.cameras.new(camera_name)
+            camera_data.lens = lens
+            camera_obj = bpy.data.objects.new(camera_name, camera_data)
+            collection.objects.link(camera_obj)
+            camera_obj.matrix_world = matrix
+            camera_obj.camera_range.start_frame = start
+            camera_obj.camera_range.end_frame = end
+            item = scene.camera_list.add()
+            item.name = camera_obj.name
+            item.camera = camera_obj
+            cameras.append(camera_obj)
+    invalidate_shot_table(scene)
+    sync_timeline_markers(scene)
+    return cameras
+
+class CINEMATOGRAPHY_OT_generate_camera_rig(bpy.types.Operator):
+    bl_idname = "cinematography.generate_camera_rig"
+    bl_label = "Generate Camera Rig"
+    bl_description = "Create many cameras at once on an orbit, spline, grid or sphere, each with its own shot range"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    rig_type: bpy.props.EnumProperty(
+        name="Type",
+        items=RIG_LAYOUTS,
+        default='ORBIT'
+    )
+    count: bpy.props.IntProperty(
+        name="Cameras",
+        default=8,
+        min=1,
+        soft_max=256
+    )
+    radius: bpy.props.FloatProperty(
+        name="Radius",
+        description="Distance from the target, or the spacing between grid cameras",
+        default=10.0,
+        min=0.001,
+        subtype='DISTANCE'
+    )
+    height: bpy.props.FloatProperty(
+        name="Height",
+        description="Height above the target for orbit and grid layouts",
+        default=2.0,
+        subtype='DISTANCE'
+    )
+    follow_path: bpy.props.BoolProperty(
+        name="Follow Path",
+        description="Aim spline cameras along the curve instead of at the target",
+        default=False
+    )
+    lens: bpy.props.FloatProperty(
+        name="Focal Length",
+        default=50.0,
+        min=1.0,
+        subtype='DISTANCE_CAMERA'
+    )
+    frames_per_camera: bpy.props.IntProperty(
+        name="Frames per Camera",
+        description="Length of each camera's consecutive shot range",
+        default=24,
+        min=1
+    )
+    name: bpy.props.StringProperty(
+        name="Name",
+        default="RigCamera"
+    )
+
+    @timed
+    def execute(self, context):
+        scene = context.scene
+        started = time.perf_counter()
+        # The rig is centred on the 3D cursor
+        target = np.array(scene.cursor.location, dtype=np.float64)
+        targets = target
+        if self.rig_type == 'ORBIT':
+            positions = orbit_positions(self.count, target, self.radius, self.height)
+        elif self.rig_type == 'SPHERE':
+            positions = fibonacci_positions(self.count, target, self.radius)
+        elif self.rig_type == 'GRID':
+            positions = grid_positions(self.count, target, self.radius, self.height)
+            targets = positions - (0.0, 0.0, 1.0)
+        else:
+            curve = context.active_object
+            if curve is None or curve.type != 'CURVE':
+                self.report({'WARNING'}, "Select a curve to place the cameras on")
+                return {'CANCELLED'}
+            splines = curve.data.splines
+            if len(splines) != 1:
+                self.report({'WARNING'}, f"Curve '{curve.name}' needs exactly one spline, it has {len(splines)}")
+                return {'CANCELLED'}
+            points = spline_points(curve, splines[0])
+            if not len(points):
+                self.report({'WARNING'}, f"Curve '{curve.name}' has no points")
+                return {'CANCELLED'}
+            positions, tangents = path_positions(self.count, points)
+            if self.follow_path:
+                targets = positions + tangents
+
+        matrices = look_at_matrices(positions, targets)
+        # New shots follow the existing ones instead of overlapping them
+        starts, ends = consecutive_ranges(self.count, next_free_frame(scene), self.frames_per_camera)
+
+        collection = bpy.data.collections.new(self.name)
+        scene.collection.children.link(collection)
+        cameras = create_rig_cameras(scene, matrices, starts, ends, self.name, self.lens, collection)
+        scene.camera_list_index = len(scene.camera_list) - len(cameras)
+
+        elapsed = (time.perf_counter() - started) * 1000.0
+        self.report({'INFO'}, f"Created {len(cameras)} cameras in '{collection.name}' ({elapsed:.1f} ms)")
+        return {'FINISHED'}
+
+classes = (CINEMATOGRAPHY_OT_generate_camera_rig,)
+
+def register():
+    register_classes(classes)
+
+def unregister():
+    unregister_classes(classes)
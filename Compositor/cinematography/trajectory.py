@@ -0,0 +1,160 @@
+import math
+import os
+import time
+
+import bpy
+import numpy as np
+from bpy.props import BoolProperty, EnumProperty, FloatProperty, IntProperty, StringProperty
+from bpy.types import Operator
+from bpy_extras.io_utils import ImportHelper
+
+from .baking import ensure_action, write_fcurve
+from .camera_manager import invalidate_shot_table
+from ..core.baking import LINEAR_INTERPOLATION
+from ..core.trajectory import (
+    DEFAULT_COLUMNS,
+    EULER_COLUMNS,
+    POSITION_COLUMNS,
+    QUATERNION_COLUMNS,
+    continuous_quaternions,
+    rdp_indices,
+    read_trajectory,
+    trajectory_frames,
+)
+from ..profiling import timed
+from ..registration import register_classes, unregister_classes
+
+def trajectory_channels(trajectory, tolerance, angle_tolerance, lens_tolerance):
+    # (owner, data path, index, values, tolerance) for every curve to write,
+    # and the rotation mode they need
+    channels = []
+    positions = trajectory.stack(POSITION_COLUMNS)
+    for index in range(3):
+        channels.append(('OBJECT', "location", index, positions[:, index], tolerance))
+    rotation_mode = None
+    if trajectory.has(QUATERNION_COLUMNS):
+        rotation_mode = 'QUATERNION'
+        quaternions = continuous_quaternions(trajectory.stack(QUATERNION_COLUMNS))
+        # A component error e is a rotation error of about 2e
+        for index in range(4):
+            channels.append(('OBJECT', "rotation_quaternion", index, quaternions[:, index], angle_tolerance / 2.0))
+    elif trajectory.has(EULER_COLUMNS):
+        rotation_mode = 'XYZ'
+        eulers = np.unwrap(trajectory.stack(EULER_COLUMNS), axis=0)
+        for index in range(3):
+            channels.append(('OBJECT', "rotation_euler", index, eulers[:, index], angle_tolerance))
+    if 'lens' in trajectory.columns:
+        channels.append(('DATA', "lens", 0, trajectory.columns['lens'], lens_tolerance))
+    return channels, rotation_mode
+
+def import_trajectory(camera_obj, frames, channels, rotation_mode, decimate=True):
+    # Writes every channel as linear keys; returns the number of keys
+    if rotation_mode is not None:
+        camera_obj.rotation_mode = rotation_mode
+    actions = {
+        'OBJECT': ensure_action(camera_obj, f"{camera_obj.name}Action"),
+        'DATA': ensure_action(camera_obj.data, f"{camera_obj.data.name}Action"),
+    }
+    keys = 0
+    for owner, data_path, index, values, tolerance in channels:
+        keep = rdp_indices(frames, values, tolerance) if decimate else slice(None)
+        keys += write_fcurve(actions[owner], data_path, index, frames[keep], values[keep], LINEAR_INTERPOLATION)
+    return keys
+
+class CINEMATOGRAPHY_OT_import_trajectory(Operator, ImportHelper):
+    bl_idname = "cinematography.import_trajectory"
+    bl_label = "Import Camera Trajectory"
+    bl_description = "Create a camera animated from a .npy or .csv trajectory and add it to the camera list"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    filter_glob: StringProperty(default="*.npy;*.csv;*.txt", options={'HIDDEN'})
+
+    columns: StringProperty(
+        name="Columns",
+        description=(
+            "Column order for files without column names: time, x y z, qw qx qy qz or rx ry rz (radians), lens. "
+            "Any other name skips a column"
+        ),
+        default=DEFAULT_COLUMNS
+    )
+    time_unit: EnumProperty(
+        name="Time",
+        items=[
+            ('FRAMES', "Frames", "The time column holds frame numbers"),
+            ('SECONDS', "Seconds", "The time column holds seconds, converted with the scene frame rate"),
+        ],
+        default='FRAMES'
+    )
+    frame_offset: IntProperty(
+        name="Frame Offset",
+        description="Frames added to every sample; without a time column samples start at the scene start frame",
+        default=0
+    )
+    decimate: BoolProperty(
+        name="Decimate",
+        description="Drop samples that linear interpolation reproduces within the tolerances (Ramer-Douglas-Peucker)",
+        default=True
+    )
+    tolerance: FloatProperty(
+        name="Distance Tolerance",
+        default=0.001,
+        min=0.0,
+        subtype='DISTANCE'
+    )
+    angle_tolerance: FloatProperty(
+        name="Angle Tolerance",
+        default=math.radians(0.05),
+        min=0.0,
+        subtype='ANGLE'
+    )
+    lens_tolerance: FloatProperty(
+        name="Lens Tolerance",
+        default=0.01,
+        min=0.0,
+        subtype='DISTANCE_CAMERA'
+    )
+
+    @timed
+    def execute(self, context):
+        scene = context.scene
+        started = time.perf_counter()
+        try:
+            trajectory = read_trajectory(bpy.path.abspath(self.filepath), self.columns)
+            if not len(trajectory) or not trajectory.has(POSITION_COLUMNS):
+                raise ValueError("the file needs x, y and z columns and at least one sample")
+            fps = scene.render.fps / scene.render.fps_base if self.time_unit == 'SECONDS' else None
+            frames = trajectory_frames(trajectory, fps, scene.frame_start) + self.frame_offset
+        except (OSError, ValueError) as error:
+            self.report({'ERROR'}, f"Could not import {os.path.basename(self.filepath)}: {error}")
+            return {'CANCELLED'}
+
+        channels, rotation_mode = trajectory_channels(
+            trajectory, self.tolerance, self.angle_tolerance, self.lens_tolerance
+        )
+        name = os.path.splitext(os.path.basename(self.filepath))[0] or "Trajectory"
+        camera_obj = bpy.data.objects.new(name, bpy.data.cameras.new(name))
+        context.collection.objects.link(camera_obj)
+        keys = import_trajectory(camera_obj, frames, channels, rotation_mode, self.decimate)
+
+        item = scene.camera_list.add()
+        item.name = camera_obj.name
+        item.camera = camera_obj
+        camera_obj.camera_range.start_frame = math.floor(frames[0])
+        camera_obj.camera_range.end_frame = math.ceil(frames[-1])
+        invalidate_shot_table(scene)
+        scene.camera_list_index = len(scene.camera_list) - 1
+
+        elapsed = (time.perf_counter() - started) * 1000.0
+        self.report({'INFO'}, (
+            f"Imported {len(trajectory)} samples into '{camera_obj.name}' as {keys} keys "
+            f"on {len(channels)} curves ({elapsed:.1f} ms)"
+        ))
+        return {'FINISHED'}
+
+classes = (CINEMATOGRAPHY_OT_import_trajectory,)
+
+def register():
+    register_classes(classes)
+
+def unregister():
+    unregister_classes(classes)
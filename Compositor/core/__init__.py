@@ -0,0 +1,3 @@
+# Shot planning, marker, resolution and lens logic on plain Python data.
+# Nothing in this package imports bpy, so it can be loaded and profiled
+# outside Blender; the bpy adapters live in cinematography/.
@@ -0,0 +1,43 @@
+import numpy as np
+
+# Interpolation enum values of a keyframe point, as written by foreach_set
+CONSTANT_INTERPOLATION = 0
+LINEAR_INTERPOLATION = 1
+
+def matrix_to_euler(matrices):
+    # (N, 4, 4) world matrices -> (locations (N, 3), XYZ eulers (N, 3)),
+    # with scale removed from the rotation part
+    matrices = np.asarray(matrices, dtype=np.float64).reshape(-1, 4, 4)
+    rotation = matrices[:, :3, :3]
+    scale = np.linalg.norm(rotation, axis=1, keepdims=True)
+    rotation = rotation / np.where(scale > 0.0, scale, 1.0)
+    eulers = np.empty((len(matrices), 3))
+    # R = Rz @ Ry @ Rx
+    eulers[:, 1] = np.arcsin(np.clip(-rotation[:, 2, 0], -1.0, 1.0))
+    cos_y = np.hypot(rotation[:, 0, 0], rotation[:, 1, 0])
+    regular = cos_y > 1e-9
+    eulers[:, 0] = np.where(regular, np.arctan2(rotation[:, 2, 1], rotation[:, 2, 2]), np.arctan2(-rotation[:, 1, 2], rotation[:, 1, 1]))
+    eulers[:, 2] = np.where(regular, np.arctan2(rotation[:, 1, 0], rotation[:, 0, 0]), 0.0)
+    return matrices[:, :3, 3].copy(), eulers
+
+def held_keys(frames, values, interpolation=CONSTANT_INTERPOLATION):
+    # (frames, values, interpolation) without the keys the curve already
+    # passes through: a constant key repeating the constant key before it, or
+    # a linear key on a flat linear stretch
+    frames = np.asarray(frames, dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64)
+    interpolation = np.broadcast_to(np.asarray(interpolation, dtype=np.int32), values.shape)
+    redundant = np.zeros(len(values), dtype=bool)
+    redundant[1:] = (values[1:] == values[:-1]) & (interpolation[1:] == interpolation[:-1])
+    flat_after = np.ones(len(values), dtype=bool)
+    flat_after[:-1] = values[1:] == values[:-1]
+    redundant &= (interpolation == CONSTANT_INTERPOLATION) | flat_after
+    keep = ~redundant
+    return frames[keep], values[keep], interpolation[keep]
+
+def keyframe_coords(frames, values):
+    # Interleaved (frame, value) pairs for keyframe_points.foreach_set("co")
+    coords = np.empty((len(frames), 2), dtype=np.float32)
+    coords[:, 0] = frames
+    coords[:, 1] = values
+    return coords.ravel()
@@ -0,0 +1,36 @@
+import numpy as np
+
+from .framing import transform_points, view_matrix
+
+def transform_corners(local, matrices):
+    # (K, 8, 3) local bounding box corners and (K, 4, 4) world matrices ->
+    # (K, 8, 3) world-space corners, in one batched matmul
+    matrices = np.asarray(matrices, dtype=np.float64)
+    return np.matmul(local, matrices[:, :3, :3].transpose(0, 2, 1)) + matrices[:, None, :3, 3]
+
+def box_visibility(corners, camera_matrix_world, frame, margin=0.0):
+    # corners: (K, 8, 3) world-space bounding box corners. A box is culled
+    # only when all its corners lie outside the same frustum plane, so the
+    # test is conservative: boxes near a frustum corner may be kept.
+    corners = np.asarray(corners)
+    count = len(corners)
+    if not count:
+        return np.zeros(0, dtype=bool)
+    if frame.camera_type not in ('PERSP', 'ORTHO'):
+        return np.ones(count, dtype=bool)
+    x, y, z = transform_points(corners.reshape(-1, 3), view_matrix(camera_matrix_world))
+    depth = -z
+    (x_lo, x_hi), (y_lo, y_hi) = frame.view_bounds()
+    pad_x = (x_hi - x_lo) * margin / 2.0
+    pad_y = (y_hi - y_lo) * margin / 2.0
+    # Side planes go through the camera for perspective projections
+    scale = depth if frame.camera_type == 'PERSP' else 1.0
+    outside = np.stack((
+        depth < frame.clip_start,
+        depth > frame.clip_end,
+        x < (x_lo - pad_x) * scale,
+        x > (x_hi + pad_x) * scale,
+        y < (y_lo - pad_y) * scale,
+        y > (y_hi + pad_y) * scale,
+    )).reshape(6, count, 8)
+    return ~outside.all(axis=2).any(axis=0)
@@ -0,0 +1,68 @@
+import numpy as np
+
+def duplicate_sources(rows):
+    # Index of the first row equal to each row of a (frames, inputs) array;
+    # exact comparison, so unrelated frames can never collide
+    rows = np.asarray(rows)
+    if len(rows) == 0:
+        return np.zeros(0, dtype=np.int64)
+    _unique, first, inverse = np.unique(rows, axis=0, return_index=True, return_inverse=True)
+    return first[inverse.ravel()]
+
+def varying_columns(columns):
+    # Drops the inputs that hold one value over every frame
+    return [column for column in columns if len(column) and (column != column[0]).any()]
+
+def frame_runs(frames):
+    # Sorted frame numbers -> contiguous (start, end) runs
+    frames = np.asarray(frames, dtype=np.int64)
+    if not len(frames):
+        return []
+    breaks = np.flatnonzero(np.diff(frames) != 1)
+    starts = np.concatenate(([frames[0]], frames[breaks + 1]))
+    ends = np.concatenate((frames[breaks], [frames[-1]]))
+    return list(zip(starts.tolist(), ends.tolist()))
+
+class FramePlan:
+    # Frames of every shot that render, and the ones that copy an earlier
+    # identical frame of the same shot. shots: [(camera, start, end)];
+    # sources: for every frame of every shot in order, the index of the frame
+    # it copies (its own index when it renders).
+    def __init__(self, shots, sources):
+        self.shots = list(shots)
+        self.renders = {}
+        self.copies = {}
+        sources = np.asarray(sources, dtype=np.int64)
+        offset = 0
+        for camera, start, end in self.shots:
+            count = max(0, end - start + 1)
+            own = sources[offset:offset + count] - offset
+            if ((own < 0) | (own >= count)).any():
+                raise ValueError(f"Frames of {camera} copy frames of another shot")
+            frames = np.arange(start, end + 1)
+            rendered = own == np.arange(count)
+            self.renders[camera] = frames[rendered].tolist()
+            copies = {}
+            for frame, source in zip(frames[~rendered].tolist(), (start + own[~rendered]).tolist()):
+                copies.setdefault(source, []).append(frame)
+            self.copies[camera] = copies
+            offset += count
+
+    def keep_renders(self, camera, frames):
+        # Renders only the given frames of a shot, with their copies
+        frames = set(frames)
+        self.renders[camera] = [frame for frame in self.renders[camera] if frame in frames]
+        self.copies[camera] = {source: targets for source, targets in self.copies[camera].items() if source in frames}
+
+    def render_shots(self):
+        # (camera, start, end) for every run of frames that still renders
+        for camera, _start, _end in self.shots:
+            for start, end in frame_runs(self.renders[camera]):
+                yield camera, start, end
+
+    def saved(self):
+        # {camera: (frames copied, frames in the shot)}
+        return {
+            camera: (sum(map(len, self.copies[camera].values())), max(0, end - start + 1))
+            for camera, start, end in self.shots
+        }
@@ -0,0 +1,54 @@
+import math
+
+def view_extent(width, height, sensor_fit='AUTO'):
+    # Size of a width x height frame in view units, where the fitted
+    # dimension spans 1, as the camera's sensor fit lays it out
+    aspect = width / height
+    if sensor_fit == 'AUTO':
+        sensor_fit = 'HORIZONTAL' if width >= height else 'VERTICAL'
+    if sensor_fit == 'HORIZONTAL':
+        return 1.0, 1.0 / aspect
+    return aspect, 1.0
+
+def master_plan(sizes, sensor_fit='AUTO', overscan=0.0):
+    # One master frame that contains every deliverable frame of the same
+    # camera, at the pixel density of the sharpest one. Returns ((width,
+    # height), [(x, y, width, height) crop of every deliverable]); crops are
+    # centred, so they hold for top-down and bottom-up pixel rows alike.
+    if not sizes:
+        return None, []
+    extents = [view_extent(width, height, sensor_fit) for width, height in sizes]
+    union_x = max(extent[0] for extent in extents)
+    union_y = max(extent[1] for extent in extents)
+    density = max(width / extent[0] for (width, _height), extent in zip(sizes, extents))
+    scale = 1.0 + overscan
+    # The fitted axis of the master always spans one view unit; round it up
+    # first and cut every crop at the density it actually renders with, so
+    # crops keep their deliverable's aspect and line up with the render
+    if sensor_fit == 'AUTO':
+        sensor_fit = 'HORIZONTAL' if union_x >= union_y else 'VERTICAL'
+    if sensor_fit == 'HORIZONTAL':
+        width = math.ceil(density * union_x * scale - 1e-6)
+        density = width / (union_x * scale)
+        height = math.ceil(density * union_y * scale - 1e-6)
+    else:
+        height = math.ceil(density * union_y * scale - 1e-6)
+        density = height / (union_y * scale)
+        width = math.ceil(density * union_x * scale - 1e-6)
+    crops = []
+    for extent_x, extent_y in extents:
+        crop_width = density * extent_x
+        crop_height = density * extent_y
+        crops.append(((width - crop_width) / 2.0, (height - crop_height) / 2.0, crop_width, crop_height))
+    return (width, height), crops
+
+def pixel_density(size, sensor_fit='AUTO', overscan=0.0):
+    # Pixels per view unit of a frame whose view is grown by overscan
+    return size[0] / (view_extent(*size, sensor_fit)[0] * (1.0 + overscan))
+
+def view_scale(master_size, sensor_fit, frame_size, overscan=0.0):
+    # How much larger the master view is than a frame_size render of the same
+    # camera, along its longest axis
+    master = view_extent(*master_size, sensor_fit)
+    frame = view_extent(*frame_size, sensor_fit)
+    return max(master[0] / frame[0], master[1] / frame[1]) * (1.0 + overscan)
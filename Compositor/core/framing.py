@@ -0,0 +1,139 @@
+import math
+
+import numpy as np
+
+# Blender's smallest allowed clip_start
+MIN_CLIP_START = 1e-6
+
+class CameraFrame:
+    # Projection of a camera following Blender's sensor fit rules: the sensor
+    # (or ortho_scale) spans the wider render axis for AUTO, otherwise the
+    # axis named by sensor_fit. Lens shift is in units of that axis.
+    def __init__(self, camera_type, lens, ortho_scale, sensor_width, sensor_height, sensor_fit, aspect,
+                 shift_x=0.0, shift_y=0.0, clip_start=0.1, clip_end=1000.0):
+        self.camera_type = camera_type
+        self.lens = lens
+        self.ortho_scale = ortho_scale
+        self.sensor_width = sensor_width
+        self.sensor_height = sensor_height
+        self.sensor_fit = sensor_fit
+        self.aspect = aspect
+        self.shift_x = shift_x
+        self.shift_y = shift_y
+        self.clip_start = clip_start
+        self.clip_end = clip_end
+
+    @property
+    def fit_axis(self):
+        if self.sensor_fit == 'AUTO':
+            return 'X' if self.aspect >= 1.0 else 'Y'
+        return 'X' if self.sensor_fit == 'HORIZONTAL' else 'Y'
+
+    @property
+    def sensor_size(self):
+        return self.sensor_height if self.sensor_fit == 'VERTICAL' else self.sensor_width
+
+    def unit_bounds(self):
+        # View rectangle per unit of half size along the fit axis:
+        # ((x_lo, x_hi), (y_lo, y_hi))
+        x_half, y_half = (1.0, 1.0 / self.aspect) if self.fit_axis == 'X' else (self.aspect, 1.0)
+        x_center = 2.0 * self.shift_x
+        y_center = 2.0 * self.shift_y
+        return (x_center - x_half, x_center + x_half), (y_center - y_half, y_center + y_half)
+
+    def half_size(self):
+        # Half the view along the fit axis: a tangent for perspective cameras,
+        # world units for orthographic ones
+        if self.camera_type == 'ORTHO':
+            return self.ortho_scale / 2.0
+        return self.sensor_size / (2.0 * self.lens)
+
+    def view_bounds(self):
+        half = self.half_size()
+        (x_lo, x_hi), (y_lo, y_hi) = self.unit_bounds()
+        return (x_lo * half, x_hi * half), (y_lo * half, y_hi * half)
+
+def view_matrix(camera_matrix_world, object_matrix_world=None):
+    # Maps object (or world) coordinates to camera space, camera looking down -Z
+    matrix = np.linalg.inv(np.asarray(camera_matrix_world, dtype=np.float64))
+    if object_matrix_world is not None:
+        matrix = matrix @ np.asarray(object_matrix_world, dtype=np.float64)
+    return matrix
+
+def transform_points(points, matrix):
+    # (N, 3) points to a (3, N) array of x, y and z rows; reductions over
+    # contiguous rows are several times faster than over (N, 3) columns
+    points = np.asarray(points)
+    dtype = points.dtype if points.dtype in (np.float32, np.float64) else np.float64
+    return matrix[:3, :3].astype(dtype) @ points.T + matrix[:3, 3:4].astype(dtype)
+
+class FrameExtent:
+    # Running bounds of camera-space points: min/max of x/depth and y/depth
+    # for perspective fits, of x and y for orthographic ones, and of depth.
+    # Points at or behind the camera plane are counted but not framed.
+    def __init__(self):
+        self.count = 0
+        self.behind = 0
+        self.slope_min = np.full(2, np.inf)
+        self.slope_max = np.full(2, -np.inf)
+        self.offset_min = np.full(2, np.inf)
+        self.offset_max = np.full(2, -np.inf)
+        self.depth_min = math.inf
+        self.depth_max = -math.inf
+
+    def add(self, coords):
+        # coords: (3, N) camera-space rows as returned by transform_points
+        x, y, z = coords
+        depth = -z
+        front = depth > 0.0
+        visible = int(np.count_nonzero(front))
+        self.behind += len(depth) - visible
+        if not visible:
+            return
+        if visible != len(depth):
+            x, y, depth = x[front], y[front], depth[front]
+        inverse = 1.0 / depth
+        slope_x = x * inverse
+        slope_y = y * inverse
+        self.count += visible
+        self.slope_min = np.minimum(self.slope_min, (slope_x.min(), slope_y.min()))
+        self.slope_max = np.maximum(self.slope_max, (slope_x.max(), slope_y.max()))
+        self.offset_min = np.minimum(self.offset_min, (x.min(), y.min()))
+        self.offset_max = np.maximum(self.offset_max, (x.max(), y.max()))
+        self.depth_min = min(self.depth_min, float(depth.min()))
+        self.depth_max = max(self.depth_max, float(depth.max()))
+
+def _required_half(low, high, bounds):
+    # Smallest half size k with k * bounds[0] <= low and high <= k * bounds[1]
+    lo, hi = bounds
+    need = 0.0
+    if high > 0.0:
+        need = max(need, high / hi if hi > 0.0 else math.inf)
+    if low < 0.0:
+        need = max(need, low / lo if lo < 0.0 else math.inf)
+    return need
+
+def framing_settings(extent, frame, margin=0.0, fit_clipping=True):
+    # Camera data attributes that fit the extent, {} when nothing is in front
+    if not extent.count:
+        return {}
+    if frame.camera_type == 'ORTHO':
+        low, high = extent.offset_min, extent.offset_max
+    else:
+        low, high = extent.slope_min, extent.slope_max
+    x_bounds, y_bounds = frame.unit_bounds()
+    half = max(
+        _required_half(float(low[0]), float(high[0]), x_bounds),
+        _required_half(float(low[1]), float(high[1]), y_bounds),
+    ) * (1.0 + margin)
+
+    settings = {}
+    if math.isfinite(half) and half > 0.0:
+        if frame.camera_type == 'ORTHO':
+            settings['ortho_scale'] = 2.0 * half
+        elif frame.camera_type == 'PERSP':
+            settings['lens'] = frame.sensor_size / (2.0 * half)
+    if fit_clipping:
+        settings['clip_start'] = max(extent.depth_min * (1.0 - margin), MIN_CLIP_START)
+        settings['clip_end'] = max(extent.depth_max * (1.0 + margin), settings['clip_start'] * 2.0)
+    return settings
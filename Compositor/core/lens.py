@@ -0,0 +1,20 @@
+CAMERA_TYPES = (
+    ('PERSP', "Perspective", "Perspective camera"),
+    ('ORTHO', "Orthographic", "Orthographic camera"),
+)
+DEFAULT_ORTHO_SCALE = 6.0
+
+def new_camera_settings(camera_type, length):
+    # Camera data attributes for a camera created from the view
+    if camera_type == 'PERSP':
+        return {'type': 'PERSP', 'lens': length}
+    return {'type': camera_type, 'ortho_scale': DEFAULT_ORTHO_SCALE}
+
+def focal_length_settings(length):
+    # Setting a focal length always makes the camera perspective
+    return {'type': 'PERSP', 'lens': length}
+
+def changed_settings(current, settings):
+    # Only the attributes whose value differs, so unchanged cameras are not
+    # tagged for a depsgraph update
+    return {name: value for name, value in settings.items() if current.get(name) != value}
@@ -0,0 +1,44 @@
+import math
+
+import numpy as np
+
+from .framing import transform_points, view_matrix
+
+def projected_extent(corners, camera_matrix_world, frame, width, height):
+    # Largest side in pixels of each box's projected bounding rectangle,
+    # (K,). Perspective boxes crossing the camera plane count as full frame.
+    corners = np.asarray(corners)
+    count = len(corners)
+    full = float(max(width, height))
+    if not count:
+        return np.zeros(0)
+    if frame.camera_type not in ('PERSP', 'ORTHO'):
+        return np.full(count, full)
+    x, y, z = transform_points(corners.reshape(-1, 3), view_matrix(camera_matrix_world))
+    depth = -z
+    crossing = np.zeros(count, dtype=bool)
+    if frame.camera_type == 'PERSP':
+        crossing = (depth <= 0.0).reshape(count, 8).any(axis=1)
+        depth = np.where(depth > 0.0, depth, 1.0)
+        x = x / depth
+        y = y / depth
+    (x_lo, x_hi), (y_lo, y_hi) = frame.view_bounds()
+    x = (x * (width / (x_hi - x_lo))).reshape(count, 8)
+    y = (y * (height / (y_hi - y_lo))).reshape(count, 8)
+    extent = np.maximum(np.ptp(x, axis=1), np.ptp(y, axis=1))
+    return np.where(crossing, full, np.minimum(extent, full))
+
+def detail_factor(extent, full_detail, min_factor):
+    # Linear detail wanted relative to full detail: 1 at or above
+    # full_detail pixels, shrinking with the projected size
+    return np.clip(np.asarray(extent, dtype=np.float64) / full_detail, min_factor, 1.0)
+
+def decimate_ratio(base_ratio, factor):
+    # Faces needed grow with the projected area
+    return base_ratio * factor * factor
+
+def subdivision_levels(base_levels, factor):
+    # Every level halves the edge length
+    if factor >= 1.0:
+        return base_levels
+    return max(0, base_levels - int(math.floor(math.log2(1.0 / factor))))
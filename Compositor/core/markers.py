@@ -0,0 +1,66 @@
+MARKER_SUFFIXES = ("_start", "_end")
+
+def marker_names(camera_name):
+    return (camera_name + MARKER_SUFFIXES[0], camera_name + MARKER_SUFFIXES[1])
+
+def scan_markers(markers, names):
+    # markers: (name, camera key or None) per timeline marker; names: {camera
+    # key: [(start name, end name)]} the markers of this add-on bound to that
+    # camera may carry, later pairs winning. The first matching marker per
+    # slot is kept as {camera key: [start index, end index]}, any further ones
+    # are stale. Markers with other names are the user's and never claimed.
+    slots = {
+        key: {name: slot for pair in pairs for slot, name in enumerate(pair) if name}
+        for key, pairs in names.items()
+    }
+    found = {}
+    stale = []
+    for index, (name, camera) in enumerate(markers):
+        if camera is None:
+            continue
+        slot = slots.get(camera, {}).get(name)
+        if slot is None:
+            continue
+        entry = found.setdefault(camera, [None, None])
+        if entry[slot] is None:
+            entry[slot] = index
+        else:
+            stale.append(index)
+    return found, stale
+
+def plan_camera_markers(camera_name, start, end, current):
+    # current: (name, frame) of the camera's start and end marker, or None.
+    # Returns (slot, name, frame, create) for every marker that needs writing.
+    names = marker_names(camera_name)
+    frames = (start, end)
+    plan = []
+    for slot in range(2):
+        if current[slot] is None:
+            plan.append((slot, names[slot], frames[slot], True))
+        elif current[slot] != (names[slot], frames[slot]):
+            plan.append((slot, names[slot], frames[slot], False))
+    return plan
+
+def plan_timeline_markers(cameras, markers, names=None):
+    # cameras: (key, name, start, end); markers: (name, frame, camera key);
+    # names: scan_markers names of cameras bound to markers, to which the
+    # current names of the listed cameras are added. Returns the per-camera
+    # plans, the marker indices to remove and the {camera key: [start index,
+    # end index]} of the markers that are kept.
+    names = {key: list(pairs) for key, pairs in (names or {}).items()}
+    for key, name, _start, _end in cameras:
+        names.setdefault(key, []).append(marker_names(name))
+    found, stale = scan_markers(((name, camera) for name, _frame, camera in markers), names)
+    plans = []
+    kept = {}
+    for key, name, start, end in cameras:
+        entry = found.pop(key, [None, None])
+        current = [
+            (markers[index][0], markers[index][1]) if index is not None else None
+            for index in entry
+        ]
+        plans.append((key, plan_camera_markers(name, start, end, current)))
+        kept[key] = entry
+    for entry in found.values():
+        stale.extend(index for index in entry if index is not None)
+    return plans, sorted(stale), kept
@@ -0,0 +1,24 @@
+MM_PER_INCH = 25.4
+
+def orient(width, height, orientation):
+    if orientation == 'VERTICAL' and width > height:
+        return height, width
+    return width, height
+
+def print_pixels(width_mm, height_mm, dpi, orientation='HORIZONTAL'):
+    return orient(int(width_mm / MM_PER_INCH * dpi), int(height_mm / MM_PER_INCH * dpi), orientation)
+
+def link_resolution(x, y, aspect_ratio, touched, last_updated, linked):
+    # Resolves one user action on the resolution fields. touched lists the
+    # axes set explicitly, in order. Returns (x, y, aspect_ratio, last_updated).
+    if touched:
+        last_updated = touched[-1]
+    if linked:
+        if len(touched) == 2:
+            # Both axes were set explicitly, e.g. by a preset
+            aspect_ratio = x / y
+        elif last_updated == 'X':
+            y = int(x / aspect_ratio)
+        else:
+            x = int(y * aspect_ratio)
+    return x, y, aspect_ratio, last_updated
@@ -0,0 +1,97 @@
+import math
+
+import numpy as np
+
+GOLDEN_ANGLE = math.pi * (3.0 - math.sqrt(5.0))
+
+def _normalize(vectors):
+    lengths = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.where(lengths > 0.0, lengths, 1.0)
+
+def look_at_matrices(positions, targets, up=(0.0, 0.0, 1.0)):
+    # (N, 4, 4) world matrices of cameras at positions aiming at targets:
+    # -Z points at the target and +Y stays as close to up as possible
+    positions = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+    forward = _normalize(np.broadcast_to(np.asarray(targets, dtype=np.float64), positions.shape) - positions)
+    up = np.broadcast_to(np.asarray(up, dtype=np.float64), positions.shape)
+    right = np.cross(forward, up)
+    # Looking straight along up: any horizontal right axis will do
+    degenerate = np.linalg.norm(right, axis=1) < 1e-9
+    if degenerate.any():
+        right[degenerate] = np.cross(forward[degenerate], (0.0, 1.0, 0.0))
+    right = _normalize(right)
+    camera_up = np.cross(right, forward)
+
+    matrices = np.zeros((len(positions), 4, 4))
+    matrices[:, :3, 0] = right
+    matrices[:, :3, 1] = camera_up
+    matrices[:, :3, 2] = -forward
+    matrices[:, :3, 3] = positions
+    matrices[:, 3, 3] = 1.0
+    return matrices
+
+def orbit_positions(count, center, radius, height=0.0, start_angle=0.0):
+    angles = start_angle + np.linspace(0.0, 2.0 * math.pi, count, endpoint=False)
+    positions = np.empty((count, 3))
+    positions[:, 0] = center[0] + radius * np.cos(angles)
+    positions[:, 1] = center[1] + radius * np.sin(angles)
+    positions[:, 2] = center[2] + height
+    return positions
+
+def fibonacci_positions(count, center, radius):
+    # Near-uniform points on a sphere, pole to pole
+    index = np.arange(count) + 0.5
+    z = 1.0 - 2.0 * index / count
+    ring = np.sqrt(1.0 - z * z)
+    angles = GOLDEN_ANGLE * index
+    positions = np.stack((ring * np.cos(angles), ring * np.sin(angles), z), axis=1)
+    return np.asarray(center, dtype=np.float64) + radius * positions
+
+def grid_positions(count, center, spacing, height):
+    # Rows of cameras centred over center, filling the squarest grid
+    columns = max(1, math.ceil(math.sqrt(count)))
+    rows = math.ceil(count / columns)
+    index = np.arange(count)
+    positions = np.empty((count, 3))
+    positions[:, 0] = center[0] + (index % columns - (columns - 1) / 2.0) * spacing
+    positions[:, 1] = center[1] + (index // columns - (rows - 1) / 2.0) * spacing
+    positions[:, 2] = center[2] + height
+    return positions
+
+def path_positions(count, points):
+    # count points spread evenly by arc length along a polyline, and the
+    # unit tangent at each of them
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+    if len(points) < 2:
+        return np.repeat(points[:1], count, axis=0), np.tile((0.0, 1.0, 0.0), (count, 1))
+    segments = np.diff(points, axis=0)
+    lengths = np.linalg.norm(segments, axis=1)
+    distance = np.concatenate(([0.0], np.cumsum(lengths)))
+    samples = np.linspace(0.0, distance[-1], count)
+    segment = np.clip(np.searchsorted(distance, samples, side='right') - 1, 0, len(segments) - 1)
+    along = (samples - distance[segment]) / np.where(lengths[segment] > 0.0, lengths[segment], 1.0)
+    positions = points[segment] + segments[segment] * along[:, None]
+    return positions, _normalize(segments[segment])
+
+def bezier_polyline(knots, left_handles, right_handles, resolution, cyclic=False):
+    # Points along a cubic Bezier spline, resolution per segment, ending on
+    # the last knot (or back on the first one when cyclic)
+    knots = np.asarray(knots, dtype=np.float64).reshape(-1, 3)
+    left_handles = np.asarray(left_handles, dtype=np.float64).reshape(-1, 3)
+    right_handles = np.asarray(right_handles, dtype=np.float64).reshape(-1, 3)
+    if len(knots) < 2:
+        return knots.copy()
+    following = np.arange(1, len(knots) + 1) % len(knots)
+    if not cyclic:
+        following = following[:-1]
+    starts = np.arange(len(following))
+    t = np.arange(max(1, resolution)) / max(1, resolution)
+    u = 1.0 - t
+    weights = np.stack((u ** 3, 3.0 * u * u * t, 3.0 * u * t * t, t ** 3), axis=1)
+    controls = np.stack((knots[starts], right_handles[starts], left_handles[following], knots[following]), axis=1)
+    points = np.einsum('tc,scd->std', weights, controls).reshape(-1, 3)
+    return np.vstack((points, knots[following[-1]][None, :]))
+
+def consecutive_ranges(count, start, length):
+    starts = start + np.arange(count) * length
+    return starts, starts + length - 1
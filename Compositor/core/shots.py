@@ -0,0 +1,239 @@
+import heapq
+import re
+from bisect import bisect_right
+from fnmatch import translate
+
+import numpy as np
+
+# UIList sort modes understood by sort_ranks, as EnumProperty items
+SORT_KEYS = (
+    ('LIST', "List Order", "Keep the order of the camera list"),
+    ('NAME', "Name", "Sort by camera name"),
+    ('START', "Start", "Sort by start frame"),
+    ('END', "End", "Sort by end frame"),
+    ('DURATION', "Duration", "Sort by number of frames in the range"),
+)
+
+# Disjoint, sorted frame segments mapping every covered frame to one shot,
+# stored as its camera_list index. Overlapping ranges resolve to the shot that
+# started last; ties go to the camera further down the list.
+class ShotTable:
+    def __init__(self, intervals):
+        self.starts = []
+        self.ends = []
+        self.shots = []
+        self._build(intervals)
+
+    def _build(self, intervals):
+        events = sorted(
+            (start, end, order, key)
+            for order, (key, start, end) in enumerate(intervals)
+            if end >= start
+        )
+        bounds = sorted({e[0] for e in events} | {e[1] + 1 for e in events})
+        active = []
+        pending = 0
+        for i, frame in enumerate(bounds[:-1]):
+            while pending < len(events) and events[pending][0] <= frame:
+                start, end, order, key = events[pending]
+                heapq.heappush(active, (-start, -order, end, key))
+                pending += 1
+            while active and active[0][2] < frame:
+                heapq.heappop(active)
+            if not active:
+                continue
+            key = active[0][3]
+            seg_end = bounds[i + 1] - 1
+            if self.shots and self.shots[-1] == key and self.ends[-1] == frame - 1:
+                self.ends[-1] = seg_end
+            else:
+                self.starts.append(frame)
+                self.ends.append(seg_end)
+                self.shots.append(key)
+
+    def __len__(self):
+        return len(self.starts)
+
+    def shot_at(self, frame):
+        i = bisect_right(self.starts, frame) - 1
+        if i >= 0 and frame <= self.ends[i]:
+            return self.shots[i]
+        return None
+
+# Column snapshot of a shot list built from (name, start, end, valid) rows,
+# one per list item. Rows without a valid camera keep their name only.
+class ShotArrays:
+    def __init__(self, rows):
+        rows = list(rows)
+        count = len(rows)
+        self.starts = np.zeros(count, dtype=np.int64)
+        self.ends = np.full(count, -1, dtype=np.int64)
+        self.valid = np.zeros(count, dtype=bool)
+        self.names = [""] * count
+        for index, (name, start, end, valid) in enumerate(rows):
+            self.names[index] = name
+            if valid:
+                self.starts[index] = start
+                self.ends[index] = end
+                self.valid[index] = True
+
+    def __len__(self):
+        return len(self.names)
+
+    def intervals(self):
+        rows = np.flatnonzero(self.valid)
+        return zip(rows.tolist(), self.starts[rows].tolist(), self.ends[rows].tolist())
+
+def _start_order(arrays, rows):
+    return rows[np.argsort(arrays.starts[rows], kind='stable')]
+
+def _longest_increasing_run(values):
+    # Indices of one longest strictly increasing subsequence, O(n log n)
+    tails = []
+    tail_indices = []
+    parents = [-1] * len(values)
+    for i, value in enumerate(values):
+        k = bisect_right(tails, value)
+        if k and tails[k - 1] == value:
+            k -= 1
+        if k == len(tails):
+            tails.append(value)
+            tail_indices.append(i)
+        else:
+            tails[k] = value
+            tail_indices[k] = i
+        parents[i] = tail_indices[k - 1] if k else -1
+    run = []
+    i = tail_indices[-1] if tail_indices else -1
+    while i >= 0:
+        run.append(i)
+        i = parents[i]
+    return run
+
+class _PresenceCounts:
+    # Fenwick tree over slots 0..size-1 that are either present or not;
+    # before(slot) counts the present slots left of it
+    def __init__(self, size):
+        self.tree = [0] * (size + 1)
+
+    def add(self, slot, delta):
+        slot += 1
+        while slot < len(self.tree):
+            self.tree[slot] += delta
+            slot += slot & -slot
+
+    def before(self, slot):
+        total = 0
+        while slot > 0:
+            total += self.tree[slot]
+            slot -= slot & -slot
+        return total
+
+# (from, to) collection.move() calls that put order[k] at index k. move()
+# removes an item and reinserts it, so items on a longest increasing run of
+# target ranks never move and every other item moves once, right behind the
+# item ranked before it.
+#
+# Moved items then trail the kept item they follow in rank order, so every
+# position an item ever takes has a fixed sort key: (original index of the
+# kept item it trails, rank), or (original index, rank) before it moves. The
+# list indices of a move are counts of the keys in use below it, kept in a
+# Fenwick tree, O(n log n) overall.
+def minimal_moves(order):
+    count = len(order)
+    rank = [0] * count
+    for position, index in enumerate(order):
+        rank[index] = position
+    keep = set(rank[i] for i in _longest_increasing_run(rank))
+    position = [0] * count
+    for index, target in enumerate(rank):
+        position[target] = index
+    # Keys as (anchor + 1) * count + rank; moved items before the first kept
+    # one trail the front of the list, anchor -1
+    anchor = -1
+    initial = [0] * count
+    final = {}
+    for target in range(count):
+        initial[target] = (position[target] + 1) * count + target
+        if target in keep:
+            anchor = position[target]
+        else:
+            final[target] = (anchor + 1) * count + target
+    slot = {key: i for i, key in enumerate(sorted(initial + list(final.values())))}
+    present = _PresenceCounts(len(slot))
+    for key in initial:
+        present.add(slot[key], 1)
+    moves = []
+    for target in range(count):
+        if target in keep:
+            continue
+        from_index = present.before(slot[initial[target]])
+        present.add(slot[initial[target]], -1)
+        to_index = present.before(slot[final[target]])
+        present.add(slot[final[target]], 1)
+        if from_index != to_index:
+            moves.append((from_index, to_index))
+    return moves
+
+def timeline_order(arrays):
+    # Start frame, then end frame, then name; items without a camera go last.
+    # np.lexsort sorts by the last key first and is stable.
+    return np.lexsort((np.array(arrays.names), arrays.ends, arrays.starts, ~arrays.valid))
+
+def sort_ranks(arrays, sort_by):
+    # Display position of every row for a UIList sort mode, [] keeps list order
+    if sort_by == 'LIST':
+        return []
+    if sort_by == 'NAME':
+        order = np.argsort(np.array([name.lower() for name in arrays.names]), kind='stable')
+    elif sort_by == 'START':
+        order = np.argsort(arrays.starts, kind='stable')
+    elif sort_by == 'END':
+        order = np.argsort(arrays.ends, kind='stable')
+    else:
+        order = np.argsort(arrays.ends - arrays.starts, kind='stable')
+    ranks = np.empty(len(arrays), dtype=np.int64)
+    ranks[order] = np.arange(len(arrays))
+    return ranks.tolist()
+
+def overlapping_mask(arrays):
+    mask = np.zeros(len(arrays), dtype=bool)
+    rows = _start_order(arrays, np.flatnonzero(arrays.valid))
+    if len(rows) < 2:
+        return mask
+    starts = arrays.starts[rows]
+    ends = arrays.ends[rows]
+    prev_max_end = np.maximum.accumulate(ends)[:-1]
+    hit = np.zeros(len(rows), dtype=bool)
+    hit[1:] |= starts[1:] <= prev_max_end
+    hit[:-1] |= starts[1:] <= ends[:-1]
+    mask[rows] = hit
+    return mask
+
+def covering_mask(arrays, frame):
+    return arrays.valid & (arrays.starts <= frame) & (arrays.ends >= frame)
+
+def gap_after_mask(arrays):
+    mask = np.zeros(len(arrays), dtype=bool)
+    rows = _start_order(arrays, np.flatnonzero(arrays.valid))
+    if len(rows) < 2:
+        return mask
+    starts = arrays.starts[rows]
+    max_end = np.maximum.accumulate(arrays.ends[rows])
+    after = arrays.ends[rows] + 1
+    last = np.searchsorted(starts, after, side='right') - 1
+    covered = max_end[last] >= after
+    mask[rows] = ~covered & (starts[-1] > arrays.ends[rows])
+    return mask
+
+def name_mask(arrays, pattern):
+    regex = re.compile(translate(f"*{pattern.lower()}*"))
+    return np.fromiter((regex.match(name.lower()) is not None for name in arrays.names), dtype=bool, count=len(arrays))
+
+def list_sync_plan(listed, cameras):
+    # listed: camera key per list item, None where the camera is gone.
+    # Returns the item indices to drop and the indices of cameras to append.
+    present = set(key for key in listed if key is not None)
+    missing = [index for index, key in enumerate(listed) if key is None]
+    new_cameras = [index for index, key in enumerate(cameras) if key not in present]
+    return missing, new_cameras
@@ -0,0 +1,157 @@
+import itertools
+import os
+
+import numpy as np
+
+# Column names understood in trajectory files; orientation is either a
+# quaternion (qw qx qy qz) or XYZ euler angles in radians (rx ry rz)
+POSITION_COLUMNS = ('x', 'y', 'z')
+QUATERNION_COLUMNS = ('qw', 'qx', 'qy', 'qz')
+EULER_COLUMNS = ('rx', 'ry', 'rz')
+DEFAULT_COLUMNS = "time x y z qw qx qy qz lens"
+CSV_CHUNK_ROWS = 65536
+
+class Trajectory:
+    def __init__(self, columns):
+        # columns: {name: float64 array}, all the same length
+        self.columns = columns
+        self.length = len(next(iter(columns.values()))) if columns else 0
+
+    def __len__(self):
+        return self.length
+
+    def has(self, names):
+        return all(name in self.columns for name in names)
+
+    def stack(self, names):
+        return np.stack([self.columns[name] for name in names], axis=1)
+
+def parse_columns(text):
+    return [name.strip().lower() for name in text.replace(",", " ").split() if name.strip()]
+
+def _select(names, wanted):
+    # {name: column index} for every known name; unknown names such as "_"
+    # skip a column
+    selected = {name: index for index, name in enumerate(names) if name in wanted}
+    if not selected:
+        raise ValueError(f"No known columns in {' '.join(names) or 'the file'}")
+    return selected
+
+def _known_columns():
+    return {'time', 'lens'} | set(POSITION_COLUMNS) | set(QUATERNION_COLUMNS) | set(EULER_COLUMNS)
+
+def read_npy(path, columns=DEFAULT_COLUMNS):
+    # Memory-mapped; only the used columns are copied out, so the file is not
+    # held open afterwards. Structured arrays are read by field name, plain 2D
+    # arrays through the column layout.
+    data = np.load(path, mmap_mode='r')
+    wanted = _known_columns()
+    if data.dtype.names:
+        selected = _select([name.lower() for name in data.dtype.names], wanted)
+        return Trajectory({
+            name: np.array(data[data.dtype.names[index]], dtype=np.float64)
+            for name, index in selected.items()
+        })
+    if data.ndim != 2:
+        raise ValueError(f"Expected a 2D array or a structured array, got shape {data.shape}")
+    selected = _select(parse_columns(columns), wanted)
+    if max(selected.values(), default=-1) >= data.shape[1]:
+        raise ValueError(f"Column layout '{columns}' needs more than the {data.shape[1]} columns in the file")
+    return Trajectory({name: np.array(data[:, index], dtype=np.float64) for name, index in selected.items()})
+
+def _is_header(line):
+    try:
+        [float(value) for value in line.replace(",", " ").split()]
+    except ValueError:
+        return True
+    return False
+
+def read_csv(path, columns=DEFAULT_COLUMNS, chunk_rows=CSV_CHUNK_ROWS):
+    # Parsed chunk by chunk, keeping only the used columns of each chunk.
+    # A header line names the columns, otherwise the column layout applies.
+    wanted = _known_columns()
+    with open(path, newline="") as stream:
+        first = stream.readline()
+        while first and not first.strip():
+            first = stream.readline()
+        if _is_header(first):
+            names = parse_columns(first)
+            lines = stream
+        else:
+            names = parse_columns(columns)
+            lines = itertools.chain((first,), stream)
+        delimiter = "," if "," in first else None
+        selected = _select(names, wanted)
+        usecols = sorted(selected.values())
+        chunks = []
+        while True:
+            block = list(itertools.islice(lines, chunk_rows))
+            if not block:
+                break
+            chunk = np.loadtxt(block, delimiter=delimiter, usecols=usecols, ndmin=2, dtype=np.float64)
+            if len(chunk):
+                chunks.append(chunk)
+    data = np.concatenate(chunks) if chunks else np.empty((0, len(usecols)))
+    position = {index: column for column, index in enumerate(usecols)}
+    return Trajectory({name: data[:, position[index]] for name, index in selected.items()})
+
+def read_trajectory(path, columns=DEFAULT_COLUMNS):
+    if os.path.splitext(path)[1].lower() == ".npy":
+        return read_npy(path, columns)
+    return read_csv(path, columns)
+
+def trajectory_frames(trajectory, fps=None, start=1.0):
+    # Frame of every sample: the time column in frames, or in seconds when
+    # fps is given, or consecutive frames from start without a time column
+    if 'time' not in trajectory.columns:
+        return start + np.arange(len(trajectory), dtype=np.float64)
+    frames = trajectory.columns['time'] * fps if fps else trajectory.columns['time'].copy()
+    if len(frames) > 1 and not (np.diff(frames) > 0.0).all():
+        raise ValueError("Sample times must be strictly increasing")
+    return frames
+
+def continuous_quaternions(quaternions):
+    # q and -q are the same rotation; flip signs so neighbours agree and the
+    # component curves do not jump
+    quaternions = quaternions / np.linalg.norm(quaternions, axis=1, keepdims=True)
+    if len(quaternions) > 1:
+        flips = np.einsum('ij,ij->i', quaternions[1:], quaternions[:-1]) < 0.0
+        signs = np.concatenate(([1.0], np.where(np.cumsum(flips) % 2, -1.0, 1.0)))
+        quaternions = quaternions * signs[:, None]
+    return quaternions
+
+def rdp_indices(times, values, tolerance):
+    # Ramer-Douglas-Peucker on one curve: indices of the samples to keep so
+    # linear interpolation between them stays within tolerance of every sample.
+    # Every interval still open at one depth is split in the same NumPy pass:
+    # each open sample carries the kept samples around it, and the worst
+    # sample of an interval is its first maximum, as a recursive pass finds.
+    count = len(values)
+    if count < 3 or tolerance <= 0.0:
+        return np.arange(count)
+    times = np.asarray(times, dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64)
+    keep = np.zeros(count, dtype=bool)
+    keep[0] = keep[-1] = True
+    open_samples = np.arange(1, count - 1)
+    first = np.zeros(len(open_samples), dtype=np.int64)
+    last = np.full(len(open_samples), count - 1, dtype=np.int64)
+    while len(open_samples):
+        slope = (values[last] - values[first]) / (times[last] - times[first])
+        error = np.abs(values[open_samples] - (values[first] + slope * (times[open_samples] - times[first])))
+        # Open samples stay sorted, so every interval is one contiguous run
+        starts = np.flatnonzero(np.r_[True, first[1:] != first[:-1]])
+        interval = np.repeat(np.arange(len(starts)), np.diff(np.r_[starts, len(open_samples)]))
+        worst = np.maximum.reduceat(error, starts)
+        at_worst = np.flatnonzero(error == worst[interval])
+        firsts = at_worst[np.r_[True, interval[at_worst[1:]] != interval[at_worst[:-1]]]]
+        split = open_samples[firsts]
+        splitting = worst > tolerance
+        keep[split[splitting]] = True
+        sample_split = split[interval]
+        still = splitting[interval] & (open_samples != sample_split)
+        open_samples, first, last, sample_split = open_samples[still], first[still], last[still], sample_split[still]
+        left = open_samples < sample_split
+        last = np.where(left, sample_split, last)
+        first = np.where(left, first, sample_split)
+    return np.flatnonzero(keep)
@@ -0,0 +1,110 @@
+import functools
+import inspect
+import json
+import logging
+import time
+from collections import deque
+
+logger = logging.getLogger("sciblend_compositor")
+if not logger.handlers:
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter("[SciBlend] %(levelname)s: %(message)s"))
+    logger.addHandler(_handler)
+    logger.propagate = False
+    logger.setLevel(logging.WARNING)
+
+LOG_LEVELS = ('DEBUG', 'INFO', 'WARNING', 'ERROR')
+# Durations kept per callback for the p95
+SAMPLE_SIZE = 512
+
+class CallStats:
+    __slots__ = ("count", "total", "max", "samples")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.samples = deque(maxlen=SAMPLE_SIZE)
+
+    def add(self, seconds):
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+        self.samples.append(seconds)
+
+    def p95(self):
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))]
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "total_ms": self.total * 1000.0,
+            "mean_ms": self.total * 1000.0 / self.count if self.count else 0.0,
+            "p95_ms": self.p95() * 1000.0,
+            "max_ms": self.max * 1000.0,
+        }
+
+_stats = {}
+# module -> milliseconds its register() took on the last load
+_registration = {}
+
+def _record(name, started):
+    stats = _stats.get(name)
+    if stats is None:
+        stats = _stats[name] = CallStats()
+    stats.add(time.perf_counter() - started)
+
+_WRAPPER_SOURCE = """
+def wrapper({params}):
+    started = perf_counter()
+    try:
+        return func({params})
+    finally:
+        record(name, started)
+"""
+
+def timed(func):
+    # Blender checks the positional argument count of operator methods,
+    # property update callbacks and handlers, so the wrapper is generated
+    # with the exact parameters of the wrapped function.
+    name = f"{func.__module__.rpartition('.')[2]}.{func.__qualname__}"
+    code = func.__code__
+    if code.co_flags & (inspect.CO_VARARGS | inspect.CO_VARKEYWORDS) or code.co_kwonlyargcount:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _record(name, started)
+        return wrapper
+    namespace = {"func": func, "name": name, "record": _record, "perf_counter": time.perf_counter}
+    exec(_WRAPPER_SOURCE.format(params=", ".join(code.co_varnames[:code.co_argcount])), namespace)
+    wrapper = functools.wraps(func)(namespace["wrapper"])
+    wrapper.__defaults__ = func.__defaults__
+    return wrapper
+
+def stats_snapshot(sort_by="total_ms"):
+    rows = [(name, stats.to_dict()) for name, stats in _stats.items()]
+    rows.sort(key=lambda row: row[1][sort_by], reverse=True)
+    return rows
+
+def reset_stats():
+    _stats.clear()
+
+def record_registration(module, milliseconds):
+    _registration[module] = milliseconds
+
+def registration_snapshot():
+    return sorted(_registration.items(), key=lambda row: row[1], reverse=True)
+
+def export_stats(path):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"callbacks": dict(stats_snapshot()), "registration_ms": dict(registration_snapshot())}, f, indent=1)
+
+def set_log_level(level):
+    logger.setLevel(getattr(logging, level, logging.WARNING))
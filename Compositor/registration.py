@@ -0,0 +1,59 @@
+import time
+
+import bpy
+
+from .profiling import logger, record_registration
+
+def _same_function(a, b):
+    # Handlers and classes from an earlier import of the add-on (script
+    # reload) are different objects with the same module and name
+    return a is b or (
+        getattr(a, "__module__", None) == getattr(b, "__module__", None)
+        and getattr(a, "__qualname__", None) == getattr(b, "__qualname__", None)
+    )
+
+def register_classes(classes):
+    for cls in classes:
+        existing = getattr(bpy.types, cls.__name__, None)
+        if existing is not None and existing is not cls and getattr(existing, "is_registered", False):
+            bpy.utils.unregister_class(existing)
+        if not getattr(cls, "is_registered", False):
+            bpy.utils.register_class(cls)
+
+def unregister_classes(classes):
+    for cls in reversed(classes):
+        if getattr(cls, "is_registered", False):
+            bpy.utils.unregister_class(cls)
+
+def register_properties(owner, properties):
+    for name, prop in properties.items():
+        setattr(owner, name, prop)
+
+def unregister_properties(owner, names):
+    for name in names:
+        if hasattr(owner, name):
+            delattr(owner, name)
+
+def add_handler(handlers, function):
+    remove_handler(handlers, function)
+    handlers.append(function)
+
+def remove_handler(handlers, function):
+    for existing in [handler for handler in handlers if _same_function(handler, function)]:
+        handlers.remove(existing)
+
+def _short_name(module):
+    root = __package__ + "."
+    return module.__name__[len(root):] if module.__name__.startswith(root) else module.__name__
+
+def register_modules(modules):
+    for module in modules:
+        started = time.perf_counter()
+        module.register()
+        elapsed = (time.perf_counter() - started) * 1000.0
+        record_registration(_short_name(module), elapsed)
+        logger.debug("Registered %s in %.2f ms", _short_name(module), elapsed)
+
+def unregister_modules(modules):
+    for module in reversed(modules):
+        module.unregister()
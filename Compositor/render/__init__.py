@@ -0,0 +1,16 @@
+from . import estimate
+from . import culling
+from . import lod
+from . import dedup
+from . import deliverables
+from . import shot_render
+from . import print_render
+from ..registration import register_modules, unregister_modules
+
+modules = (estimate, culling, lod, dedup, deliverables, shot_render, print_render)
+
+def register():
+    register_modules(modules)
+
+def unregister():
+    unregister_modules(modules)
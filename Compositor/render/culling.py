@@ -0,0 +1,180 @@
+import json
+import os
+import time
+
+import bpy
+import numpy as np
+from bpy.props import BoolProperty, FloatProperty
+from bpy.types import Operator
+
+from ..cinematography.camera_manager import list_item_camera, shot_arrays
+from ..cinematography.framing import GEOMETRY_TYPES, camera_frame
+from ..core.culling import box_visibility, transform_corners
+from ..core.lod import projected_extent
+from .dedup import is_static
+from ..profiling import logger, timed
+from ..registration import register_classes, register_properties, unregister_classes, unregister_properties
+
+RENDERABLE_TYPES = GEOMETRY_TYPES | {'CURVES', 'POINTCLOUD', 'VOLUME'}
+
+def shot_objects(scene):
+    return [obj for obj in scene.objects if obj.type in RENDERABLE_TYPES and not obj.hide_render]
+
+def is_cullable(obj):
+    # Particle emitters and instancers draw outside their own bounds
+    return obj.instance_type == 'NONE' and not (obj.type == 'MESH' and len(obj.particle_systems))
+
+def _has_animation(id_data):
+    animation_data = getattr(id_data, "animation_data", None)
+    return animation_data is not None and (
+        animation_data.action is not None or len(animation_data.drivers) or len(animation_data.nla_tracks)
+    )
+
+def can_move(obj):
+    # The world matrix may differ between frames
+    return obj.parent is not None or len(obj.constraints) > 0 or _has_animation(obj)
+
+def can_deform(obj):
+    # The local bounding box may differ between frames
+    data = obj.data
+    return len(obj.modifiers) > 0 or _has_animation(data) or _has_animation(getattr(data, "shape_keys", None))
+
+def local_corners(objects, depsgraph):
+    local = np.empty((len(objects), 8, 3))
+    for i, obj in enumerate(objects):
+        local[i] = obj.evaluated_get(depsgraph).bound_box
+    return local
+
+def world_matrices(objects, depsgraph):
+    matrices = np.empty((len(objects), 4, 4))
+    for i, obj in enumerate(objects):
+        matrices[i] = obj.evaluated_get(depsgraph).matrix_world
+    return matrices
+
+class ShotBounds:
+    # World-space bounding box corners of the shot objects, frame by frame.
+    # Boxes of objects that neither move nor deform are computed once; moving
+    # rigid objects only re-read their matrices, and only deforming ones
+    # re-read their bounds.
+    def __init__(self, objects, depsgraph):
+        self.objects = objects
+        deforming = np.fromiter((can_deform(obj) for obj in objects), dtype=bool, count=len(objects))
+        moving = np.fromiter((can_move(obj) for obj in objects), dtype=bool, count=len(objects))
+        self.deforming = np.flatnonzero(deforming)
+        self.moving = np.flatnonzero(moving & ~deforming)
+        self.local = local_corners(objects, depsgraph)
+        self.corners = transform_corners(self.local, world_matrices(objects, depsgraph))
+
+    def update(self, depsgraph):
+        objects = self.objects
+        if len(self.moving):
+            matrices = world_matrices([objects[i] for i in self.moving], depsgraph)
+            self.corners[self.moving] = transform_corners(self.local[self.moving], matrices)
+        if len(self.deforming):
+            changed = [objects[i] for i in self.deforming]
+            self.corners[self.deforming] = transform_corners(
+                local_corners(changed, depsgraph), world_matrices(changed, depsgraph)
+            )
+        return self.corners
+
+def analyze_shots(scene, objects, margin=0.1, resolution=None):
+    # One pass over every frame of every shot, or only the first one when
+    # nothing in the scene moves: culling hides an object for the whole shot,
+    # so a frame it shows up on must not be skipped. Returns {camera name:
+    # (visible, extent)}: whether each object is inside the frustum on any
+    # frame, and with a (width, height) resolution its largest projected size
+    # in pixels.
+    frame_current = scene.frame_current
+    static = is_static(scene)
+    bounds = ShotBounds(objects, bpy.context.evaluated_depsgraph_get())
+    results = {}
+    try:
+        for index, start, end in shot_arrays(scene).intervals():
+            camera_obj = list_item_camera(scene.camera_list[index])
+            if camera_obj is None:
+                continue
+            visible = np.zeros(len(objects), dtype=bool)
+            extent = np.zeros(len(objects)) if resolution is not None else None
+            for frame in range(start, start + 1 if static else end + 1):
+                scene.frame_set(frame)
+                depsgraph = bpy.context.evaluated_depsgraph_get()
+                camera_eval = camera_obj.evaluated_get(depsgraph)
+                corners = bounds.update(depsgraph)
+                matrix = np.array(camera_eval.matrix_world)
+                frame_settings = camera_frame(scene, camera_eval.data)
+                visible |= box_visibility(corners, matrix, frame_settings, margin)
+                if extent is not None:
+                    np.maximum(extent, projected_extent(corners, matrix, frame_settings, *resolution), out=extent)
+            results[camera_obj.name] = (visible, extent)
+    finally:
+        scene.frame_set(frame_current)
+    return results
+
+def culling_plan(objects, analysis):
+    # {camera name: names of the objects it never sees during its range}
+    names = [obj.name for obj in objects]
+    cullable = np.fromiter((is_cullable(obj) for obj in objects), dtype=bool, count=len(objects))
+    return {
+        camera: [names[i] for i in np.flatnonzero(cullable & ~visible).tolist()]
+        for camera, (visible, _extent) in analysis.items()
+    }
+
+def write_plan(path, plan):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(plan, f)
+
+class CINEMATOGRAPHY_OT_analyze_shot_culling(Operator):
+    bl_idname = "cinematography.analyze_shot_culling"
+    bl_label = "Analyze Culling"
+    bl_description = "Report how many objects each shot's camera sees, without changing the scene"
+
+    @classmethod
+    def poll(cls, context):
+        return len(context.scene.camera_list) > 0
+
+    @timed
+    def execute(self, context):
+        scene = context.scene
+        started = time.perf_counter()
+        objects = shot_objects(scene)
+        plan = culling_plan(objects, analyze_shots(scene, objects, scene.shot_culling_margin))
+        total = len(objects)
+        if not plan or not total:
+            self.report({'INFO'}, "Nothing to cull")
+            return {'FINISHED'}
+        for camera, hidden in plan.items():
+            logger.info("%s sees %d of %d objects", camera, total - len(hidden), total)
+        visible = sum(total - len(hidden) for hidden in plan.values()) / len(plan)
+        self.report({'INFO'}, (
+            f"{len(plan)} shots see on average {visible:.0f} of {total} objects "
+            f"({100.0 * visible / total:.0f}%), analyzed in {(time.perf_counter() - started) * 1000.0:.0f} ms"
+        ))
+        return {'FINISHED'}
+
+classes = (CINEMATOGRAPHY_OT_analyze_shot_culling,)
+
+def register():
+    register_properties(bpy.types.Scene, {
+        "use_shot_culling": BoolProperty(
+            name="Cull Off-Screen Objects",
+            description=(
+                "Hide objects outside a shot's camera view while rendering that shot. "
+                "Hidden objects also stop casting shadows and reflections into the shot"
+            ),
+            default=False
+        ),
+        "shot_culling_margin": FloatProperty(
+            name="Margin",
+            description="Enlarge the camera view by this fraction before testing objects",
+            default=0.1,
+            min=0.0,
+            max=2.0,
+            subtype='FACTOR'
+        ),
+    })
+    register_classes(classes)
+
+def unregister():
+    unregister_classes(classes)
+    unregister_properties(bpy.types.Scene, ("use_shot_culling", "shot_culling_margin"))
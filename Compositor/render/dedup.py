@@ -0,0 +1,184 @@
+import time
+
+import bpy
+import numpy as np
+from bpy.props import BoolProperty
+from bpy.types import Operator
+
+from ..cinematography.camera_manager import shot_arrays
+from ..core.dedup import FramePlan, duplicate_sources, varying_columns
+from ..profiling import logger, timed
+from ..registration import register_classes, register_properties, unregister_classes, unregister_properties
+
+# ID collections whose animation data can carry drivers or NLA strips
+ANIMATED_COLLECTIONS = (
+    "objects", "meshes", "curves", "lattices", "armatures", "shape_keys", "cameras", "lights",
+    "materials", "worlds", "node_groups", "textures", "particles", "scenes", "volumes",
+)
+# Modifiers that change over time without any keyframe
+TIME_MODIFIERS = {
+    'CLOTH', 'SOFT_BODY', 'FLUID', 'DYNAMIC_PAINT', 'PARTICLE_SYSTEM', 'EXPLODE', 'OCEAN', 'WAVE',
+    'NODES', 'MESH_CACHE', 'MESH_SEQUENCE_CACHE',
+}
+TIME_NODES = {'TIME', 'MOVIECLIP'}
+# Constraints that read animation from an external cache
+TIME_CONSTRAINTS = {'TRANSFORM_CACHE'}
+
+def _animation_data(id_data):
+    yield getattr(id_data, "animation_data", None)
+    node_tree = getattr(id_data, "node_tree", None)
+    if node_tree is not None:
+        yield node_tree.animation_data
+
+def _time_driver(fcurve):
+    driver = fcurve.driver
+    if "frame" in driver.expression:
+        return True
+    return any("frame" in target.data_path for variable in driver.variables for target in variable.targets)
+
+def time_dependence(scene):
+    # Why two frames with the same keyframed values can still render
+    # differently, or None when the keyed state and the camera decide a frame
+    render = scene.render
+    if render.is_movie_format:
+        return "movie output"
+    if getattr(getattr(scene, "cycles", None), "use_animated_seed", False):
+        return "animated noise seed"
+    if render.use_stamp and render.use_stamp_frame:
+        return "frame number stamp"
+    if scene.rigidbody_world is not None and scene.rigidbody_world.enabled:
+        return "rigid body simulation"
+    if render.use_sequencer and scene.sequence_editor is not None and len(scene.sequence_editor.sequences_all):
+        return "sequencer strips"
+    if render.use_compositing and scene.use_nodes and scene.node_tree is not None:
+        for node in scene.node_tree.nodes:
+            if node.type in TIME_NODES:
+                return f"compositor node '{node.name}'"
+    for obj in scene.objects:
+        for modifier in obj.modifiers:
+            if modifier.type in TIME_MODIFIERS:
+                return f"{modifier.type.lower().replace('_', ' ')} modifier on '{obj.name}'"
+        for constraint in obj.constraints:
+            if constraint.type in TIME_CONSTRAINTS and constraint.enabled:
+                return f"transform cache constraint on '{obj.name}'"
+    for image in bpy.data.images:
+        if image.users and image.source in {'SEQUENCE', 'MOVIE'}:
+            return f"image sequence '{image.name}'"
+    for volume in bpy.data.volumes:
+        if volume.users and volume.is_sequence:
+            return f"volume sequence '{volume.name}'"
+    for cache_file in bpy.data.cache_files:
+        if cache_file.users:
+            return f"cache file '{cache_file.name}'"
+    for name in ANIMATED_COLLECTIONS:
+        for id_data in getattr(bpy.data, name, ()):
+            for animation_data in _animation_data(id_data):
+                if animation_data is None:
+                    continue
+                if len(animation_data.nla_tracks):
+                    return f"NLA strips on '{id_data.name}'"
+                if any(_time_driver(fcurve) for fcurve in animation_data.drivers):
+                    return f"time driver on '{id_data.name}'"
+    return None
+
+def is_static(scene):
+    # True when no frame of the scene differs from another: nothing keyed and
+    # nothing that changes over time without keys
+    if any(action.users and len(action.fcurves) for action in bpy.data.actions):
+        return False
+    return time_dependence(scene) is None
+
+def sample_offsets(scene):
+    # Motion blur mixes neighbouring subframes into a frame, so compare those too
+    render = scene.render
+    if not render.use_motion_blur:
+        return np.zeros(1)
+    shutter = render.motion_blur_shutter
+    return np.array([0.0, -shutter, -shutter / 2.0, shutter / 2.0, shutter])
+
+def keyed_columns(times):
+    # Every F-Curve in use, evaluated at every sample time; curves that hold
+    # one value everywhere are dropped
+    columns = []
+    for action in bpy.data.actions:
+        if not action.users:
+            continue
+        for fcurve in action.fcurves:
+            if fcurve.mute:
+                continue
+            values = np.fromiter((fcurve.evaluate(t) for t in times), dtype=np.float64, count=len(times))
+            columns.append(values)
+    return varying_columns(columns)
+
+def plan_duplicates(scene, shots):
+    # FramePlan for [(camera, start, end)]; frames only match within a shot
+    frames = [np.arange(start, end + 1) for _camera, start, end in shots]
+    if not frames:
+        return FramePlan(shots, [])
+    shot_index = np.concatenate([np.full(len(f), i, dtype=np.float64) for i, f in enumerate(frames)])
+    frames = np.concatenate(frames).astype(np.float64)
+    offsets = sample_offsets(scene)
+    times = (frames[:, None] + offsets[None, :]).ravel()
+    columns = [column.reshape(len(frames), len(offsets)) for column in keyed_columns(times)]
+    rows = np.column_stack([shot_index] + columns)
+    return FramePlan(shots, duplicate_sources(rows))
+
+def scene_duplicate_plan(scene, shots):
+    # (FramePlan or None, reason it is None)
+    reason = time_dependence(scene)
+    if reason is not None:
+        return None, reason
+    return plan_duplicates(scene, shots), None
+
+def log_saved_frames(plan):
+    for camera, (saved, total) in plan.saved().items():
+        logger.info("%s: %d of %d frames are copies", camera, saved, total)
+
+class CINEMATOGRAPHY_OT_analyze_duplicate_frames(Operator):
+    bl_idname = "cinematography.analyze_duplicate_frames"
+    bl_label = "Analyze Duplicate Frames"
+    bl_description = "Report how many frames of each shot are identical to an earlier frame and would be copied"
+
+    @classmethod
+    def poll(cls, context):
+        return len(context.scene.camera_list) > 0
+
+    @timed
+    def execute(self, context):
+        scene = context.scene
+        started = time.perf_counter()
+        arrays = shot_arrays(scene)
+        shots = [(arrays.names[index], start, end) for index, start, end in arrays.intervals()]
+        plan, reason = scene_duplicate_plan(scene, shots)
+        if plan is None:
+            self.report({'WARNING'}, f"Every frame renders, the scene changes over time: {reason}")
+            return {'FINISHED'}
+        log_saved_frames(plan)
+        saved = plan.saved()
+        copied = sum(count for count, _total in saved.values())
+        total = sum(total for _count, total in saved.values())
+        shots = ", ".join(f"{camera} {count}/{frames}" for camera, (count, frames) in saved.items() if count)
+        self.report({'INFO'}, (
+            f"{copied} of {total} frames are copies" + (f" ({shots})" if shots else "")
+            + f", analyzed in {(time.perf_counter() - started) * 1000.0:.0f} ms"
+        ))
+        return {'FINISHED'}
+
+classes = (CINEMATOGRAPHY_OT_analyze_duplicate_frames,)
+
+def register():
+    register_properties(bpy.types.Scene, {
+        "use_frame_dedup": BoolProperty(
+            name="Copy Identical Frames",
+            description=(
+                "Render each distinct frame of a shot once and copy it to the frames where "
+                "the camera and every keyframed value are the same"
+            ),
+            default=False
+        ),
+    })
+    register_classes(classes)
+
+def unregister():
+    unregister_classes(classes)
+    unregister_properties(bpy.types.Scene, ("use_frame_dedup",))
@@ -0,0 +1,158 @@
+import math
+import os
+
+import bpy
+from bpy.props import BoolProperty, CollectionProperty, EnumProperty, FloatProperty, IntProperty
+from bpy.types import Operator, PropertyGroup
+
+from ..cinematography import presets
+from ..cinematography.camera_manager import list_item_camera
+from ..core.deliverables import master_plan, pixel_density, view_scale
+from .lod import output_resolution
+from ..profiling import timed
+from ..registration import register_classes, register_properties, unregister_classes, unregister_properties
+
+DELIVERABLES_FOLDER = "deliverables"
+
+def _cinema_items(self, context):
+    return presets.registry().cinema_items
+
+class DeliverableItem(PropertyGroup):
+    enabled: BoolProperty(name="Enabled", default=True)
+    preset: EnumProperty(name="Format", items=_cinema_items)
+    orientation: EnumProperty(
+        name="Orientation",
+        items=[
+            ('HORIZONTAL', "Horizontal", "Horizontal orientation"),
+            ('VERTICAL', "Vertical", "Vertical orientation"),
+        ],
+        default='HORIZONTAL'
+    )
+
+def scene_deliverables(scene):
+    # [(folder name, (width, height))] of the enabled deliverables
+    registry = presets.registry()
+    deliverables = []
+    for item in scene.deliverables:
+        size = registry.cinema_sizes[item.orientation].get(item.preset)
+        if not item.enabled or size is None:
+            continue
+        folder = item.preset if item.orientation == 'HORIZONTAL' else f"{item.preset}_VERTICAL"
+        if folder not in (name for name, _size in deliverables):
+            deliverables.append((folder, size))
+    return deliverables
+
+def deliverable_output_path(scene, folder, camera_name):
+    name = bpy.path.clean_name(camera_name)
+    return os.path.join(bpy.path.abspath(scene.shot_render_output), DELIVERABLES_FOLDER, folder, name, name + "_")
+
+def camera_master_plan(scene, camera_obj, deliverables):
+    sizes = [size for _folder, size in deliverables]
+    return master_plan(sizes, camera_obj.data.sensor_fit, scene.deliverable_overscan)
+
+def attach_deliverables(scene, chunks):
+    # Workers render the camera's master frame and cut every deliverable out
+    # of it. Returns {camera: master size}.
+    deliverables = scene_deliverables(scene)
+    if not deliverables:
+        return {}
+    plans = {}
+    masters = {}
+    for chunk in chunks:
+        plan = plans.get(chunk.camera)
+        if plan is None:
+            camera_obj = bpy.data.objects.get(chunk.camera)
+            if camera_obj is None or camera_obj.type != 'CAMERA':
+                continue
+            master, crops = camera_master_plan(scene, camera_obj, deliverables)
+            masters[chunk.camera] = master
+            plan = plans[chunk.camera] = {
+                "master": {"resolution": list(master), "overscan": scene.deliverable_overscan},
+                "deliverables": [
+                    {
+                        "name": folder,
+                        "crop": list(crop),
+                        "size": list(size),
+                        "output": deliverable_output_path(scene, folder, chunk.camera),
+                    }
+                    for (folder, size), crop in zip(deliverables, crops)
+                ],
+            }
+        chunk.extra.update(plan)
+    return masters
+
+def analysis_view(scene):
+    # (view scale, resolution) for culling and level of detail analysis: the
+    # output frame grown to hold every shot's master, at master pixel density
+    deliverables = scene_deliverables(scene)
+    frame_size = output_resolution(scene)
+    overscan = scene.deliverable_overscan
+    scale = density = 1.0
+    for item in scene.camera_list:
+        camera_obj = list_item_camera(item)
+        if camera_obj is None or not deliverables:
+            continue
+        fit = camera_obj.data.sensor_fit
+        master, _crops = camera_master_plan(scene, camera_obj, deliverables)
+        scale = max(scale, view_scale(master, fit, frame_size, overscan))
+        density = max(density, pixel_density(master, fit, overscan) / pixel_density(frame_size, fit))
+    return scale, (math.ceil(frame_size[0] * density), math.ceil(frame_size[1] * density))
+
+class CINEMATOGRAPHY_OT_add_deliverable(Operator):
+    bl_idname = "cinematography.add_deliverable"
+    bl_label = "Add Deliverable"
+    bl_description = "Add a cinema format that shot renders derive from the master frames"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @timed
+    def execute(self, context):
+        scene = context.scene
+        item = scene.deliverables.add()
+        item.preset = scene.cinema_format
+        item.orientation = scene.resolution_orientation
+        return {'FINISHED'}
+
+class CINEMATOGRAPHY_OT_remove_deliverable(Operator):
+    bl_idname = "cinematography.remove_deliverable"
+    bl_label = "Remove Deliverable"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    index: IntProperty()
+
+    @timed
+    def execute(self, context):
+        if 0 <= self.index < len(context.scene.deliverables):
+            context.scene.deliverables.remove(self.index)
+        return {'FINISHED'}
+
+classes = (
+    DeliverableItem,
+    CINEMATOGRAPHY_OT_add_deliverable,
+    CINEMATOGRAPHY_OT_remove_deliverable,
+)
+
+def register():
+    register_classes(classes)
+    register_properties(bpy.types.Scene, {
+        "deliverables": CollectionProperty(type=DeliverableItem),
+        "use_deliverables": BoolProperty(
+            name="Derive Deliverables",
+            description=(
+                "Render every shot once at a master resolution holding all deliverable formats, "
+                "then crop and resample each format from it"
+            ),
+            default=False
+        ),
+        "deliverable_overscan": FloatProperty(
+            name="Overscan",
+            description="Extra view rendered around the master frame, as a fraction of its size",
+            default=0.0,
+            min=0.0,
+            max=1.0,
+            subtype='FACTOR'
+        ),
+    })
+
+def unregister():
+    unregister_properties(bpy.types.Scene, ("deliverables", "use_deliverables", "deliverable_overscan"))
+    unregister_classes(classes)
@@ -0,0 +1,52 @@
+import numpy as np
+
+# Crops and resamples master frames into deliverable frames. No bpy and no
+# package-relative imports: worker.py imports this module from inside
+# background Blender processes.
+
+def axis_weights(start, length, size, limit):
+    # Source indices and weights (size, taps) of a triangle filter mapping
+    # [start, start + length) source pixels onto size output pixels; the
+    # filter widens when shrinking so every source pixel contributes
+    scale = length / size
+    radius = max(1.0, scale)
+    centers = start + (np.arange(size) + 0.5) * scale
+    taps = int(np.ceil(2.0 * radius)) + 1
+    indices = np.floor(centers - radius).astype(np.int64)[:, None] + np.arange(taps)[None, :]
+    weights = np.clip(1.0 - np.abs(indices + 0.5 - centers[:, None]) / radius, 0.0, None)
+    indices = np.clip(indices, 0, limit - 1)
+    weights /= weights.sum(axis=1, keepdims=True)
+    return indices, weights.astype(np.float32)
+
+def filter_rows(source, indices, weights):
+    # Weighted sum of gathered rows, one tap at a time through a reused buffer
+    result = np.zeros((indices.shape[0],) + source.shape[1:], dtype=np.float32)
+    gathered = np.empty_like(result)
+    for tap in range(indices.shape[1]):
+        np.take(source, indices[:, tap], axis=0, out=gathered)
+        gathered *= weights[:, tap, None, None]
+        result += gathered
+    return result
+
+def crop_resample(pixels, crop, size):
+    # pixels: (rows, columns, channels) float32; crop: (x, y, width, height)
+    # in source pixels; size: (width, height) of the result. Colour is
+    # filtered premultiplied so transparent pixels do not bleed into edges.
+    x, y, width, height = crop
+    out_width, out_height = size
+    channels = pixels.shape[2]
+    source = np.asarray(pixels, dtype=np.float32)
+    if channels == 4:
+        source = source.copy()
+        source[..., :3] *= source[..., 3:4]
+
+    # Rows first touches only the source rows the crop needs; columns are
+    # filtered on a transposed copy so every gather reads contiguous rows
+    rows = filter_rows(source, *axis_weights(y, height, out_height, source.shape[0]))
+    columns = np.ascontiguousarray(rows.transpose(1, 0, 2))
+    result = filter_rows(columns, *axis_weights(x, width, out_width, columns.shape[0])).transpose(1, 0, 2)
+
+    if channels == 4:
+        alpha = result[..., 3:4]
+        np.divide(result[..., :3], alpha, out=result[..., :3], where=alpha > 0.0)
+    return np.ascontiguousarray(result)
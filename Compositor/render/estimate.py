@@ -0,0 +1,140 @@
+import math
+import os
+
+import bpy
+from bpy.props import IntProperty
+
+from .scheduler import HISTORY_FILENAME, RenderHistory
+from ..registration import register_properties, unregister_properties
+
+# Float channels each enabled view layer pass adds to the render result
+PASS_CHANNELS = {
+    "use_pass_combined": 4,
+    "use_pass_z": 1,
+    "use_pass_mist": 1,
+    "use_pass_normal": 3,
+    "use_pass_position": 3,
+    "use_pass_vector": 4,
+    "use_pass_uv": 3,
+    "use_pass_object_index": 1,
+    "use_pass_material_index": 1,
+    "use_pass_diffuse_direct": 3,
+    "use_pass_diffuse_indirect": 3,
+    "use_pass_diffuse_color": 3,
+    "use_pass_glossy_direct": 3,
+    "use_pass_glossy_indirect": 3,
+    "use_pass_glossy_color": 3,
+    "use_pass_transmission_direct": 3,
+    "use_pass_transmission_indirect": 3,
+    "use_pass_transmission_color": 3,
+    "use_pass_subsurface_direct": 3,
+    "use_pass_subsurface_indirect": 3,
+    "use_pass_subsurface_color": 3,
+    "use_pass_emit": 3,
+    "use_pass_environment": 3,
+    "use_pass_ambient_occlusion": 3,
+    "use_pass_shadow": 3,
+}
+CRYPTOMATTE_PASSES = (
+    "use_pass_cryptomatte_object",
+    "use_pass_cryptomatte_material",
+    "use_pass_cryptomatte_asset",
+)
+FLOAT_BYTES = 4
+# Byte RGBA display buffer plus the float RGBA buffer the image is saved from
+DISPLAY_BYTES_PER_PIXEL = 4 + 16
+
+_rate_cache = {}
+
+def view_layer_channels(view_layer):
+    channels = sum(count for name, count in PASS_CHANNELS.items() if getattr(view_layer, name, False))
+    crypto_levels = math.ceil(getattr(view_layer, "pass_cryptomatte_depth", 6) / 2)
+    channels += sum(4 * crypto_levels for name in CRYPTOMATTE_PASSES if getattr(view_layer, name, False))
+    return max(channels, 4)
+
+def scene_pass_channels(scene):
+    layers = [view_layer for view_layer in scene.view_layers if view_layer.use]
+    if scene.render.use_single_layer and layers:
+        layers = layers[:1]
+    return sum(view_layer_channels(view_layer) for view_layer in layers) or 4
+
+def bytes_per_pixel(scene):
+    return scene_pass_channels(scene) * FLOAT_BYTES + DISPLAY_BYTES_PER_PIXEL
+
+def reference_pixel_rate(scene):
+    # Median seconds per pixel from the shot render history, re-read only
+    # when the file changes
+    path = os.path.join(bpy.path.abspath(scene.shot_render_output), HISTORY_FILENAME)
+    try:
+        mtime = os.stat(path).st_mtime
+    except OSError:
+        return None
+    cached = _rate_cache.get(path)
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, RenderHistory.load(path).pixel_rate())
+        _rate_cache[path] = cached
+    return cached[1]
+
+class RenderEstimate:
+    def __init__(self, width, height, bytes_per_pixel, budget_bytes, pixel_rate=None):
+        self.width = width
+        self.height = height
+        self.bytes = width * height * bytes_per_pixel
+        self.seconds = pixel_rate * width * height if pixel_rate is not None else None
+        self.budget_bytes = budget_bytes
+        self.over_budget = self.bytes > budget_bytes
+        # Memory grows with the square of the resolution percentage
+        self.max_percentage = min(100, int(100 * math.sqrt(budget_bytes / self.bytes))) if self.bytes else 100
+
+def estimate_resolution(scene, width, height, percentage=None):
+    if percentage is None:
+        percentage = scene.render.resolution_percentage
+    scale = percentage / 100.0
+    return RenderEstimate(
+        int(width * scale),
+        int(height * scale),
+        bytes_per_pixel(scene),
+        scene.render_memory_budget * 1024 * 1024,
+        reference_pixel_rate(scene),
+    )
+
+def estimate_presets(scene, sizes):
+    # sizes: {identifier: (width, height)} at 100%
+    scale = scene.render.resolution_percentage / 100.0
+    per_pixel = bytes_per_pixel(scene)
+    budget = scene.render_memory_budget * 1024 * 1024
+    rate = reference_pixel_rate(scene)
+    return {
+        identifier: RenderEstimate(int(width * scale), int(height * scale), per_pixel, budget, rate)
+        for identifier, (width, height) in sizes.items()
+    }
+
+def estimate_scene(scene):
+    return estimate_resolution(scene, scene.render.resolution_x, scene.render.resolution_y)
+
+def format_bytes(size):
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024.0
+    return f"{size:.1f} TB"
+
+def format_seconds(seconds):
+    if seconds < 60:
+        return f"{seconds:.1f} s"
+    if seconds < 3600:
+        return f"{seconds / 60:.1f} min"
+    return f"{seconds / 3600:.1f} h"
+
+def register():
+    register_properties(bpy.types.Scene, {
+        "render_memory_budget": IntProperty(
+            name="Memory Budget (MB)",
+            description="Render memory above which presets are flagged and tiled rendering is suggested",
+            default=8192,
+            min=64
+        ),
+    })
+
+def unregister():
+    unregister_properties(bpy.types.Scene, ("render_memory_budget",))
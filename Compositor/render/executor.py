@@ -0,0 +1,167 @@
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+# This module does not import bpy so farm scripts can drive it from a plain
+# Python interpreter; the Blender side lives in shot_render.py.
+
+WORKER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "worker.py")
+# Lines the worker prints to stdout for every rendered frame
+FRAME_TIME_PREFIX = "SCIBLEND_FRAME_TIME "
+
+class RenderChunk:
+    FIELDS = ("camera", "start", "end", "output", "index")
+
+    def __init__(self, camera, start, end, output, index=0, extra=None):
+        self.camera = camera
+        self.start = start
+        self.end = end
+        self.output = output
+        self.index = index
+        self.attempts = 0
+        self.status = 'PENDING'
+        self.elapsed = 0.0
+        self.error = ""
+        self.expected_cost = float(end - start + 1)
+        # frame -> (resolution key, seconds), filled from worker output
+        self.frame_times = {}
+        # Additional JSON-serializable keys passed through to the worker
+        self.extra = extra or {}
+        # (source, frame) pairs of identical frames the worker copies from
+        # this chunk's renders
+        self.copies = []
+        self.label = f"{camera} {start}-{end}"
+
+    @property
+    def frame_count(self):
+        return self.end - self.start + 1
+
+    def to_dict(self):
+        return {
+            "camera": self.camera,
+            "start": self.start,
+            "end": self.end,
+            "output": self.output,
+            "index": self.index,
+            **self.extra,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        extra = {key: value for key, value in data.items() if key not in cls.FIELDS}
+        return cls(data["camera"], data["start"], data["end"], data["output"], data.get("index", 0), extra)
+
+    def __repr__(self):
+        return f"RenderChunk({self.camera!r}, {self.start}-{self.end})"
+
+def split_shot(camera, start, end, output, chunk_size):
+    chunk_size = max(1, chunk_size)
+    return [
+        RenderChunk(camera, frame, min(frame + chunk_size - 1, end), output)
+        for frame in range(start, end + 1, chunk_size)
+    ]
+
+def default_worker_count():
+    return max(1, (os.cpu_count() or 1) // 2)
+
+class ShotRenderExecutor:
+    def __init__(self, blend_path, blender=None, workers=0, retries=1, threads_per_worker=0, on_event=None):
+        self.blend_path = blend_path
+        self.blender = blender or sys.executable
+        self.workers = workers or default_worker_count()
+        self.retries = retries
+        # Split the cores between workers instead of letting every process
+        # spawn one render thread per core.
+        self.threads_per_worker = threads_per_worker or max(1, (os.cpu_count() or 1) // self.workers)
+        self.on_event = on_event
+        self._cancelled = threading.Event()
+        self._processes = set()
+        self._lock = threading.Lock()
+
+    def command(self, chunk):
+        return [
+            self.blender, "-b", self.blend_path,
+            "-t", str(self.threads_per_worker),
+            "--python-exit-code", "1",
+            "--python", WORKER_SCRIPT,
+            "--", json.dumps(chunk.to_dict()),
+        ]
+
+    def _emit(self, kind, chunk):
+        if self.on_event is not None:
+            self.on_event(kind, chunk)
+
+    def _run_once(self, chunk):
+        process = subprocess.Popen(
+            self.command(chunk),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+        )
+        with self._lock:
+            self._processes.add(process)
+        tail = deque(maxlen=5)
+        try:
+            for line in process.stdout:
+                if line.startswith(FRAME_TIME_PREFIX):
+                    timing = json.loads(line[len(FRAME_TIME_PREFIX):])
+                    chunk.frame_times[timing["frame"]] = (timing["resolution"], timing["seconds"])
+                elif line.strip():
+                    tail.append(line.strip())
+            process.wait()
+        finally:
+            with self._lock:
+                self._processes.discard(process)
+        if process.returncode != 0:
+            chunk.error = tail[-1] if tail else f"exit code {process.returncode}"
+            return False
+        return True
+
+    def _render_chunk(self, chunk):
+        while chunk.attempts <= self.retries and not self._cancelled.is_set():
+            chunk.attempts += 1
+            chunk.status = 'RUNNING'
+            self._emit('STARTED', chunk)
+            started = time.perf_counter()
+            ok = self._run_once(chunk)
+            chunk.elapsed = time.perf_counter() - started
+            if ok:
+                chunk.status = 'DONE'
+                chunk.error = ""
+                self._emit('DONE', chunk)
+                return chunk
+            if self._cancelled.is_set():
+                break
+            self._emit('RETRY' if chunk.attempts <= self.retries else 'FAILED', chunk)
+        chunk.status = 'CANCELLED' if self._cancelled.is_set() else 'FAILED'
+        return chunk
+
+    def run(self, chunks):
+        for index, chunk in enumerate(chunks):
+            chunk.index = index
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            return list(pool.map(self._render_chunk, chunks))
+
+    def cancel(self):
+        self._cancelled.set()
+        with self._lock:
+            for process in self._processes:
+                process.terminate()
+
+def summarize(chunks):
+    done = [chunk for chunk in chunks if chunk.status == 'DONE']
+    failed = [chunk for chunk in chunks if chunk.status == 'FAILED']
+    return {
+        "chunks": len(chunks),
+        "done": len(done),
+        "failed": len(failed),
+        "frames": sum(chunk.frame_count for chunk in done),
+        "copied": sum(len(chunk.copies) for chunk in done),
+        "render_time": sum(chunk.elapsed for chunk in chunks),
+        "failures": [(chunk.label, chunk.error) for chunk in failed],
+    }
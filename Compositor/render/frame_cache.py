@@ -0,0 +1,50 @@
+import json
+import os
+import shutil
+
+# Copies rendered frames onto the frames planned as identical to them. bpy-free
+# and imported by worker.py as a plain module, like tiles.py.
+
+DEDUP_FILENAME = "duplicates.json"
+
+def frame_path(output, frame, extension=""):
+    # The file Blender writes for a frame when the output path has no '#'
+    return f"{output}{frame:04d}{extension}"
+
+def remove_frame(path):
+    # Blender writes into an existing file in place, so a stale copy must go
+    # before its frame is written again
+    if os.path.lexists(path):
+        os.remove(path)
+
+def copy_frame(source, target):
+    # A real copy, never a hardlink: re-rendering either frame later must not
+    # overwrite the other through a shared file
+    os.makedirs(os.path.dirname(target) or ".", exist_ok=True)
+    remove_frame(target)
+    shutil.copyfile(source, target)
+
+def clear_frames(outputs, start, end, extension=""):
+    # Removes the files a chunk is about to write for each of its outputs
+    for output in outputs:
+        for frame in range(start, end + 1):
+            remove_frame(frame_path(output, frame, extension))
+
+def write_duplicates(path, plan):
+    # plan: {camera: {source frame: [(source path, target path)]}}, one pair
+    # per output the frame is written to
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(plan, f)
+
+def materialize_duplicates(path, camera, start, end):
+    # Fills in the copies of the frames a chunk rendered; returns how many
+    with open(path, "r", encoding="utf-8") as f:
+        copies = json.load(f).get(camera, {})
+    count = 0
+    for frame in range(start, end + 1):
+        for source, target in copies.get(str(frame), ()):
+            if os.path.exists(source):
+                copy_frame(source, target)
+                count += 1
+    return count
@@ -0,0 +1,119 @@
+import time
+
+import bpy
+from bpy.props import BoolProperty, FloatProperty, IntProperty
+from bpy.types import Operator
+
+from ..core.lod import decimate_ratio, detail_factor, subdivision_levels
+from ..profiling import logger, timed
+from ..registration import register_classes, register_properties, unregister_classes, unregister_properties
+from .culling import analyze_shots, shot_objects
+
+def lod_modifiers(obj):
+    # (modifier name, attribute, full detail value) of the modifiers LOD scales
+    modifiers = []
+    for modifier in obj.modifiers:
+        if not modifier.show_render:
+            continue
+        if modifier.type == 'DECIMATE' and modifier.decimate_type == 'COLLAPSE':
+            modifiers.append((modifier.name, "ratio", modifier.ratio))
+        elif modifier.type in {'SUBSURF', 'MULTIRES'} and modifier.render_levels > 0:
+            modifiers.append((modifier.name, "render_levels", modifier.render_levels))
+    return modifiers
+
+def lod_plan(objects, analysis, full_detail, min_factor):
+    # {camera name: {object name: {modifier name: {attribute: value}}}} for
+    # the objects that appear small enough in that shot to drop detail
+    candidates = []
+    for i, obj in enumerate(objects):
+        modifiers = lod_modifiers(obj) if obj.type == 'MESH' else ()
+        if modifiers:
+            candidates.append((i, obj.name, modifiers))
+    plan = {}
+    for camera, (_visible, extent) in analysis.items():
+        factors = detail_factor(extent, full_detail, min_factor)
+        shot = {}
+        for i, name, modifiers in candidates:
+            factor = float(factors[i])
+            if factor >= 1.0:
+                continue
+            changes = {}
+            for modifier_name, attribute, base in modifiers:
+                if attribute == "ratio":
+                    value = decimate_ratio(base, factor)
+                else:
+                    value = subdivision_levels(base, factor)
+                if value != base:
+                    changes[modifier_name] = {attribute: value}
+            if changes:
+                shot[name] = changes
+        plan[camera] = shot
+    return plan
+
+def output_resolution(scene):
+    render = scene.render
+    scale = render.resolution_percentage / 100.0
+    return int(render.resolution_x * scale), int(render.resolution_y * scale)
+
+def scene_lod_plan(scene, objects=None, analysis=None):
+    if objects is None:
+        objects = shot_objects(scene)
+    if analysis is None:
+        analysis = analyze_shots(scene, objects, scene.shot_culling_margin, output_resolution(scene))
+    return lod_plan(objects, analysis, scene.shot_lod_full_detail, scene.shot_lod_min_factor)
+
+class CINEMATOGRAPHY_OT_analyze_shot_lod(Operator):
+    bl_idname = "cinematography.analyze_shot_lod"
+    bl_label = "Analyze Level of Detail"
+    bl_description = "Report which objects each shot would render at reduced detail, without changing the scene"
+
+    @classmethod
+    def poll(cls, context):
+        return len(context.scene.camera_list) > 0
+
+    @timed
+    def execute(self, context):
+        started = time.perf_counter()
+        plan = scene_lod_plan(context.scene)
+        for camera, shot in plan.items():
+            logger.info("%s renders %d objects at reduced detail", camera, len(shot))
+        reduced = sum(len(shot) for shot in plan.values())
+        self.report({'INFO'}, (
+            f"{reduced} object/shot pairs at reduced detail across {len(plan)} shots, "
+            f"analyzed in {(time.perf_counter() - started) * 1000.0:.0f} ms"
+        ))
+        return {'FINISHED'}
+
+classes = (CINEMATOGRAPHY_OT_analyze_shot_lod,)
+
+def register():
+    register_properties(bpy.types.Scene, {
+        "use_shot_lod": BoolProperty(
+            name="Screen-Space Level of Detail",
+            description=(
+                "Lower Decimate ratios and subdivision render levels of objects that appear small in a shot, "
+                "only in the background render processes"
+            ),
+            default=False
+        ),
+        "shot_lod_full_detail": IntProperty(
+            name="Full Detail (px)",
+            description="Projected size in pixels from which objects render at full detail",
+            default=400,
+            min=1,
+            subtype='PIXEL'
+        ),
+        "shot_lod_min_factor": FloatProperty(
+            name="Minimum Detail",
+            description="Lowest linear detail kept for tiny objects, as a fraction of full detail",
+            default=0.05,
+            min=0.001,
+            max=1.0,
+            subtype='FACTOR'
+        ),
+    })
+    register_classes(classes)
+
+def unregister():
+    unregister_classes(classes)
+    unregister_properties(bpy.types.Scene, ("use_shot_lod", "shot_lod_full_detail", "shot_lod_min_factor"))
@@ -0,0 +1,57 @@
+import hashlib
+import json
+import os
+
+# Which frame files on disk are valid for which render settings, so an
+# interrupted shot render can resume. bpy-free, like scheduler.py.
+
+MANIFEST_FILENAME = "manifest.json"
+
+def fingerprint(settings):
+    text = json.dumps(settings, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:16]
+
+class RenderManifest:
+    def __init__(self, path=None):
+        self.path = path
+        # fingerprint -> the settings it was computed from
+        self.settings = {}
+        # camera -> {frame: (fingerprint, file path relative to the manifest)}
+        self.frames = {}
+
+    @classmethod
+    def load(cls, path):
+        manifest = cls(path)
+        if path and os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            manifest.settings = data.get("settings", {})
+            for camera, frames in data.get("frames", {}).items():
+                manifest.frames[camera] = {int(frame): tuple(entry) for frame, entry in frames.items()}
+        return manifest
+
+    def save(self, path=None):
+        # Written beside and swapped in, so a crash never leaves half a manifest
+        path = path or self.path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        temporary = path + ".tmp"
+        with open(temporary, "w", encoding="utf-8") as f:
+            json.dump({"version": 1, "settings": self.settings, "frames": self.frames}, f, sort_keys=True)
+        os.replace(temporary, path)
+
+    def _folder(self):
+        return os.path.dirname(os.path.abspath(self.path)) if self.path else os.getcwd()
+
+    def record(self, camera, frame, path, key, settings):
+        self.settings.setdefault(key, settings)
+        self.frames.setdefault(camera, {})[int(frame)] = (key, os.path.relpath(path, self._folder()))
+
+    def is_valid(self, camera, frame, key):
+        entry = self.frames.get(camera, {}).get(int(frame))
+        if entry is None or entry[0] != key:
+            return False
+        path = os.path.join(self._folder(), entry[1])
+        return os.path.exists(path) and os.path.getsize(path) > 0
+
+    def pending_frames(self, camera, frames, key):
+        return [frame for frame in frames if not self.is_valid(camera, frame, key)]
@@ -0,0 +1,115 @@
+import os
+import shutil
+import tempfile
+
+import bpy
+from bpy.props import EnumProperty, IntProperty, StringProperty
+from bpy.types import Operator
+
+from .estimate import bytes_per_pixel
+from .executor import RenderChunk
+from .shot_render import ExecutorModal, shot_render_workers
+from .tiles import create_tiff_canvas, plan_tiles
+from ..profiling import timed
+from ..registration import register_classes, register_properties, unregister_classes, unregister_properties
+
+def output_size(scene):
+    render = scene.render
+    scale = render.resolution_percentage / 100.0
+    return int(render.resolution_x * scale), int(render.resolution_y * scale)
+
+def plan_print_chunks(scene, canvas, tile_dir):
+    width, height = canvas["width"], canvas["height"]
+    # Sized from the scene's passes, so many passes or deep buffers mean smaller tiles
+    tiles = plan_tiles(width, height, scene.print_tile_memory * 1024 * 1024, bytes_per_pixel(scene))
+    chunks = []
+    for index, tile in enumerate(tiles):
+        chunk = RenderChunk(
+            scene.camera.name,
+            scene.frame_current,
+            scene.frame_current,
+            os.path.join(tile_dir, f"tile_{index:05d}.png"),
+            extra={"tile": tile, "canvas": canvas},
+        )
+        chunk.label = f"Tile {index + 1}/{len(tiles)}"
+        chunks.append(chunk)
+    return chunks
+
+class CINEMATOGRAPHY_OT_render_print_tiled(ExecutorModal, Operator):
+    bl_idname = "cinematography.render_print_tiled"
+    bl_label = "Render Print (Tiled)"
+    bl_description = (
+        "Render the current frame as border tiles in background Blender processes and stream them "
+        "into a single TIFF, so print resolutions never have to fit in memory at once"
+    )
+
+    _tile_dir = None
+    _canvas = None
+
+    @classmethod
+    def poll(cls, context):
+        return bool(bpy.data.filepath) and context.scene.camera is not None
+
+    @timed
+    def invoke(self, context, event):
+        if bpy.data.is_dirty:
+            self.report({'WARNING'}, "Save the file first, workers render the saved .blend")
+            return {'CANCELLED'}
+        scene = context.scene
+        width, height = output_size(scene)
+        path = bpy.path.abspath(scene.print_render_output)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._canvas = create_tiff_canvas(path, width, height, 4, int(scene.print_bit_depth), scene.print_dpi)
+        self._tile_dir = tempfile.mkdtemp(prefix="sciblend_tiles_")
+        chunks = plan_print_chunks(scene, self._canvas, self._tile_dir)
+        return self.start_executor(context, chunks, shot_render_workers(scene), scene.shot_render_retries)
+
+    def executor_finished(self, context, cancelled):
+        shutil.rmtree(self._tile_dir, ignore_errors=True)
+        if cancelled:
+            return
+        failed = [chunk for chunk in self._chunks if chunk.status != 'DONE']
+        if failed:
+            self.report({'ERROR'}, f"{len(failed)} of {len(self._chunks)} tiles failed, {self._canvas['path']} is incomplete")
+        else:
+            self.report({'INFO'}, (
+                f"Wrote {self._canvas['width']}x{self._canvas['height']} print from "
+                f"{len(self._chunks)} tiles to {self._canvas['path']}"
+            ))
+
+classes = (
+    CINEMATOGRAPHY_OT_render_print_tiled,
+)
+
+def register():
+    register_properties(bpy.types.Scene, {
+        "print_render_output": StringProperty(
+            name="Print Output",
+            description="TIFF file the tiled print render is written to",
+            default="//print.tif",
+            subtype='FILE_PATH'
+        ),
+        "print_tile_memory": IntProperty(
+            name="Tile Memory (MB)",
+            description="Render buffer budget of one tile; every worker renders one tile at a time",
+            default=2048,
+            min=64
+        ),
+        "print_bit_depth": EnumProperty(
+            name="Bit Depth",
+            items=[
+                ('8', "8 bit", "8 bits per channel"),
+                ('16', "16 bit", "16 bits per channel"),
+            ],
+            default='16'
+        ),
+    })
+    register_classes(classes)
+
+def unregister():
+    unregister_classes(classes)
+    unregister_properties(bpy.types.Scene, (
+        "print_render_output",
+        "print_tile_memory",
+        "print_bit_depth",
+    ))
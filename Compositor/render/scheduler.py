@@ -0,0 +1,143 @@
+import heapq
+import json
+import os
+import statistics
+
+from .executor import RenderChunk
+
+# Per-frame render times keyed by camera and output resolution, used to size
+# chunks so every worker gets about the same amount of work. bpy-free, like
+# executor.py.
+
+HISTORY_FILENAME = "render_history.json"
+DEFAULT_FRAME_COST = 1.0
+# Chunks per worker: more chunks balance better, fewer start fewer processes
+CHUNKS_PER_WORKER = 3
+
+def resolution_key(width, height):
+    return f"{width}x{height}"
+
+class RenderHistory:
+    def __init__(self, path=None):
+        self.path = path
+        # camera -> resolution key -> {frame: seconds}
+        self.frames = {}
+
+    @classmethod
+    def load(cls, path):
+        history = cls(path)
+        if path and os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            for camera, resolutions in data.get("frames", {}).items():
+                history.frames[camera] = {
+                    res: {int(frame): seconds for frame, seconds in frames.items()}
+                    for res, frames in resolutions.items()
+                }
+        return history
+
+    def save(self, path=None):
+        path = path or self.path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"version": 1, "frames": self.frames}, f, indent=1, sort_keys=True)
+
+    def record(self, camera, resolution, frame, seconds):
+        self.frames.setdefault(camera, {}).setdefault(resolution, {})[int(frame)] = seconds
+
+    def record_chunk(self, chunk):
+        for frame, (resolution, seconds) in chunk.frame_times.items():
+            self.record(chunk.camera, resolution, frame, seconds)
+
+    def pixel_rate(self):
+        # Median seconds per pixel over everything recorded
+        rates = []
+        for resolutions in self.frames.values():
+            for res, frames in resolutions.items():
+                pixels = _pixels(res)
+                rates.extend(seconds / pixels for seconds in frames.values())
+        return statistics.median(rates) if rates else None
+
+    def frame_cost_model(self, camera, resolution):
+        pixels = _pixels(resolution)
+        resolutions = self.frames.get(camera, {})
+        exact = resolutions.get(resolution)
+        if exact:
+            mean = statistics.fmean(exact.values())
+            return lambda frame: exact.get(frame, mean)
+        if resolutions:
+            # Same camera at another resolution, scale by pixel count
+            res, frames = max(resolutions.items(), key=lambda item: len(item[1]))
+            scale = pixels / _pixels(res)
+            mean = statistics.fmean(frames.values()) * scale
+            return lambda frame: frames[frame] * scale if frame in frames else mean
+        rate = self.pixel_rate()
+        cost = rate * pixels if rate is not None else DEFAULT_FRAME_COST
+        return lambda frame: cost
+
+def _pixels(resolution):
+    width, height = resolution.split("x")
+    return max(1, int(width) * int(height))
+
+def plan_adaptive_chunks(shots, history, resolution, workers, output_for):
+    # shots: iterable of (camera, start, end). Returns chunks ordered longest
+    # expected first, each carrying its expected cost in seconds.
+    costed = []
+    total = 0.0
+    for camera, start, end in shots:
+        model = history.frame_cost_model(camera, resolution)
+        frame_costs = [(frame, model(frame)) for frame in range(start, end + 1)]
+        costed.append((camera, frame_costs))
+        total += sum(cost for _frame, cost in frame_costs)
+    target = total / max(1, workers * CHUNKS_PER_WORKER)
+
+    chunks = []
+    for camera, frame_costs in costed:
+        output = output_for(camera)
+        first = frame_costs[0][0] if frame_costs else 0
+        cost = 0.0
+        for frame, frame_cost in frame_costs:
+            if cost > 0.0 and cost + frame_cost > target:
+                chunks.append(_costed_chunk(camera, first, frame - 1, output, cost))
+                first, cost = frame, 0.0
+            cost += frame_cost
+        if frame_costs:
+            chunks.append(_costed_chunk(camera, first, frame_costs[-1][0], output, cost))
+    chunks.sort(key=lambda chunk: chunk.expected_cost, reverse=True)
+    for index, chunk in enumerate(chunks):
+        chunk.index = index
+    return chunks
+
+def _costed_chunk(camera, start, end, output, cost):
+    chunk = RenderChunk(camera, start, end, output)
+    chunk.expected_cost = cost
+    return chunk
+
+def assign_workers(chunks, workers):
+    # Longest processing time first: each chunk goes to the least loaded
+    # worker, which is what a pool pulling chunks in this order does.
+    loads = [(0.0, worker) for worker in range(max(1, workers))]
+    assignment = {}
+    for chunk in sorted(chunks, key=lambda chunk: chunk.expected_cost, reverse=True):
+        load, worker = heapq.heappop(loads)
+        assignment[chunk.index] = worker
+        heapq.heappush(loads, (load + chunk.expected_cost, worker))
+    return assignment, sorted(load for load, _worker in loads)
+
+def write_job_file(path, chunks, workers, blend_path, resolution):
+    assignment, loads = assign_workers(chunks, workers)
+    job = {
+        "version": 1,
+        "blend": blend_path,
+        "resolution": resolution,
+        "workers": workers,
+        "expected_makespan": loads[-1] if loads else 0.0,
+        "expected_worker_loads": loads,
+        "chunks": [
+            dict(chunk.to_dict(), expected_cost=chunk.expected_cost, worker=assignment[chunk.index])
+            for chunk in chunks
+        ],
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(job, f, indent=1)
+    return job
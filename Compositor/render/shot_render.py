@@ -0,0 +1,475 @@
+import os
+import queue
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+import bpy
+from bpy.props import BoolProperty, IntProperty, StringProperty
+from bpy.types import Operator
+from bpy_extras.io_utils import ExportHelper
+
+from ..cinematography.camera_manager import shot_arrays
+from ..core.dedup import frame_runs
+from .culling import analyze_shots, culling_plan, shot_objects, write_plan
+from .dedup import log_saved_frames, scene_duplicate_plan
+from .deliverables import analysis_view, attach_deliverables, deliverable_output_path, scene_deliverables
+from .executor import ShotRenderExecutor, default_worker_count, split_shot, summarize
+from .frame_cache import DEDUP_FILENAME, copy_frame, frame_path, write_duplicates
+from .lod import output_resolution, scene_lod_plan
+from .manifest import MANIFEST_FILENAME, RenderManifest, fingerprint
+from .scheduler import HISTORY_FILENAME, RenderHistory, plan_adaptive_chunks, resolution_key, write_job_file
+from ..profiling import logger, timed
+from ..registration import register_classes, register_properties, unregister_classes, unregister_properties
+
+CULLING_FILENAME = "culling.json"
+LOD_FILENAME = "lod.json"
+# Seconds between manifest writes while a shot render runs
+MANIFEST_SAVE_INTERVAL = 30.0
+
+def shot_output_path(scene, camera_name):
+    name = bpy.path.clean_name(camera_name)
+    return os.path.join(bpy.path.abspath(scene.shot_render_output), name, name + "_")
+
+def output_resolution_key(scene):
+    return resolution_key(*output_resolution(scene))
+
+def render_history_path(scene):
+    return os.path.join(bpy.path.abspath(scene.shot_render_output), HISTORY_FILENAME)
+
+def manifest_path(scene):
+    return os.path.join(bpy.path.abspath(scene.shot_render_output), MANIFEST_FILENAME)
+
+def manifest_settings(scene):
+    # Everything that changes the pixels a frame file holds for a given
+    # camera and frame; frames rendered with other settings are stale
+    render = scene.render
+    image = render.image_settings
+    view = scene.view_settings
+    cycles = getattr(scene, "cycles", None)
+    return {
+        "resolution": output_resolution_key(scene),
+        "custom_resolution": [scene.custom_resolution_x, scene.custom_resolution_y],
+        "fps": [render.fps, render.fps_base],
+        "format": [image.file_format, image.color_mode, image.color_depth],
+        "engine": render.engine,
+        "samples": getattr(cycles, "samples", None) if render.engine == 'CYCLES' else None,
+        "film_transparent": render.film_transparent,
+        "motion_blur": [render.use_motion_blur, render.motion_blur_shutter],
+        "color": [scene.display_settings.display_device, view.view_transform, view.look, view.exposure, view.gamma],
+        "culling": [scene.use_shot_culling, scene.shot_culling_margin],
+        "lod": [scene.use_shot_lod, scene.shot_lod_full_detail, scene.shot_lod_min_factor],
+        "deliverables": (
+            [scene.deliverable_overscan] + [[folder, *size] for folder, size in scene_deliverables(scene)]
+            if scene.use_deliverables else None
+        ),
+    }
+
+def resume_duplicates(scene, duplicates, manifest, key, settings):
+    # Re-renders only the sources whose file is missing or stale; copies of a
+    # valid source are refilled from it right away. Returns the copies made.
+    extension = frame_extension(scene)
+    refilled = 0
+    for camera, _start, _end in duplicates.shots:
+        outputs = frame_outputs(scene, camera)
+        copies = duplicates.copies[camera]
+        renders = []
+        for source in duplicates.renders[camera]:
+            if not manifest.is_valid(camera, source, key):
+                renders.append(source)
+                continue
+            for frame in manifest.pending_frames(camera, copies.get(source, ()), key):
+                for output in outputs:
+                    copy_frame(frame_path(output, source, extension), frame_path(output, frame, extension))
+                manifest.record(camera, frame, frame_path(outputs[0], frame, extension), key, settings)
+                refilled += 1
+        duplicates.keep_renders(camera, renders)
+    if refilled:
+        manifest.save()
+    return refilled
+
+def resume_shots(scene, shots, duplicates):
+    # Drops the frames the manifest already holds with the current settings
+    manifest = RenderManifest.load(manifest_path(scene))
+    settings = manifest_settings(scene)
+    key = fingerprint(settings)
+    total = sum(end - start + 1 for _camera, start, end in shots)
+    if duplicates is not None:
+        refilled = resume_duplicates(scene, duplicates, manifest, key, settings)
+        resumed = list(duplicates.render_shots())
+    else:
+        refilled = 0
+        resumed = [
+            (camera, run_start, run_end)
+            for camera, start, end in shots
+            for run_start, run_end in frame_runs(manifest.pending_frames(camera, range(start, end + 1), key))
+        ]
+    logger.info(
+        "Resuming: %d of %d frames to render, %d copies refilled",
+        sum(end - start + 1 for _camera, start, end in resumed), total, refilled,
+    )
+    return resumed
+
+def record_manifest(manifest, chunks, settings, key, extension):
+    # Frames of finished chunks, and the frames an interrupted chunk reported
+    # before it stopped, whose files exist for every output. Only updates the
+    # manifest in memory.
+    for chunk in chunks:
+        if chunk.status == 'DONE':
+            frames = list(range(chunk.start, chunk.end + 1)) + [frame for _source, frame in chunk.copies]
+        else:
+            frames = list(chunk.frame_times)
+        outputs = [chunk.output] + [deliverable["output"] for deliverable in chunk.extra.get("deliverables", ())]
+        for frame in frames:
+            paths = [frame_path(output, frame, extension) for output in outputs]
+            if all(os.path.exists(path) and os.path.getsize(path) > 0 for path in paths):
+                manifest.record(chunk.camera, frame, paths[0], key, settings)
+
+def shot_render_workers(scene):
+    return scene.shot_render_workers or default_worker_count()
+
+def plan_shot_chunks(scene):
+    arrays = shot_arrays(scene)
+    shots = [(arrays.names[index], start, end) for index, start, end in arrays.intervals()]
+    duplicates = None
+    if scene.use_frame_dedup:
+        duplicates, reason = scene_duplicate_plan(scene, shots)
+        if duplicates is None:
+            logger.warning("Rendering every frame, the scene changes over time: %s", reason)
+        else:
+            log_saved_frames(duplicates)
+    if scene.shot_render_resume:
+        shots = resume_shots(scene, shots, duplicates)
+    elif duplicates is not None:
+        shots = list(duplicates.render_shots())
+    if scene.shot_render_adaptive:
+        chunks = plan_adaptive_chunks(
+            shots,
+            RenderHistory.load(render_history_path(scene)),
+            output_resolution_key(scene),
+            shot_render_workers(scene),
+            lambda camera: shot_output_path(scene, camera),
+        )
+    else:
+        chunks = []
+        for name, start, end in shots:
+            chunks.extend(split_shot(name, start, end, shot_output_path(scene, name), scene.shot_render_chunk_size))
+    attach_shot_plans(scene, chunks)
+    if scene.use_deliverables:
+        attach_deliverables(scene, chunks)
+    if duplicates is not None:
+        attach_duplicates(scene, chunks, duplicates)
+    return chunks
+
+def frame_outputs(scene, camera):
+    # Every output path prefix a frame of the shot is written to
+    outputs = [shot_output_path(scene, camera)]
+    if scene.use_deliverables:
+        outputs.extend(deliverable_output_path(scene, folder, camera) for folder, _size in scene_deliverables(scene))
+    return outputs
+
+def frame_extension(scene):
+    render = scene.render
+    return render.file_extension if render.use_file_extension else ""
+
+def attach_duplicates(scene, chunks, duplicates):
+    # The chunk rendering a frame also copies it to its identical frames, so
+    # local and farm renders materialize them the same way
+    extension = frame_extension(scene)
+    plan = {}
+    for camera, copies in duplicates.copies.items():
+        if not copies:
+            continue
+        outputs = frame_outputs(scene, camera)
+        plan[camera] = {
+            str(source): [
+                (frame_path(output, source, extension), frame_path(output, frame, extension))
+                for frame in frames for output in outputs
+            ]
+            for source, frames in copies.items()
+        }
+    if not plan:
+        return
+    path = os.path.join(bpy.path.abspath(scene.shot_render_output), DEDUP_FILENAME)
+    write_duplicates(path, plan)
+    for chunk in chunks:
+        copies = duplicates.copies.get(chunk.camera, {})
+        chunk.copies = [
+            (source, frame)
+            for source, frames in copies.items() if chunk.start <= source <= chunk.end
+            for frame in frames
+        ]
+        if chunk.copies:
+            chunk.extra["duplicates"] = path
+
+def attach_shot_plans(scene, chunks):
+    # Workers apply the culling and level of detail plans of their camera
+    # before rendering. The plans go through files as they can exceed the
+    # command line limit.
+    if not chunks or not (scene.use_shot_culling or scene.use_shot_lod):
+        return
+    started = time.perf_counter()
+    margin = scene.shot_culling_margin
+    resolution = output_resolution(scene)
+    if scene.use_deliverables:
+        # Masters see more than the output frame, at a higher pixel density
+        scale, resolution = analysis_view(scene)
+        margin = (1.0 + margin) * scale - 1.0
+    objects = shot_objects(scene)
+    analysis = analyze_shots(scene, objects, margin, resolution if scene.use_shot_lod else None)
+    output = bpy.path.abspath(scene.shot_render_output)
+    paths = {}
+    if scene.use_shot_culling:
+        paths["culling"] = os.path.join(output, CULLING_FILENAME)
+        write_plan(paths["culling"], culling_plan(objects, analysis))
+    if scene.use_shot_lod:
+        paths["lod"] = os.path.join(output, LOD_FILENAME)
+        write_plan(paths["lod"], scene_lod_plan(scene, objects, analysis))
+    for chunk in chunks:
+        chunk.extra.update(paths)
+    logger.info(
+        "Planned %s for %d shots and %d objects in %.1f ms",
+        " and ".join(paths), len(analysis), len(objects), (time.perf_counter() - started) * 1000.0,
+    )
+
+def record_render_history(scene, chunks):
+    history = RenderHistory.load(render_history_path(scene))
+    for chunk in chunks:
+        history.record_chunk(chunk)
+    history.save()
+
+class ExecutorModal:
+    # Runs a ShotRenderExecutor on a background thread and reports its events
+    # from a window manager timer, so the UI stays responsive. Subclasses call
+    # start_executor() and implement executor_finished(), and optionally
+    # chunk_finished() for every chunk that completes or fails.
+    _timer = None
+    _future = None
+    _executor = None
+    _events = None
+    _chunks = ()
+    _finished = 0
+
+    def start_executor(self, context, chunks, workers, retries):
+        self._chunks = chunks
+        self._events = queue.Queue()
+        self._finished = 0
+        self._executor = ShotRenderExecutor(
+            bpy.data.filepath,
+            blender=bpy.app.binary_path,
+            workers=workers,
+            retries=retries,
+            on_event=lambda kind, chunk: self._events.put((kind, chunk)),
+        )
+        # A future keeps whatever the executor raises, e.g. an OSError when
+        # the Blender binary cannot be started
+        runner = ThreadPoolExecutor(max_workers=1)
+        self._future = runner.submit(self._executor.run, self._chunks)
+        runner.shutdown(wait=False)
+
+        wm = context.window_manager
+        wm.progress_begin(0, len(self._chunks))
+        self._timer = wm.event_timer_add(0.5, window=context.window)
+        wm.modal_handler_add(self)
+        self.report({'INFO'}, f"Rendering {len(self._chunks)} chunks on {self._executor.workers} workers")
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            self._executor.cancel()
+            wait([self._future])
+            # Chunks that finished while cancelling still count
+            self._drain_events(context)
+            self._finish(context)
+            self.executor_finished(context, cancelled=True)
+            self.report({'WARNING'}, f"{self.bl_label} cancelled")
+            return {'CANCELLED'}
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+
+        # Checked before draining: once the executor is done, every event it
+        # posted is already queued and gets handled below
+        done = self._future.done()
+        self._drain_events(context)
+        if not done:
+            return {'PASS_THROUGH'}
+        self._finish(context)
+        error = self._future.exception()
+        if error is not None:
+            self._executor.cancel()
+            self.executor_finished(context, cancelled=True)
+            self.report({'ERROR'}, f"{self.bl_label} stopped: {error}")
+            logger.error("%s stopped", self.bl_label, exc_info=error)
+            return {'CANCELLED'}
+        self.executor_finished(context, cancelled=False)
+        return {'FINISHED'}
+
+    def _drain_events(self, context):
+        while not self._events.empty():
+            kind, chunk = self._events.get_nowait()
+            if kind == 'DONE':
+                self._finished += 1
+                self.report({'INFO'}, f"{chunk.label} done in {chunk.elapsed:.1f}s ({self._finished}/{len(self._chunks)})")
+                self.chunk_finished(context, chunk)
+            elif kind == 'RETRY':
+                self.report({'WARNING'}, f"{chunk.label} failed, retrying: {chunk.error}")
+            elif kind == 'FAILED':
+                self._finished += 1
+                self.report({'ERROR'}, f"{chunk.label} failed: {chunk.error}")
+                self.chunk_finished(context, chunk)
+        context.window_manager.progress_update(self._finished)
+
+    def _finish(self, context):
+        wm = context.window_manager
+        wm.event_timer_remove(self._timer)
+        wm.progress_end()
+
+    def chunk_finished(self, context, chunk):
+        pass
+
+    def executor_finished(self, context, cancelled):
+        pass
+
+class CINEMATOGRAPHY_OT_render_shots(ExecutorModal, Operator):
+    bl_idname = "cinematography.render_shots"
+    bl_label = "Render Shots"
+    bl_description = "Render every camera range in background Blender processes, in parallel"
+
+    @classmethod
+    def poll(cls, context):
+        return bool(bpy.data.filepath) and len(context.scene.camera_list) > 0
+
+    @timed
+    def invoke(self, context, event):
+        if bpy.data.is_dirty:
+            self.report({'WARNING'}, "Save the file first, workers render the saved .blend")
+            return {'CANCELLED'}
+        scene = context.scene
+        # Frozen now, the settings may be edited while the workers run
+        self._settings = manifest_settings(scene)
+        self._key = fingerprint(self._settings)
+        self._extension = frame_extension(scene)
+        chunks = plan_shot_chunks(scene)
+        # Loaded after planning, which may have refilled copies into it
+        self._manifest = RenderManifest.load(manifest_path(scene))
+        self._saved = time.monotonic()
+        if not chunks:
+            self.report({'INFO'} if scene.shot_render_resume else {'WARNING'}, (
+                "Every frame is already rendered with the current settings"
+                if scene.shot_render_resume else "No camera ranges to render"
+            ))
+            return {'CANCELLED'}
+        return self.start_executor(context, chunks, shot_render_workers(scene), scene.shot_render_retries)
+
+    def chunk_finished(self, context, chunk):
+        # Recorded as chunks finish and written every so often, so a crash of
+        # this Blender loses at most the last interval
+        record_manifest(self._manifest, [chunk], self._settings, self._key, self._extension)
+        if time.monotonic() - self._saved >= MANIFEST_SAVE_INTERVAL:
+            self._manifest.save()
+            self._saved = time.monotonic()
+
+    def executor_finished(self, context, cancelled):
+        record_render_history(context.scene, self._chunks)
+        # Finished chunks are already in; add what cancelled chunks got done
+        interrupted = [chunk for chunk in self._chunks if chunk.status not in {'DONE', 'FAILED'}]
+        record_manifest(self._manifest, interrupted, self._settings, self._key, self._extension)
+        self._manifest.save()
+        if cancelled:
+            return
+        summary = summarize(self._chunks)
+        self.report({'ERROR'} if summary["failed"] else {'INFO'}, (
+            f"Rendered {summary['frames']} frames in {summary['done']}/{summary['chunks']} chunks, "
+            + (f"copied {summary['copied']} identical frames, " if summary['copied'] else "")
+            + f"{summary['failed']} failed, {summary['render_time']:.1f}s total render time"
+        ))
+
+class CINEMATOGRAPHY_OT_export_render_plan(Operator, ExportHelper):
+    bl_idname = "cinematography.export_render_plan"
+    bl_label = "Export Render Plan"
+    bl_description = "Write the cost-balanced shot chunks to a JSON job file for farm submission"
+
+    filename_ext = ".json"
+    filter_glob: StringProperty(default="*.json", options={'HIDDEN'})
+
+    workers: IntProperty(
+        name="Workers",
+        description="Number of workers or farm nodes to balance the chunks across, 0 uses the scene setting",
+        default=0,
+        min=0
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return len(context.scene.camera_list) > 0
+
+    @timed
+    def execute(self, context):
+        scene = context.scene
+        workers = self.workers or shot_render_workers(scene)
+        chunks = plan_shot_chunks(scene)
+        job = write_job_file(self.filepath, chunks, workers, bpy.data.filepath, output_resolution_key(scene))
+        self.report({'INFO'}, (
+            f"Wrote {len(chunks)} chunks for {workers} workers to {self.filepath}, "
+            f"expected makespan {job['expected_makespan']:.1f}s"
+        ))
+        return {'FINISHED'}
+
+classes = (
+    CINEMATOGRAPHY_OT_render_shots,
+    CINEMATOGRAPHY_OT_export_render_plan,
+)
+
+def register():
+    register_properties(bpy.types.Scene, {
+        "shot_render_output": StringProperty(
+            name="Output",
+            description="Directory the shots are rendered to, one sub-folder per camera",
+            default="//shots/",
+            subtype='DIR_PATH'
+        ),
+        "shot_render_workers": IntProperty(
+            name="Workers",
+            description="Number of background Blender processes, 0 uses half the CPU cores",
+            default=0,
+            min=0,
+            max=256
+        ),
+        "shot_render_chunk_size": IntProperty(
+            name="Chunk Size",
+            description="Frames rendered by one worker process",
+            default=10,
+            min=1
+        ),
+        "shot_render_retries": IntProperty(
+            name="Retries",
+            description="How many times a failed chunk is rendered again",
+            default=1,
+            min=0,
+            max=10
+        ),
+        "shot_render_adaptive": BoolProperty(
+            name="Balance by Cost",
+            description="Size and order chunks from recorded per-frame render times so workers finish together",
+            default=True
+        ),
+        "shot_render_resume": BoolProperty(
+            name="Resume",
+            description=(
+                "Only render frames that are missing, or that the output manifest records with other "
+                "render settings"
+            ),
+            default=False
+        ),
+    })
+    register_classes(classes)
+
+def unregister():
+    unregister_classes(classes)
+    unregister_properties(bpy.types.Scene, (
+        "shot_render_output",
+        "shot_render_workers",
+        "shot_render_chunk_size",
+        "shot_render_retries",
+        "shot_render_adaptive",
+        "shot_render_resume",
+    ))
@@ -0,0 +1,160 @@
+import math
+import struct
+
+import numpy as np
+
+# Tile planning and the memory-mapped TIFF canvas the tiles are written into.
+# No bpy and no package-relative imports: worker.py imports this module from
+# inside background Blender processes.
+
+TIFF_SHORT = 3
+TIFF_LONG = 4
+TIFF_RATIONAL = 5
+TIFF_LONG8 = 16
+_TYPE_FORMAT = {TIFF_SHORT: "H", TIFF_LONG: "I", TIFF_RATIONAL: "II", TIFF_LONG8: "Q"}
+_TYPE_SIZE = {TIFF_SHORT: 2, TIFF_LONG: 4, TIFF_RATIONAL: 8, TIFF_LONG8: 8}
+
+def _split(length, parts):
+    edges = [round(i * length / parts) for i in range(parts + 1)]
+    return [(edges[i], edges[i + 1] - edges[i]) for i in range(parts)]
+
+def plan_tiles(width, height, budget_bytes, bytes_per_pixel):
+    # Returns (x, y, w, h) tiles in top-down pixel coordinates whose render
+    # buffers, bytes_per_pixel for every pass Blender keeps, each fit in
+    # budget_bytes.
+    max_pixels = max(1, budget_bytes // bytes_per_pixel)
+    count = max(1, math.ceil(width * height / max_pixels))
+    columns = min(width, max(1, round(math.sqrt(count * width / height))))
+    rows = math.ceil(count / columns)
+    while math.ceil(width / columns) * math.ceil(height / rows) > max_pixels:
+        if width / columns >= height / rows and columns < width:
+            columns += 1
+        elif rows < height:
+            rows += 1
+        else:
+            break
+    return [
+        (x, y, w, h)
+        for y, h in _split(height, rows)
+        for x, w in _split(width, columns)
+    ]
+
+def _border_edge(pixel, size):
+    # Blender truncates border * size back to pixels in single precision;
+    # half a pixel in, the float error can no longer land one pixel short
+    return min((pixel + 0.5) / size, 1.0)
+
+def tile_border(tile, width, height):
+    # Blender's render border is normalized with y pointing up
+    x, y, w, h = tile
+    return {
+        "min_x": _border_edge(x, width),
+        "max_x": _border_edge(x + w, width),
+        "min_y": _border_edge(height - y - h, height),
+        "max_y": _border_edge(height - y, height),
+    }
+
+def create_tiff_canvas(path, width, height, channels=4, bits=16, dpi=300):
+    # Writes an uncompressed, strip-organized TIFF header and returns the
+    # canvas spec describing where its pixel data lives. BigTIFF is used once
+    # the image no longer fits in 4 GiB.
+    itemsize = bits // 8
+    row_bytes = width * channels * itemsize
+    data_bytes = row_bytes * height
+    big = data_bytes + 65536 > 0xFFFFFFFF
+    rows_per_strip = max(1, min(height, (1 << 20) // row_bytes))
+    strips = math.ceil(height / rows_per_strip)
+    offset_type = TIFF_LONG8 if big else TIFF_LONG
+
+    entries = [
+        (256, TIFF_LONG, [width]),
+        (257, TIFF_LONG, [height]),
+        (258, TIFF_SHORT, [bits] * channels),
+        (259, TIFF_SHORT, [1]),
+        (262, TIFF_SHORT, [2 if channels >= 3 else 1]),
+        (273, offset_type, [0] * strips),
+        (277, TIFF_SHORT, [channels]),
+        (278, TIFF_LONG, [rows_per_strip]),
+        (279, offset_type, [0] * strips),
+        (282, TIFF_RATIONAL, [dpi, 1]),
+        (283, TIFF_RATIONAL, [dpi, 1]),
+        (284, TIFF_SHORT, [1]),
+        (296, TIFF_SHORT, [2]),
+    ]
+    if channels in (2, 4):
+        entries.append((338, TIFF_SHORT, [2]))
+
+    header_size, entry_size, count_size, inline_size = (16, 20, 8, 8) if big else (8, 12, 2, 4)
+    ifd_offset = header_size
+    extra_offset = ifd_offset + count_size + len(entries) * entry_size + (8 if big else 4)
+    extra = bytearray()
+    layout = []
+    for tag, kind, values in entries:
+        size = _TYPE_SIZE[kind] * (len(values) // 2 if kind == TIFF_RATIONAL else len(values))
+        if size <= inline_size:
+            layout.append(None)
+        else:
+            layout.append(extra_offset + len(extra))
+            extra += bytes(size + (size & 1))
+    data_offset = extra_offset + len(extra)
+    data_offset += -data_offset % 16
+
+    strip_offsets = [data_offset + i * rows_per_strip * row_bytes for i in range(strips)]
+    strip_counts = [min(rows_per_strip, height - i * rows_per_strip) * row_bytes for i in range(strips)]
+
+    with open(path, "wb") as f:
+        if big:
+            f.write(struct.pack("<2sHHHQ", b"II", 43, 8, 0, ifd_offset))
+        else:
+            f.write(struct.pack("<2sHI", b"II", 42, ifd_offset))
+        f.write(struct.pack("<Q" if big else "<H", len(entries)))
+        blobs = []
+        for (tag, kind, values), out_of_line in zip(entries, layout):
+            if tag == 273:
+                values = strip_offsets
+            elif tag == 279:
+                values = strip_counts
+            count = len(values) // 2 if kind == TIFF_RATIONAL else len(values)
+            packed = struct.pack("<" + _TYPE_FORMAT[kind][0] * len(values), *values)
+            if out_of_line is None:
+                value = packed.ljust(inline_size, b"\0")
+            else:
+                value = struct.pack("<Q" if big else "<I", out_of_line)
+                blobs.append((out_of_line, packed))
+            f.write(struct.pack("<HHQ" if big else "<HHI", tag, kind, count) + value)
+        f.write(struct.pack("<Q" if big else "<I", 0))
+        for position, packed in blobs:
+            f.seek(position)
+            f.write(packed)
+        f.truncate(data_offset + data_bytes)
+
+    return {
+        "path": path,
+        "offset": data_offset,
+        "width": width,
+        "height": height,
+        "channels": channels,
+        "dtype": "uint%d" % bits,
+    }
+
+def open_canvas(spec, mode="r+"):
+    return np.memmap(
+        spec["path"],
+        dtype=np.dtype(spec["dtype"]),
+        mode=mode,
+        offset=spec["offset"],
+        shape=(spec["height"], spec["width"], spec["channels"]),
+    )
+
+def paste_tile(spec, tile, pixels):
+    # pixels: float array (rows, columns, 4) in 0..1, top row first
+    x, y, w, h = tile
+    canvas = open_canvas(spec)
+    h = min(h, pixels.shape[0], spec["height"] - y)
+    w = min(w, pixels.shape[1], spec["width"] - x)
+    channels = spec["channels"]
+    scale = np.iinfo(canvas.dtype).max
+    block = np.clip(pixels[:h, :w, :channels], 0.0, 1.0) * scale + 0.5
+    canvas[y:y + h, x:x + w] = block.astype(canvas.dtype)
+    canvas.flush()
+    del canvas
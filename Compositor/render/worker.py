@@ -0,0 +1,228 @@
+# Runs inside a background Blender started by ShotRenderExecutor:
+#   blender -b file.blend --python worker.py -- '{"camera": ..., "start": ..., ...}'
+import json
+import os
+import sys
+import time
+
+import bpy
+
+# Runs as a plain script, so this mirrors executor.FRAME_TIME_PREFIX
+FRAME_TIME_PREFIX = "SCIBLEND_FRAME_TIME "
+_frame_started = {}
+
+def parse_chunk(argv):
+    args = argv[argv.index("--") + 1:] if "--" in argv else []
+    if not args:
+        raise SystemExit("worker.py expects a JSON chunk after '--'")
+    return json.loads(args[0])
+
+def _on_render_pre(scene, *args):
+    _frame_started[scene.frame_current] = time.perf_counter()
+
+def _on_render_post(scene, *args):
+    started = _frame_started.pop(scene.frame_current, None)
+    if started is None:
+        return
+    render = scene.render
+    scale = render.resolution_percentage / 100.0
+    timing = {
+        "frame": scene.frame_current,
+        "resolution": f"{int(render.resolution_x * scale)}x{int(render.resolution_y * scale)}",
+        "seconds": time.perf_counter() - started,
+    }
+    print(FRAME_TIME_PREFIX + json.dumps(timing), flush=True)
+
+def render_tile(chunk, scene):
+    import numpy as np
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import tiles
+
+    canvas = chunk["canvas"]
+    tile = chunk["tile"]
+    render = scene.render
+    border = tiles.tile_border(tile, canvas["width"], canvas["height"])
+    render.use_border = True
+    render.use_crop_to_border = True
+    render.border_min_x = border["min_x"]
+    render.border_max_x = border["max_x"]
+    render.border_min_y = border["min_y"]
+    render.border_max_y = border["max_y"]
+    settings = render.image_settings
+    settings.file_format = 'PNG'
+    settings.color_mode = 'RGBA'
+    settings.color_depth = '16' if canvas["dtype"] == "uint16" else '8'
+    render.use_file_extension = False
+    render.filepath = chunk["output"]
+    scene.frame_set(chunk["start"])
+    bpy.ops.render.render(write_still=True, scene=scene.name)
+
+    image = bpy.data.images.load(chunk["output"])
+    # Read back the stored display values, not a linearized copy
+    image.colorspace_settings.name = 'Non-Color'
+    width, height = image.size
+    pixels = np.empty(width * height * 4, dtype=np.float32)
+    image.pixels.foreach_get(pixels)
+    bpy.data.images.remove(image)
+    tiles.paste_tile(canvas, tile, pixels.reshape(height, width, 4)[::-1])
+    os.remove(chunk["output"])
+
+def apply_culling(chunk):
+    # Objects the shot's camera never sees, planned by the add-on
+    path = chunk.get("culling")
+    if not path:
+        return
+    with open(path, "r", encoding="utf-8") as f:
+        hidden = json.load(f).get(chunk["camera"], ())
+    for name in hidden:
+        obj = bpy.data.objects.get(name)
+        if obj is not None:
+            obj.hide_render = True
+
+def apply_lod(chunk):
+    # Reduced Decimate ratios and subdivision levels for the shot's camera.
+    # The worker never saves the file, so nothing needs restoring.
+    path = chunk.get("lod")
+    if not path:
+        return
+    with open(path, "r", encoding="utf-8") as f:
+        shot = json.load(f).get(chunk["camera"], {})
+    for name, modifiers in shot.items():
+        obj = bpy.data.objects.get(name)
+        if obj is None:
+            continue
+        for modifier_name, values in modifiers.items():
+            modifier = obj.modifiers.get(modifier_name)
+            if modifier is None:
+                continue
+            for attribute, value in values.items():
+                setattr(modifier, attribute, value)
+
+def apply_master(chunk, scene, camera_obj):
+    # The master frame every deliverable of the shot is cut from
+    master = chunk.get("master")
+    if not master:
+        return
+    render = scene.render
+    render.resolution_x, render.resolution_y = master["resolution"]
+    render.resolution_percentage = 100
+    render.pixel_aspect_x = render.pixel_aspect_y = 1.0
+    scale = 1.0 + master["overscan"]
+    if scale != 1.0:
+        # A larger sensor widens the view like a shorter lens would, and keeps
+        # working when the lens is animated. Shift is relative to the view.
+        camera = camera_obj.data
+        camera.sensor_width *= scale
+        camera.sensor_height *= scale
+        camera.ortho_scale *= scale
+        camera.shift_x /= scale
+        camera.shift_y /= scale
+
+def save_pixels(pixels, path, file_format, is_float):
+    import numpy as np
+
+    height, width, channels = pixels.shape
+    rgba = np.ones((height, width, 4), dtype=np.float32)
+    rgba[..., :3] = pixels[..., :3] if channels >= 3 else pixels[..., :1]
+    if channels == 4:
+        rgba[..., 3] = pixels[..., 3]
+    image = bpy.data.images.new("Deliverable", width, height, alpha=channels == 4, float_buffer=is_float)
+    # Stored values are written back as they are, like the master was read
+    image.colorspace_settings.name = 'Non-Color'
+    image.pixels.foreach_set(rgba.ravel())
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    image.filepath_raw = path
+    image.file_format = file_format
+    image.save()
+    bpy.data.images.remove(image)
+
+def derive_deliverables(chunk, scene):
+    # Cuts every deliverable out of each master frame, one frame in memory
+    # at a time
+    deliverables = chunk.get("deliverables")
+    if not deliverables:
+        return
+    import numpy as np
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import derive
+    import frame_cache
+
+    render = scene.render
+    extension = render.file_extension if render.use_file_extension else ""
+    count = 0
+    for frame in range(chunk["start"], chunk["end"] + 1):
+        source = frame_cache.frame_path(chunk["output"], frame, extension)
+        if not os.path.exists(source):
+            continue
+        image = bpy.data.images.load(source)
+        image.colorspace_settings.name = 'Non-Color'
+        width, height = image.size
+        channels = image.channels
+        pixels = np.empty(width * height * channels, dtype=np.float32)
+        image.pixels.foreach_get(pixels)
+        file_format, is_float = image.file_format, image.is_float
+        bpy.data.images.remove(image)
+        pixels = pixels.reshape(height, width, channels)
+        for deliverable in deliverables:
+            result = derive.crop_resample(pixels, deliverable["crop"], deliverable["size"])
+            save_pixels(result, frame_cache.frame_path(deliverable["output"], frame, extension), file_format, is_float)
+            count += 1
+    print(f"Derived {count} deliverable frames", flush=True)
+
+def clear_outputs(chunk, scene):
+    # Drops the files this chunk renders over, master and derived alike, so
+    # a frame that was a copy before is never written through to another file
+    render = scene.render
+    if not render.use_overwrite:
+        return
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import frame_cache
+
+    extension = render.file_extension if render.use_file_extension else ""
+    outputs = [chunk["output"]] + [deliverable["output"] for deliverable in chunk.get("deliverables", ())]
+    frame_cache.clear_frames(outputs, chunk["start"], chunk["end"], extension)
+
+def copy_duplicates(chunk, scene):
+    # Frames planned as identical to a frame this chunk rendered
+    path = chunk.get("duplicates")
+    if not path:
+        return
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import frame_cache
+
+    count = frame_cache.materialize_duplicates(path, chunk["camera"], chunk["start"], chunk["end"])
+    print(f"Copied {count} identical frame files", flush=True)
+
+def render_chunk(chunk):
+    scene = bpy.context.scene
+    camera_obj = bpy.data.objects.get(chunk["camera"])
+    if camera_obj is None or camera_obj.type != 'CAMERA':
+        raise SystemExit(f"Camera not found: {chunk['camera']}")
+    if hasattr(scene, "use_shot_switching"):
+        scene.use_shot_switching = False
+    scene.camera = camera_obj
+    if "tile" in chunk:
+        render_tile(chunk, scene)
+        return
+    apply_culling(chunk)
+    apply_lod(chunk)
+    apply_master(chunk, scene, camera_obj)
+    scene.frame_start = chunk["start"]
+    scene.frame_end = chunk["end"]
+    scene.render.filepath = chunk["output"]
+    clear_outputs(chunk, scene)
+    bpy.app.handlers.render_pre.append(_on_render_pre)
+    bpy.app.handlers.render_post.append(_on_render_post)
+    bpy.ops.render.render(animation=True, scene=scene.name)
+    derive_deliverables(chunk, scene)
+    copy_duplicates(chunk, scene)
+
+def main():
+    try:
+        render_chunk(parse_chunk(sys.argv))
+    except SystemExit as e:
+        print(str(e), file=sys.stderr)
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,11 @@
 from . import cinematography_panel
+from . import debug_panel
+from ..registration import register_modules, unregister_modules
+
+modules = (cinematography_panel, debug_panel)
 
 def register():
-    cinematography_panel.register()
+    register_modules(modules)
 
 def unregister():
-    cinematography_panel.unregister()
\ No newline at end of file
+    unregister_modules(modules)
@@ -1,5 +1,10 @@
 import bpy
-from bpy_extras.object_utils import world_to_camera_view
+from ..cinematography.camera_manager import list_item_camera
+from ..cinematography import presets
+from ..render.deliverables import camera_master_plan, scene_deliverables
+from ..render.estimate import estimate_presets, estimate_scene, format_bytes, format_seconds
+from ..profiling import timed
+from ..registration import register_classes, register_properties, unregister_classes, unregister_properties
 
 class COMPOSITOR_PT_panel(bpy.types.Panel):
     bl_label = "Compositor"
@@ -8,6 +13,7 @@ class COMPOSITOR_PT_panel(bpy.types.Panel):
     bl_region_type = 'UI'
     bl_category = 'Compositor'
 
+    @timed
     def draw(self, context):
         layout = self.layout
         scene = context.scene
@@ -30,6 +36,10 @@ class COMPOSITOR_PT_panel(bpy.types.Panel):
             
             self.draw_clip_settings(context, box)
 
+            row = box.row(align=True)
+            row.operator("cinematography.frame_selection", icon='ZOOM_SELECTED')
+            row.operator("cinematography.frame_selection", text="All Cameras").all_cameras = True
+
         box = layout.box()
         row = box.row()
         row.prop(context.scene, "show_camera_manager", icon="TRIA_DOWN" if context.scene.show_camera_manager else "TRIA_RIGHT", icon_only=True, emboss=False)
@@ -40,12 +50,22 @@ class COMPOSITOR_PT_panel(bpy.types.Panel):
 
         self.draw_output_resolution(context, layout)
 
+        box = layout.box()
+        row = box.row()
+        row.prop(context.scene, "show_shot_render", icon="TRIA_DOWN" if context.scene.show_shot_render else "TRIA_RIGHT", icon_only=True, emboss=False)
+        row.label(text="Shot Render")
+
+        if context.scene.show_shot_render:
+            self.draw_shot_render(context, box)
+
     def draw_output_resolution(self, context, layout):
         box = layout.box()
         box.label(text="Output Resolution")
 
         self.draw_render_resolution(context, box)
 
+        self.draw_render_estimate(context, box)
+
         self.draw_print_resolution(context, layout)
 
     def draw_camera_manager(self, context, layout):
@@ -61,15 +81,21 @@ class COMPOSITOR_PT_panel(bpy.types.Panel):
         col.operator("camera.move_in_list", icon='TRIA_DOWN', text="").direction = 'DOWN'
         col.separator()
         col.operator("camera.sort_list", icon='SORTALPHA', text="")
+        col.operator("cinematography.generate_camera_rig", icon='OUTLINER_OB_CAMERA', text="")
+        col.operator("cinematography.import_trajectory", icon='IMPORT', text="")
 
         row = layout.row()
         row.operator("camera.update_timeline", text="Update Timeline")
         row.operator("camera.erase_all_keyframes", text="Erase All Keyframes")
+        row = layout.row()
+        row.operator("cinematography.bake_edit_camera", icon='REC')
+
+        row = layout.row()
+        row.prop(scene, "use_shot_switching")
 
         if scene.camera_list and scene.camera_list_index >= 0:
-            camera_item = scene.camera_list[scene.camera_list_index]
-            camera_obj = bpy.data.objects.get(camera_item.name)
-            if camera_obj and camera_obj.type == 'CAMERA':
+            camera_obj = list_item_camera(scene.camera_list[scene.camera_list_index])
+            if camera_obj is not None:
                 box = layout.box()
                 row = box.row()
                 row.prop(camera_obj, "name")
@@ -80,6 +106,57 @@ class COMPOSITOR_PT_panel(bpy.types.Panel):
                 row = box.row()
                 row.operator("camera.view_selected", text="View Camera")
 
+    def draw_shot_render(self, context, layout):
+        scene = context.scene
+        layout.prop(scene, "shot_render_output")
+        row = layout.row(align=True)
+        row.prop(scene, "shot_render_workers")
+        row.prop(scene, "shot_render_chunk_size")
+        row.prop(scene, "shot_render_retries")
+        row = layout.row()
+        row.prop(scene, "shot_render_adaptive")
+        row.prop(scene, "shot_render_resume")
+        row = layout.row(align=True)
+        row.prop(scene, "use_shot_culling")
+        row.operator("cinematography.analyze_shot_culling", text="", icon='VIEWZOOM')
+        if scene.use_shot_culling:
+            layout.prop(scene, "shot_culling_margin")
+        row = layout.row(align=True)
+        row.prop(scene, "use_shot_lod")
+        row.operator("cinematography.analyze_shot_lod", text="", icon='VIEWZOOM')
+        if scene.use_shot_lod:
+            row = layout.row(align=True)
+            row.prop(scene, "shot_lod_full_detail")
+            row.prop(scene, "shot_lod_min_factor")
+        self.draw_deliverables(context, layout)
+        row = layout.row(align=True)
+        row.prop(scene, "use_frame_dedup")
+        row.operator("cinematography.analyze_duplicate_frames", text="", icon='VIEWZOOM')
+        row = layout.row(align=True)
+        row.operator("cinematography.render_shots", icon='RENDER_ANIMATION')
+        row.operator("cinematography.export_render_plan", icon='EXPORT', text="")
+
+    def draw_deliverables(self, context, layout):
+        scene = context.scene
+        row = layout.row(align=True)
+        row.prop(scene, "use_deliverables")
+        row.operator("cinematography.add_deliverable", text="", icon='ADD')
+        if not scene.use_deliverables:
+            return
+        col = layout.column(align=True)
+        for index, item in enumerate(scene.deliverables):
+            row = col.row(align=True)
+            row.prop(item, "enabled", text="")
+            row.prop(item, "preset", text="")
+            row.prop(item, "orientation", text="")
+            row.operator("cinematography.remove_deliverable", text="", icon='X').index = index
+        layout.prop(scene, "deliverable_overscan")
+        camera_obj = scene.camera
+        deliverables = scene_deliverables(scene)
+        if camera_obj is not None and camera_obj.type == 'CAMERA' and deliverables:
+            (width, height), _crops = camera_master_plan(scene, camera_obj, deliverables)
+            layout.label(text=f"Master {width}x{height} for {len(deliverables)} formats", icon='INFO')
+
     def draw_perspective_settings(self, context, layout):
         camera = context.scene.camera
         if camera and camera.type == 'CAMERA':
@@ -110,6 +187,20 @@ class COMPOSITOR_PT_panel(bpy.types.Panel):
         row = layout.row()
         row.prop(context.scene, "resolution_linked", text="Link Resolution")
 
+    def draw_render_estimate(self, context, layout):
+        scene = context.scene
+        estimate = estimate_scene(scene)
+        text = f"Estimate: {estimate.width}x{estimate.height}, {format_bytes(estimate.bytes)}"
+        if estimate.seconds is not None:
+            text += f", ~{format_seconds(estimate.seconds)}/frame"
+        layout.label(text=text, icon='ERROR' if estimate.over_budget else 'INFO')
+        if estimate.over_budget:
+            col = layout.column(align=True)
+            col.label(text=f"Over the {format_bytes(estimate.budget_bytes)} budget: use Tiled Print Render")
+            col.label(text=f"or render at {estimate.max_percentage}% or less")
+            col.prop(scene.render, "resolution_percentage")
+        layout.prop(scene, "render_memory_budget")
+
     def draw_print_resolution(self, context, layout):
         layout.separator()
 
@@ -120,10 +211,14 @@ class COMPOSITOR_PT_panel(bpy.types.Panel):
 
         if context.scene.show_cinema_formats:
             col = box.column(align=True)
-            for item in context.scene.bl_rna.properties["cinema_format"].enum_items:
-                op = col.operator("cinematography.set_cinema_resolution", text=item.name)
+            registry = presets.registry()
+            estimates = estimate_presets(context.scene, registry.cinema_sizes[context.scene.resolution_orientation])
+            for identifier, name, _description, _number in registry.cinema_items:
+                estimate = estimates[identifier]
+                icon = 'ERROR' if estimate.over_budget else 'NONE'
+                op = col.operator("cinematography.set_cinema_resolution", text=f"{name} ({format_bytes(estimate.bytes)})", icon=icon)
                 if op:
-                    op.format = item.identifier
+                    op.format = identifier
 
         box = layout.box()
         row = box.row()
@@ -132,10 +227,17 @@ class COMPOSITOR_PT_panel(bpy.types.Panel):
 
         if context.scene.show_print_formats:
             col = box.column(align=True)
-            for item in context.scene.bl_rna.properties["print_format"].enum_items:
-                op = col.operator("cinematography.set_print_resolution", text=item.name)
+            registry = presets.registry()
+            estimates = estimate_presets(
+                context.scene,
+                registry.print_sizes(context.scene.print_dpi, context.scene.resolution_orientation),
+            )
+            for identifier, name, _description, _number in registry.print_items:
+                estimate = estimates[identifier]
+                icon = 'ERROR' if estimate.over_budget else 'NONE'
+                op = col.operator("cinematography.set_print_resolution", text=f"{name} ({format_bytes(estimate.bytes)})", icon=icon)
                 if op:
-                    op.format = item.identifier
+                    op.format = identifier
 
         row = layout.row()
         row.prop(context.scene, "frame_rate")
@@ -146,46 +248,40 @@ class COMPOSITOR_PT_panel(bpy.types.Panel):
         row = layout.row()
         row.prop(context.scene, "print_dpi")
 
+        box = layout.box()
+        box.label(text="Tiled Print Render")
+        box.prop(context.scene, "print_render_output")
+        row = box.row(align=True)
+        row.prop(context.scene, "print_tile_memory")
+        row.prop(context.scene, "print_bit_depth", text="")
+        box.operator("cinematography.render_print_tiled", icon='RENDER_STILL')
+
 def register():
-    print("Registering COMPOSITOR_PT_panel")
-    bpy.types.Scene.show_cinema_formats = bpy.props.BoolProperty(
-        name="Show Cinema Formats",
-        default=False
-    )
-    bpy.types.Scene.show_print_formats = bpy.props.BoolProperty(
-        name="Show Print Formats",
-        default=False
-    )
-    if not hasattr(bpy.types.Scene, "camera_type"):
-        bpy.types.Scene.camera_type = bpy.props.EnumProperty(
-            items=[
-                ('PERSP', "Perspective", "Perspective camera"),
-                ('ORTHO', "Orthographic", "Orthographic camera")
-            ],
-            name="Camera Type",
-            default='PERSP',
-            update=lambda self, context: bpy.ops.cinematography.set_camera_type(camera_type=self.camera_type)
-        )
-    bpy.types.Scene.show_camera_manager = bpy.props.BoolProperty(
-        name="Show Camera Manager",
-        default=False
-    )
-    try:
-        bpy.utils.register_class(COMPOSITOR_PT_panel)
-    except Exception as e:
-        print(f"Error registering COMPOSITOR_PT_panel: {str(e)}")
+    register_properties(bpy.types.Scene, {
+        "show_cinema_formats": bpy.props.BoolProperty(
+            name="Show Cinema Formats",
+            default=False
+        ),
+        "show_print_formats": bpy.props.BoolProperty(
+            name="Show Print Formats",
+            default=False
+        ),
+        "show_camera_manager": bpy.props.BoolProperty(
+            name="Show Camera Manager",
+            default=False
+        ),
+        "show_shot_render": bpy.props.BoolProperty(
+            name="Show Shot Render",
+            default=False
+        ),
+    })
+    register_classes((COMPOSITOR_PT_panel,))
 
 def unregister():
-    print("Unregistering COMPOSITOR_PT_panel")  
-    if hasattr(bpy.types.Scene, "camera_type"):
-        del bpy.types.Scene.camera_type
-    if hasattr(bpy.types.Scene, "show_camera_manager"):
-        del bpy.types.Scene.show_camera_manager
-    if hasattr(bpy.types.Scene, "show_cinema_formats"):
-        del bpy.types.Scene.show_cinema_formats
-    if hasattr(bpy.types.Scene, "show_print_formats"):
-        del bpy.types.Scene.show_print_formats
-    try:
-        bpy.utils.unregister_class(COMPOSITOR_PT_panel)
-    except Exception as e:
-        print(f"Error unregistering COMPOSITOR_PT_panel: {str(e)}")
\ No newline at end of file
+    unregister_classes((COMPOSITOR_PT_panel,))
+    unregister_properties(bpy.types.Scene, (
+        "show_camera_manager",
+        "show_cinema_formats",
+        "show_print_formats",
+        "show_shot_render",
+    ))
@@ -0,0 +1,101 @@
+import bpy
+from bpy.types import Operator, Panel
+from bpy_extras.io_utils import ExportHelper
+
+from ..profiling import LOG_LEVELS, export_stats, registration_snapshot, reset_stats, set_log_level, stats_snapshot
+from ..registration import register_classes, register_properties, unregister_classes, unregister_properties
+
+# Rows shown in the panel, the JSON export has all of them
+DEBUG_ROWS = 15
+
+# Unlike every other operator, the two below are not @timed: they act on the
+# timings themselves, and a reset would otherwise leave its own entry behind
+
+class CINEMATOGRAPHY_OT_export_profile(Operator, ExportHelper):
+    bl_idname = "cinematography.export_profile"
+    bl_label = "Export Timings"
+    bl_description = "Write the collected callback timings to a JSON file"
+
+    filename_ext = ".json"
+    filter_glob: bpy.props.StringProperty(default="*.json", options={'HIDDEN'})
+
+    def execute(self, context):
+        export_stats(self.filepath)
+        self.report({'INFO'}, f"Wrote timings to {self.filepath}")
+        return {'FINISHED'}
+
+class CINEMATOGRAPHY_OT_reset_profile(Operator):
+    bl_idname = "cinematography.reset_profile"
+    bl_label = "Reset Timings"
+    bl_description = "Forget the collected callback timings"
+
+    def execute(self, context):
+        reset_stats()
+        return {'FINISHED'}
+
+class COMPOSITOR_PT_debug(Panel):
+    bl_label = "Debug"
+    bl_idname = "COMPOSITOR_PT_debug"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = 'Compositor'
+    bl_parent_id = "COMPOSITOR_PT_panel"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(context.window_manager, "compositor_log_level")
+
+        rows = stats_snapshot()
+        if not rows:
+            layout.label(text="No timings collected yet")
+        else:
+            col = layout.column(align=True)
+            header = col.row()
+            header.label(text="Callback")
+            header.label(text="Calls")
+            header.label(text="Total ms")
+            header.label(text="p95 ms")
+            for name, stats in rows[:DEBUG_ROWS]:
+                row = col.row()
+                row.label(text=name)
+                row.label(text=str(stats["count"]))
+                row.label(text=f"{stats['total_ms']:.1f}")
+                row.label(text=f"{stats['p95_ms']:.2f}")
+
+        registration = registration_snapshot()
+        if registration:
+            col = layout.column(align=True)
+            col.label(text="Registration")
+            for module, milliseconds in registration[:DEBUG_ROWS]:
+                row = col.row()
+                row.label(text=module)
+                row.label(text=f"{milliseconds:.2f} ms")
+
+        row = layout.row(align=True)
+        row.operator("cinematography.export_profile", icon='EXPORT')
+        row.operator("cinematography.reset_profile", icon='X')
+
+def update_log_level(self, context):
+    set_log_level(self.compositor_log_level)
+
+classes = (
+    CINEMATOGRAPHY_OT_export_profile,
+    CINEMATOGRAPHY_OT_reset_profile,
+    COMPOSITOR_PT_debug,
+)
+
+def register():
+    register_properties(bpy.types.WindowManager, {
+        "compositor_log_level": bpy.props.EnumProperty(
+            name="Log Level",
+            items=[(level, level.title(), f"Log {level.lower()} messages and above") for level in LOG_LEVELS],
+            default='WARNING',
+            update=update_log_level
+        ),
+    })
+    register_classes(classes)
+
+def unregister():
+    unregister_classes(classes)
+    unregister_properties(bpy.types.WindowManager, ("compositor_log_level",))
@@ -0,0 +1,139 @@
+# Minimal stand-ins for bpy, mathutils and bpy_extras so the add-on package
+# can be imported by a plain Python interpreter. Only module level names are
+# provided: property definitions return None, registration is a no-op and
+# anything else is a permissive placeholder. Scene data is modelled with
+# FakeScene. Use it for the bpy-free core and for adapters that only touch
+# plain attributes, never as a replacement for running inside Blender.
+import os
+import sys
+import types
+
+class Placeholder:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __getattr__(self, name):
+        return Placeholder()
+
+    def __call__(self, *args, **kwargs):
+        return Placeholder()
+
+def _property(*args, **kwargs):
+    return None
+
+def _register_class(cls):
+    cls.is_registered = True
+
+def _unregister_class(cls):
+    cls.is_registered = False
+
+def _extension_path_user(package, path="", create=False):
+    raise ValueError("not an extension")
+
+def _user_resource(resource_type, path=""):
+    # A directory that does not exist, so no user presets are found
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), ".stub_user", path)
+
+class Timers:
+    def __init__(self):
+        self.functions = []
+
+    def register(self, function, first_interval=0.0, persistent=False):
+        self.functions.append(function)
+
+    def unregister(self, function):
+        self.functions.remove(function)
+
+    def is_registered(self, function):
+        return function in self.functions
+
+def _module(name, **attributes):
+    module = types.ModuleType(name)
+    module.__dict__.update(attributes)
+    sys.modules[name] = module
+    return module
+
+def install():
+    if "bpy" in sys.modules:
+        return sys.modules["bpy"]
+    base_types = {
+        name: type(name, (), {})
+        for name in ("ID", "Object", "Scene", "WindowManager", "Operator", "Panel", "UIList", "PropertyGroup", "Menu")
+    }
+    bpy_types = _module("bpy.types", **base_types)
+    bpy_props = _module("bpy.props", **{
+        name: _property
+        for name in (
+            "BoolProperty", "CollectionProperty", "EnumProperty", "FloatProperty", "FloatVectorProperty",
+            "IntProperty", "IntVectorProperty", "PointerProperty", "StringProperty",
+        )
+    })
+    handlers = _module("bpy.app.handlers", persistent=lambda function: function, **{
+        name: []
+        for name in (
+            "depsgraph_update_post", "frame_change_post", "frame_change_pre", "load_post",
+            "redo_post", "render_post", "render_pre", "save_pre", "undo_post",
+        )
+    })
+    app = _module(
+        "bpy.app",
+        handlers=handlers,
+        timers=Timers(),
+        version=(4, 2, 0),
+        version_string="stub",
+        background=True,
+        binary_path="blender",
+    )
+    bpy = _module(
+        "bpy",
+        types=bpy_types,
+        props=bpy_props,
+        app=app,
+        utils=types.SimpleNamespace(
+            register_class=_register_class,
+            unregister_class=_unregister_class,
+            extension_path_user=_extension_path_user,
+            user_resource=_user_resource,
+        ),
+        msgbus=Placeholder(),
+        ops=Placeholder(),
+        data=Placeholder(),
+        context=Placeholder(),
+        path=Placeholder(),
+    )
+    _module("mathutils", Vector=tuple, Matrix=Placeholder)
+    io_utils = _module(
+        "bpy_extras.io_utils",
+        ExportHelper=type("ExportHelper", (), {}),
+        ImportHelper=type("ImportHelper", (), {}),
+    )
+    object_utils = _module("bpy_extras.object_utils", world_to_camera_view=Placeholder())
+    _module("bpy_extras", io_utils=io_utils, object_utils=object_utils)
+    return bpy
+
+class FakeRender:
+    def __init__(self):
+        self.resolution_x = 1920
+        self.resolution_y = 1080
+        self.fps = 24
+
+class FakeScene:
+    # The scene properties the resolution adapters read and write, with a
+    # write counter so cases can check redundant RNA updates
+    def __init__(self, **values):
+        self.__dict__["writes"] = 0
+        self.render = FakeRender()
+        self.custom_resolution_x = 1920
+        self.custom_resolution_y = 1080
+        self.aspect_ratio = 1920 / 1080
+        self.resolution_linked = False
+        self.last_updated = 'Y'
+        self.__dict__.update(values)
+        self.__dict__["writes"] = 0
+
+    def __setattr__(self, name, value):
+        self.__dict__["writes"] += 1
+        self.__dict__[name] = value
+
+    def as_pointer(self):
+        return id(self)
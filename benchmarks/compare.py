@@ -0,0 +1,46 @@
+import argparse
+import json
+import sys
+
+# Compares two benchmark result files; runs in plain Python or inside
+# Blender (run.py --baseline).
+
+DEFAULT_TOLERANCE = 0.25
+
+def load(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def compare(baseline, current, tolerance=DEFAULT_TOLERANCE):
+    rows = []
+    for name, result in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            rows.append((name, None, result["median_ms"], None, "new"))
+            continue
+        ratio = result["median_ms"] / base["median_ms"] if base["median_ms"] else float("inf")
+        status = "regression" if ratio > 1.0 + tolerance else "improved" if ratio < 1.0 - tolerance else "ok"
+        rows.append((name, base["median_ms"], result["median_ms"], ratio, status))
+    return rows
+
+def format_rows(rows):
+    lines = [f"{'benchmark':60} {'baseline':>10} {'current':>10} {'ratio':>7}  status"]
+    for name, base, current, ratio, status in rows:
+        base_text = f"{base:10.3f}" if base is not None else f"{'-':>10}"
+        ratio_text = f"{ratio:7.2f}" if ratio is not None else f"{'-':>7}"
+        lines.append(f"{name:60} {base_text} {current:10.3f} {ratio_text}  {status}")
+    return "\n".join(lines)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Flag benchmark regressions against a stored baseline")
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="allowed slowdown of the median, as a fraction (default %(default)s)")
+    args = parser.parse_args(argv)
+    rows = compare(load(args.baseline), load(args.current), args.tolerance)
+    print(format_rows(rows))
+    return 1 if any(row[4] == "regression" for row in rows) else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
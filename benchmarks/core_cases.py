@@ -0,0 +1,551 @@
+# Randomized planning and validation cases for Compositor.core, run by a plain
+# Python interpreter through the bpy stub:
+#   python benchmarks/core_cases.py --cases 2000 [--profile]
+# Every case is checked against a brute-force model; the run exits non-zero
+# on the first mismatch.
+import argparse
+import cProfile
+import os
+import pstats
+import random
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BENCH_DIR)
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+import bpy_stub
+
+bpy_stub.install()
+
+from Compositor.cinematography.render_settings import resolution_transaction
+from Compositor.render import derive, tiles
+from Compositor.render.manifest import RenderManifest, fingerprint
+import numpy as np
+
+from Compositor.core import baking, culling, dedup, deliverables, framing, lens, lod, markers, resolution, rigs, shots, trajectory
+
+def random_rows(rng, count, span=500, invalid=0.1, shortest=-5):
+    # shortest < 0 also produces empty ranges (end before start)
+    rows = []
+    for index in range(count):
+        start = rng.randint(1, span)
+        rows.append((f"Camera.{index:03d}", start, start + rng.randint(shortest, 80), rng.random() >= invalid))
+    return rows
+
+def case_shot_table(rng):
+    arrays = shots.ShotArrays(random_rows(rng, rng.randint(0, 40)))
+    intervals = list(arrays.intervals())
+    table = shots.ShotTable(intervals)
+    for frame in range(0, 600):
+        best = None
+        for order, (key, start, end) in enumerate(intervals):
+            if start <= frame <= end and (best is None or (start, order) >= best[:2]):
+                best = (start, order, key)
+        expected = best[2] if best is not None else None
+        assert table.shot_at(frame) == expected, (frame, table.shot_at(frame), expected)
+
+def apply_moves(items, moves):
+    # collection.move() on a plain list
+    items = list(items)
+    for from_index, to_index in moves:
+        items.insert(to_index, items.pop(from_index))
+    return items
+
+def case_minimal_moves(rng):
+    count = rng.randint(0, 60)
+    order = list(range(count))
+    rng.shuffle(order)
+    moves = shots.minimal_moves(order)
+    assert apply_moves(range(count), moves) == order
+    rank = [0] * count
+    for position, index in enumerate(order):
+        rank[index] = position
+    assert len(moves) == count - len(shots._longest_increasing_run(rank))
+
+def case_masks(rng):
+    rows = random_rows(rng, rng.randint(0, 30), span=200, shortest=0)
+    arrays = shots.ShotArrays(rows)
+    valid = [i for i, row in enumerate(rows) if row[3]]
+    frame = rng.randint(0, 250)
+    overlapping = shots.overlapping_mask(arrays).tolist()
+    covering = shots.covering_mask(arrays, frame).tolist()
+    gap_after = shots.gap_after_mask(arrays).tolist()
+    for i, (_name, start, end, is_valid) in enumerate(rows):
+        if not is_valid:
+            assert not (overlapping[i] or covering[i] or gap_after[i])
+            continue
+        others = [rows[j] for j in valid if j != i]
+        assert overlapping[i] == any(s <= end and start <= e for _n, s, e, _v in others)
+        assert covering[i] == (start <= frame <= end)
+        covered = any(s <= end + 1 <= e for _n, s, e, _v in others)
+        later = any(s > end for _n, s, e, _v in others)
+        assert gap_after[i] == (not covered and later), (rows[i], rows)
+
+def case_markers(rng):
+    cameras = [(key, name, start, max(start, end)) for key, (name, start, end, _v) in enumerate(random_rows(rng, rng.randint(0, 12)))]
+    timeline = []
+    for _ in range(rng.randint(0, 30)):
+        key, name, start, end = rng.choice(cameras) if cameras and rng.random() < 0.8 else (None, "Other", 0, 0)
+        if key is not None and rng.random() < 0.2:
+            # The user's own marker bound to a shot camera
+            name = "take2"
+        suffix = rng.choice(markers.MARKER_SUFFIXES + ("",))
+        timeline.append((name + suffix, rng.randint(0, 600), key))
+    foreign = [marker for marker in timeline if marker[2] is not None and marker[0].startswith("take2")]
+    plans, stale, kept = markers.plan_timeline_markers(cameras, timeline)
+
+    # Apply the plan the way the adapter does and plan again: nothing to do
+    result = [list(marker) for marker in timeline]
+    for key, plan in plans:
+        for slot, name, frame, create in plan:
+            if create:
+                result.append([name, frame, key])
+            else:
+                result[kept[key][slot]][:2] = [name, frame]
+    result = [marker for i, marker in enumerate(result) if i not in set(stale)]
+    plans, stale, _kept = markers.plan_timeline_markers(cameras, [tuple(marker) for marker in result])
+    assert not stale and all(not plan for _key, plan in plans), (plans, stale)
+    names = {key: markers.marker_names(name) for key, name, _start, _end in cameras}
+    bound = [m for m in result if m[2] is not None and m[0] in names[m[2]]]
+    assert len(bound) == 2 * len(cameras)
+    # Foreign markers survive untouched, even when named "_start"/"_end"
+    assert sorted(foreign) == sorted(tuple(m) for m in result if m[0].startswith("take2"))
+
+    # A renamed camera keeps its markers when its previous names are known
+    if cameras:
+        key, name, start, end = cameras[0]
+        renamed = [(key, name + "_renamed", start, end)] + cameras[1:]
+        plans, stale, kept = markers.plan_timeline_markers(
+            renamed, [tuple(marker) for marker in result], {key: [markers.marker_names(name)]},
+        )
+        assert not stale and all(not create for _slot, _name, _frame, create in plans[0][1])
+
+def case_resolution(rng):
+    linked = rng.random() < 0.7
+    scene = bpy_stub.FakeScene(resolution_linked=linked)
+    axis = rng.choice(('X', 'Y'))
+    value = rng.randint(4, 8192)
+    with resolution_transaction(scene) as transaction:
+        setattr(scene, "custom_resolution_" + axis.lower(), value)
+        transaction.touch(axis)
+    if linked and axis == 'X':
+        assert scene.custom_resolution_y == int(value / (1920 / 1080))
+    elif linked:
+        assert scene.custom_resolution_x == int(value * (1920 / 1080))
+    assert (scene.render.resolution_x, scene.render.resolution_y) == (scene.custom_resolution_x, scene.custom_resolution_y)
+    assert scene.last_updated == axis
+
+    # Committing the same state again writes nothing
+    scene.__dict__["writes"] = 0
+    with resolution_transaction(scene):
+        pass
+    assert scene.writes == 0, scene.writes
+
+    width, height = resolution.print_pixels(rng.uniform(10, 1200), rng.uniform(10, 1200), rng.randint(72, 1200), 'VERTICAL')
+    assert width <= height
+
+def case_lens(rng):
+    length = rng.uniform(8, 300)
+    current = {'type': rng.choice(('PERSP', 'ORTHO')), 'lens': rng.choice((length, 50.0))}
+    changed = lens.changed_settings(current, lens.focal_length_settings(length))
+    assert all(current[name] != value for name, value in changed.items())
+
+def case_framing(rng):
+    camera_type = rng.choice(('PERSP', 'ORTHO'))
+    frame = framing.CameraFrame(
+        camera_type, 50.0, 6.0, 36.0, 24.0, rng.choice(('AUTO', 'HORIZONTAL', 'VERTICAL')),
+        rng.uniform(0.4, 2.5), rng.uniform(-0.2, 0.2), rng.uniform(-0.2, 0.2),
+    )
+    camera_matrix = np.eye(4)
+    camera_matrix[:3, 3] = [rng.uniform(-5, 5), rng.uniform(-5, 5), rng.uniform(20, 40)]
+    points = np.random.default_rng(rng.randrange(1 << 30)).normal(size=(rng.randint(1, 2000), 3))
+    extent = framing.FrameExtent()
+    extent.add(framing.transform_points(points, framing.view_matrix(camera_matrix)))
+    margin = rng.uniform(0.0, 0.3)
+    settings = framing.framing_settings(extent, frame, margin)
+    for name, value in settings.items():
+        setattr(frame, name, value)
+
+    # Every point lands inside the fitted frame, possibly shifted off centre,
+    # and the tightest one sits at the margin
+    local = framing.transform_points(points, framing.view_matrix(camera_matrix)).T
+    depth = -local[:, 2]
+    xy = local[:, :2] if camera_type == 'ORTHO' else local[:, :2] / depth[:, None]
+    (x_lo, x_hi), (y_lo, y_hi) = frame.view_bounds()
+    inside = lambda value, lo, hi: lo - 1e-9 <= value <= hi + 1e-9
+    assert all(inside(v, x_lo, x_hi) for v in xy[:, 0]) and all(inside(v, y_lo, y_hi) for v in xy[:, 1])
+    touches = max(
+        xy[:, 0].max() / x_hi if x_hi > 0 else 0, xy[:, 0].min() / x_lo if x_lo < 0 else 0,
+        xy[:, 1].max() / y_hi if y_hi > 0 else 0, xy[:, 1].min() / y_lo if y_lo < 0 else 0,
+    )
+    assert abs(touches * (1.0 + margin) - 1.0) < 1e-6, touches
+    assert settings['clip_start'] <= depth.min() and depth.max() <= settings['clip_end']
+
+def case_culling(rng):
+    np_rng = np.random.default_rng(rng.randrange(1 << 30))
+    camera_type = rng.choice(('PERSP', 'ORTHO'))
+    frame = framing.CameraFrame(
+        camera_type, rng.uniform(20, 100), rng.uniform(2, 20), 36.0, 24.0, 'AUTO',
+        rng.uniform(0.5, 2.0), clip_start=0.1, clip_end=rng.uniform(20, 80),
+    )
+    camera_matrix = np.eye(4)
+    count = rng.randint(1, 200)
+    centers = np_rng.uniform(-30, 30, size=(count, 3))
+    sizes = np_rng.uniform(0.1, 3.0, size=(count, 3))
+    signs = np.array([[x, y, z] for x in (-1, 1) for y in (-1, 1) for z in (-1, 1)])
+    corners = centers[:, None, :] + signs[None, :, :] * sizes[:, None, :]
+    visible = culling.box_visibility(corners, camera_matrix, frame)
+
+    # No false negatives: a box with any sampled point in view is kept
+    samples = centers[:, None, :] + np_rng.uniform(-1, 1, size=(count, 64, 3)) * sizes[:, None, :]
+    x, y, z = samples[..., 0], samples[..., 1], samples[..., 2]
+    depth = -z
+    (x_lo, x_hi), (y_lo, y_hi) = frame.view_bounds()
+    scale = depth if camera_type == 'PERSP' else 1.0
+    seen = (
+        (depth >= frame.clip_start) & (depth <= frame.clip_end)
+        & (x >= x_lo * scale) & (x <= x_hi * scale) & (y >= y_lo * scale) & (y <= y_hi * scale)
+    ).any(axis=1)
+    assert not (seen & ~visible).any()
+
+    matrices = np_rng.normal(size=(count, 4, 4))
+    world = culling.transform_corners(corners, matrices)
+    for i in np_rng.choice(count, min(count, 5), replace=False):
+        assert np.allclose(world[i], corners[i] @ matrices[i, :3, :3].T + matrices[i, :3, 3])
+
+def case_lod(rng):
+    width, height = rng.randint(64, 4096), rng.randint(64, 4096)
+    frame = framing.CameraFrame(
+        rng.choice(('PERSP', 'ORTHO')), rng.uniform(20, 100), rng.uniform(2, 20), 36.0, 24.0,
+        rng.choice(('AUTO', 'HORIZONTAL', 'VERTICAL')), width / height,
+    )
+    center = np.array([rng.uniform(-5, 5), rng.uniform(-5, 5), -rng.uniform(5, 200)])
+    size = rng.uniform(0.01, 4.0)
+    signs = np.array([[x, y, z] for x in (-1, 1) for y in (-1, 1) for z in (-1, 1)])
+    corners = (center + signs * size)[None]
+    extent = float(lod.projected_extent(corners, np.eye(4), frame, width, height)[0])
+
+    # Pixel rectangle of the corners, projected one by one
+    (x_lo, x_hi), (y_lo, y_hi) = frame.view_bounds()
+    pixels = []
+    for x, y, z in corners[0]:
+        if frame.camera_type == 'PERSP':
+            x, y = x / -z, y / -z
+        pixels.append((x / (x_hi - x_lo) * width, y / (y_hi - y_lo) * height))
+    pixels = np.array(pixels)
+    expected = min(max(np.ptp(pixels[:, 0]), np.ptp(pixels[:, 1])), max(width, height))
+    if -center[2] > size:
+        assert abs(extent - expected) < 1e-6 * max(1.0, expected), (extent, expected)
+
+    factor = float(lod.detail_factor(extent, 400, 0.05))
+    assert 0.05 <= factor <= 1.0
+    assert 0 <= lod.subdivision_levels(3, factor) <= 3
+    assert lod.decimate_ratio(1.0, factor) <= 1.0
+
+def case_rigs(rng):
+    count = rng.randint(1, 300)
+    center = np.array([rng.uniform(-10, 10) for _ in range(3)])
+    radius = rng.uniform(0.5, 50)
+    generated = (
+        rigs.orbit_positions(count, center, radius, rng.uniform(-5, 5)),
+        rigs.fibonacci_positions(count, center, radius),
+        rigs.grid_positions(count, center, radius, rng.uniform(-5, 5)),
+    )
+    for positions in generated:
+        assert positions.shape == (count, 3)
+    sphere = np.linalg.norm(generated[1] - center, axis=1)
+    assert np.allclose(sphere, radius)
+    assert len({tuple(row) for row in np.round(generated[2], 6)}) == count
+
+    # Every camera is a rigid frame whose -Z points at the target
+    positions = generated[rng.randrange(3)]
+    matrices = rigs.look_at_matrices(positions, center)
+    rotations = matrices[:, :3, :3]
+    assert np.allclose(np.einsum('kji,kjl->kil', rotations, rotations), np.eye(3), atol=1e-9)
+    assert np.allclose(np.linalg.det(rotations), 1.0)
+    offsets = center - positions
+    distances = np.linalg.norm(offsets, axis=1)
+    aimed = distances > 1e-9
+    assert np.allclose(-rotations[aimed, :, 2], offsets[aimed] / distances[aimed, None])
+    assert (rotations[:, 2, 1] >= -1e-9).all()
+
+    points = np.cumsum(np.array([[rng.uniform(-5, 5) for _ in range(3)] for _ in range(rng.randint(2, 20))]), axis=0)
+    path, tangents = rigs.path_positions(count, points)
+    assert np.allclose(path[0], points[0]) and (count == 1 or np.allclose(path[-1], points[-1]))
+    assert np.allclose(np.linalg.norm(tangents, axis=1), 1.0)
+
+    # A Bezier spline passes through its knots, one per resolution step
+    np_rng = np.random.default_rng(rng.randrange(1 << 30))
+    knots = np_rng.uniform(-5, 5, size=(rng.randint(2, 8), 3))
+    left, right = knots + np_rng.normal(size=knots.shape), knots + np_rng.normal(size=knots.shape)
+    resolution, cyclic = rng.randint(1, 16), rng.random() < 0.5
+    polyline = rigs.bezier_polyline(knots, left, right, resolution, cyclic)
+    segments = len(knots) if cyclic else len(knots) - 1
+    assert polyline.shape == (segments * resolution + 1, 3)
+    assert np.allclose(polyline[::resolution], np.vstack((knots, knots[:1]))[:segments + 1])
+    # Straight handles a third of the way along give a straight, even line
+    straight = rigs.bezier_polyline(knots[:2], knots[:2] - (knots[1] - knots[0]) / 3.0, knots[:2] + (knots[1] - knots[0]) / 3.0, resolution)
+    assert np.allclose(straight, knots[0] + np.linspace(0.0, 1.0, resolution + 1)[:, None] * (knots[1] - knots[0]))
+
+    start, length = rng.randint(-100, 100), rng.randint(1, 50)
+    starts, ends = rigs.consecutive_ranges(count, start, length)
+    assert starts[0] == start and (ends - starts == length - 1).all() and (starts[1:] == ends[:-1] + 1).all()
+
+def euler_matrix(x, y, z):
+    cx, sx, cy, sy, cz, sz = np.cos(x), np.sin(x), np.cos(y), np.sin(y), np.cos(z), np.sin(z)
+    rx = np.array([[1, 0, 0], [0, cx, -sx], [0, sx, cx]])
+    ry = np.array([[cy, 0, sy], [0, 1, 0], [-sy, 0, cy]])
+    rz = np.array([[cz, -sz, 0], [sz, cz, 0], [0, 0, 1]])
+    return rz @ ry @ rx
+
+def evaluate_keys(frames, values, modes, probes):
+    # An F-Curve of constant and linear keys sampled at probes
+    frames, values = np.asarray(frames, dtype=np.float64), np.asarray(values, dtype=np.float64)
+    result = []
+    for t in probes:
+        i = max(0, np.searchsorted(frames, t, side='right') - 1)
+        if i + 1 < len(frames) and modes[i] == baking.LINEAR_INTERPOLATION:
+            u = (t - frames[i]) / (frames[i + 1] - frames[i])
+            result.append(values[i] + (values[i + 1] - values[i]) * u)
+        else:
+            result.append(values[i])
+    return np.array(result)
+
+def case_baking(rng):
+    count = rng.randint(1, 50)
+    angles = [[rng.uniform(-np.pi, np.pi), rng.uniform(-np.pi / 2, np.pi / 2), rng.uniform(-np.pi, np.pi)] for _ in range(count)]
+    if rng.random() < 0.2:
+        angles[0][1] = rng.choice((-np.pi / 2, np.pi / 2))
+    matrices = np.zeros((count, 4, 4))
+    for matrix, (x, y, z) in zip(matrices, angles):
+        matrix[:3, :3] = euler_matrix(x, y, z) * rng.uniform(0.1, 5.0)
+        matrix[:3, 3] = [rng.uniform(-10, 10) for _ in range(3)]
+        matrix[3, 3] = 1.0
+    locations, eulers = baking.matrix_to_euler(matrices)
+    assert np.allclose(locations, matrices[:, :3, 3])
+    for matrix, euler in zip(matrices, eulers):
+        rotation = matrix[:3, :3] / np.linalg.norm(matrix[:3, 0])
+        assert np.allclose(euler_matrix(*euler), rotation, atol=1e-6)
+
+    values = [rng.choice((0.0, 1.0, 2.5)) for _ in range(count)]
+    frames, held, _modes = baking.held_keys(range(count), values)
+    expected = [(i, v) for i, v in enumerate(values) if i == 0 or v != values[i - 1]]
+    assert list(zip(frames.tolist(), held.tolist())) == expected
+    # Mixed constant and linear keys evaluate the same with or without the
+    # dropped ones
+    modes = [rng.choice((baking.CONSTANT_INTERPOLATION, baking.LINEAR_INTERPOLATION)) for _ in range(count)]
+    kept = baking.held_keys(range(count), values, modes)
+    probes = np.arange(0, count - 1 + 0.25, 0.25)
+    assert np.allclose(evaluate_keys(range(count), values, modes, probes), evaluate_keys(*kept, probes))
+    coords = baking.keyframe_coords(frames, held)
+    assert coords.dtype == np.float32 and np.array_equal(coords[1::2], held.astype(np.float32))
+
+def case_trajectory(rng):
+    np_rng = np.random.default_rng(rng.randrange(1 << 30))
+    count = rng.randint(2, 400)
+    times = np.cumsum(np_rng.uniform(0.1, 2.0, count))
+    values = np.cumsum(np_rng.normal(0.0, 1.0, count)) * rng.choice((0.0, 0.01, 1.0))
+    tolerance = rng.choice((0.0, 0.05, 0.5))
+    keep = trajectory.rdp_indices(times, values, tolerance)
+    assert keep[0] == 0 and keep[-1] == count - 1 and (np.diff(keep) > 0).all()
+    error = np.abs(np.interp(times, times[keep], values[keep]) - values)
+    assert (error <= tolerance + 1e-9).all(), error.max()
+
+    quaternions = np_rng.normal(size=(count, 4))
+    continuous = trajectory.continuous_quaternions(quaternions)
+    assert np.allclose(np.abs(continuous), np.abs(quaternions / np.linalg.norm(quaternions, axis=1, keepdims=True)))
+    assert (np.einsum('ij,ij->i', continuous[1:], continuous[:-1]) >= 0.0).all()
+
+    # The same samples through a headerless .npy, a named .csv and a chunked layout .csv
+    table = np.column_stack((times, np_rng.normal(size=(count, 3)), quaternions, np_rng.uniform(20, 80, count)))
+    with tempfile.TemporaryDirectory() as folder:
+        paths = [os.path.join(folder, name) for name in ("path.npy", "named.csv", "plain.csv")]
+        np.save(paths[0], table)
+        np.savetxt(paths[1], table[:, ::-1], delimiter=",", header="lens,qz,qy,qx,qw,z,y,x,time", comments="", fmt="%.17g")
+        np.savetxt(paths[2], np.column_stack((np.zeros(count), table)), fmt="%.17g")
+        read = [
+            trajectory.read_trajectory(paths[0]),
+            trajectory.read_trajectory(paths[1]),
+            trajectory.read_csv(paths[2], "_ " + trajectory.DEFAULT_COLUMNS, chunk_rows=rng.randint(1, 50)),
+        ]
+    for loaded in read:
+        assert len(loaded) == count
+        assert np.array_equal(loaded.stack(trajectory.parse_columns(trajectory.DEFAULT_COLUMNS)), table)
+    assert np.array_equal(trajectory.trajectory_frames(read[0], fps=24.0), times * 24.0)
+
+def case_dedup(rng):
+    shots, rows, start = [], [], rng.randint(1, 50)
+    for index in range(rng.randint(1, 6)):
+        length = rng.randint(0, 40)
+        shots.append((f"Camera{index}", start, start + length - 1))
+        # A few distinct states per shot, repeated in any order
+        states = [rng.randint(0, 3) for _ in range(length)]
+        rows.extend((index, state, state * 0.5) for state in states)
+        start += length + rng.randint(0, 5)
+    rows = np.array(rows, dtype=np.float64).reshape(-1, 3)
+    sources = dedup.duplicate_sources(rows)
+    first = {}
+    expected = [first.setdefault(tuple(row), index) for index, row in enumerate(rows.tolist())]
+    assert sources.tolist() == expected
+
+    plan = dedup.FramePlan(shots, sources)
+    offset = 0
+    for camera, first, last in shots:
+        count = last - first + 1
+        rendered = set(plan.renders[camera])
+        copied = {frame: source for source, frames in plan.copies[camera].items() for frame in frames}
+        assert rendered.isdisjoint(copied) and len(rendered) + len(copied) == count
+        for frame, source in copied.items():
+            assert source in rendered and source < frame
+            assert (rows[offset + frame - first] == rows[offset + source - first]).all()
+        runs = [(c, s, e) for c, s, e in plan.render_shots() if c == camera]
+        assert sorted(f for _c, s, e in runs for f in range(s, e + 1)) == sorted(rendered)
+        assert plan.saved()[camera] == (len(copied), count)
+        offset += count
+    frames = sorted(rng.sample(range(100), rng.randint(0, 30)))
+    assert [f for s, e in dedup.frame_runs(frames) for f in range(s, e + 1)] == frames
+
+    camera = shots[0][0]
+    kept = [frame for frame in plan.renders[camera] if rng.random() < 0.5]
+    plan.keep_renders(camera, kept)
+    assert plan.renders[camera] == kept and set(plan.copies[camera]) <= set(kept)
+
+def case_manifest(rng):
+    settings = {"resolution": f"{rng.randint(1, 4096)}x{rng.randint(1, 4096)}", "fps": [rng.choice((24, 25, 30)), 1.0]}
+    key = fingerprint(settings)
+    assert key == fingerprint(dict(reversed(list(settings.items()))))
+    other = fingerprint(dict(settings, fps=[settings["fps"][0] + 1, 1.0]))
+    assert other != key
+    with tempfile.TemporaryDirectory() as folder:
+        manifest = RenderManifest(os.path.join(folder, "shots", "manifest.json"))
+        frames = range(1, rng.randint(2, 60))
+        written = set()
+        for frame in frames:
+            path = os.path.join(folder, "shots", "Camera", f"Camera_{frame:04d}.png")
+            state = rng.choice(('VALID', 'STALE', 'MISSING', 'EMPTY', 'UNRECORDED'))
+            if state != 'MISSING':
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path, "w") as f:
+                    f.write("" if state == 'EMPTY' else "pixels")
+            if state != 'UNRECORDED':
+                manifest.record("Camera", frame, path, other if state == 'STALE' else key, settings)
+            if state == 'VALID':
+                written.add(frame)
+        manifest.save()
+        loaded = RenderManifest.load(manifest.path)
+        assert loaded.settings.get(key, settings) == settings
+        assert loaded.pending_frames("Camera", frames, key) == [frame for frame in frames if frame not in written]
+        assert loaded.pending_frames("Other", frames, key) == list(frames)
+
+def case_deliverables(rng):
+    fit = rng.choice(('AUTO', 'HORIZONTAL', 'VERTICAL'))
+    overscan = rng.choice((0.0, rng.uniform(0.0, 0.3)))
+    sizes = [(rng.randint(64, 4096), rng.randint(64, 4096)) for _ in range(rng.randint(1, 6))]
+    (width, height), crops = deliverables.master_plan(sizes, fit, overscan)
+    sharpest = 0.0
+    for (out_width, out_height), (x, y, crop_width, crop_height) in zip(sizes, crops):
+        # Centred, inside the master, same aspect and never upscaled
+        assert -1e-6 <= x and x + crop_width <= width + 1e-6 and -1e-6 <= y and y + crop_height <= height + 1e-6
+        assert abs((x + crop_width / 2.0) - width / 2.0) < 1e-6 and abs((y + crop_height / 2.0) - height / 2.0) < 1e-6
+        assert abs(crop_width / crop_height - out_width / out_height) < 1e-9 * out_width / out_height
+        assert crop_width >= out_width - 1e-6 and crop_height >= out_height - 1e-6
+        sharpest = max(sharpest, out_width / crop_width)
+        # The crop covers the view the deliverable renders on its own
+        extent = deliverables.view_extent(out_width, out_height, fit)
+        master_density = deliverables.pixel_density((width, height), fit, overscan)
+        assert abs(crop_width - master_density * extent[0]) < 1e-6 * crop_width
+    # Rounding the master up costs at most one pixel of density
+    assert sharpest > 1.0 - 1.0 / 64
+    if overscan == 0.0:
+        assert any(width - w < 1.0 or height - h < 1.0 for _x, _y, w, h in crops)
+
+    np_rng = np.random.default_rng(rng.randrange(1 << 30))
+    rows, columns = rng.randint(8, 200), rng.randint(8, 200)
+    channels = rng.choice((1, 3, 4))
+    value = rng.random()
+    flat = np.full((rows, columns, channels), value, dtype=np.float32)
+    if channels == 4:
+        flat[..., 3] = np_rng.uniform(0.1, 1.0, (rows, columns))
+    x, y = rng.uniform(0, columns / 3), rng.uniform(0, rows / 3)
+    crop = (x, y, rng.uniform(1, columns - x), rng.uniform(1, rows - y))
+    size = (rng.randint(1, 300), rng.randint(1, 300))
+    result = derive.crop_resample(flat, crop, size)
+    assert result.shape == (size[1], size[0], channels)
+    assert np.allclose(result[..., :3], value, atol=1e-4)
+    image = np_rng.random((rows, columns, 3)).astype(np.float32)
+    assert np.allclose(derive.crop_resample(image, (0, 0, columns, rows), (columns, rows)), image, atol=1e-5)
+
+def case_tiles(rng):
+    width, height = rng.randint(1, 60000), rng.randint(1, 60000)
+    budget = rng.choice((64, 256, 2048)) * 1024 * 1024
+    bytes_per_pixel = rng.choice((20, 64, 150, 600))
+    planned = tiles.plan_tiles(width, height, budget, bytes_per_pixel)
+    assert sum(w * h for _x, _y, w, h in planned) == width * height
+    assert all(w * h * bytes_per_pixel <= budget for _x, _y, w, h in planned)
+    for tile in planned:
+        x, y, w, h = tile
+        border = tiles.tile_border(tile, width, height)
+        # Blender's border rect: float32 border times the size, truncated
+        pixels = {key: int(np.float32(value) * np.float32(width if key.endswith("x") else height)) for key, value in border.items()}
+        assert (pixels["min_x"], pixels["max_x"]) == (x, x + w)
+        assert (pixels["min_y"], pixels["max_y"]) == (height - y - h, height - y)
+    # A0 at 1200 DPI with the default budget, where x / width landed short
+    for tile in tiles.plan_tiles(39732, 56173, 2048 * 1024 * 1024, 64):
+        border = tiles.tile_border(tile, 39732, 56173)
+        assert int(np.float32(border["max_y"]) * np.float32(56173)) == 56173 - tile[1]
+
+CASES = {
+    "shot_table": case_shot_table,
+    "minimal_moves": case_minimal_moves,
+    "masks": case_masks,
+    "markers": case_markers,
+    "resolution": case_resolution,
+    "lens": case_lens,
+    "framing": case_framing,
+    "culling": case_culling,
+    "lod": case_lod,
+    "rigs": case_rigs,
+    "baking": case_baking,
+    "trajectory": case_trajectory,
+    "dedup": case_dedup,
+    "manifest": case_manifest,
+    "deliverables": case_deliverables,
+    "tiles": case_tiles,
+}
+
+def run(cases, seed, selected):
+    for name, case in CASES.items():
+        if selected and name not in selected:
+            continue
+        rng = random.Random(seed)
+        started = time.perf_counter()
+        for i in range(cases):
+            try:
+                case(rng)
+            except AssertionError as e:
+                print(f"{name}: case {i} (seed {seed}) failed: {e}")
+                return 1
+        elapsed = (time.perf_counter() - started) * 1000.0
+        print(f"{name:16} {cases:6d} cases {elapsed:10.1f} ms")
+    return 0
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run randomized Compositor.core cases outside Blender")
+    parser.add_argument("--cases", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--only", default="", help="comma separated case names")
+    parser.add_argument("--profile", action="store_true", help="print the top functions by cumulative time")
+    args = parser.parse_args(argv)
+    selected = {name.strip() for name in args.only.split(",") if name.strip()}
+    if not args.profile:
+        return run(args.cases, args.seed, selected)
+    profiler = cProfile.Profile()
+    result = profiler.runcall(run, args.cases, args.seed, selected)
+    pstats.Stats(profiler).sort_stats("cumulative").print_stats(25)
+    return result
+
+if __name__ == "__main__":
+    sys.exit(main())
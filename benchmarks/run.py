@@ -0,0 +1,184 @@
+# Headless benchmarks for the Compositor add-on:
+#   blender -b --factory-startup --python benchmarks/run.py -- --scales 10,100,1000 --output results.json
+#   blender -b --factory-startup --python benchmarks/run.py -- --baseline baseline.json
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from types import SimpleNamespace
+
+import bpy
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BENCH_DIR)
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+import compare
+import scenes
+
+class FakeLayout:
+    # Accepts every UILayout call so panel draw code runs without a window
+    def __getattr__(self, name):
+        return self._call
+
+    def _call(self, *args, **kwargs):
+        return FakeLayout()
+
+def panel_drawer():
+    from Compositor.ui.cinematography_panel import COMPOSITOR_PT_panel
+    methods = {name: value for name, value in vars(COMPOSITOR_PT_panel).items() if callable(value)}
+    drawer = type("PanelDrawer", (), methods)()
+    drawer.layout = FakeLayout()
+    return drawer
+
+def run_op(scene, op, **kwargs):
+    with bpy.context.temp_override(scene=scene):
+        op(**kwargs)
+
+def setup_keyframes(scene):
+    for item in scene.camera_list:
+        item.camera.keyframe_insert("location", frame=item.camera.camera_range.start_frame)
+    run_op(scene, bpy.ops.camera.update_timeline)
+
+def edit_ranges(scene, edits=50):
+    camera_obj = scene.camera_list[len(scene.camera_list) // 2].camera
+    camera_range = camera_obj.camera_range
+    for i in range(edits):
+        camera_range.start_frame += 1 if i % 2 == 0 else -1
+
+def draw_panel(scene, drawer):
+    context = SimpleNamespace(
+        scene=scene,
+        space_data=SimpleNamespace(lock_camera=False),
+        window_manager=bpy.context.window_manager,
+    )
+    scene.show_camera_manager = True
+    scene.show_cinema_formats = True
+    scene.show_print_formats = True
+    drawer.draw(context)
+
+def cycle_cinema_formats(scene):
+    from Compositor.cinematography import presets
+    for identifier, _name, _description, _number in presets.registry().cinema_items:
+        scene.cinema_format = identifier
+
+def drag_linked_resolution(scene, steps=50):
+    scene.resolution_linked = True
+    scene.aspect_ratio = 16 / 9
+    for i in range(steps):
+        scene.custom_resolution_x = 1920 + i
+
+def sweep_print_dpi(scene, steps=50):
+    for i in range(steps):
+        scene.print_dpi = 150 + i * 10
+
+def setup_culling(scene, moving=0.1):
+    # Cube meshes beside the filler empties, a share of them keyed to move,
+    # and keyed cameras so the culling analysis walks every frame of a shot
+    if not any(obj.type == 'MESH' for obj in scene.objects):
+        mesh = bpy.data.meshes.new("BenchCube")
+        mesh.from_pydata([(x, y, z) for x in (-1, 1) for y in (-1, 1) for z in (-1, 1)], [], [])
+        empties = [obj for obj in scene.objects if obj.type == 'EMPTY']
+        for i, empty in enumerate(empties):
+            obj = bpy.data.objects.new(f"BenchMesh.{i:05d}", mesh)
+            obj.location = empty.location
+            scene.collection.objects.link(obj)
+            if i < len(empties) * moving:
+                obj.keyframe_insert("location", frame=scene.frame_start)
+                obj.location.z += 5.0
+                obj.keyframe_insert("location", frame=scene.frame_end)
+        for item in scene.camera_list:
+            camera_range = item.camera.camera_range
+            item.camera.keyframe_insert("rotation_euler", frame=camera_range.start_frame)
+            item.camera.rotation_euler.z += 1.0
+            item.camera.keyframe_insert("rotation_euler", frame=camera_range.end_frame)
+
+def benchmarks(drawer):
+    # name -> (setup, run); setup is not timed
+    return {
+        "update_timeline": (None, lambda scene: run_op(scene, bpy.ops.camera.update_timeline)),
+        "update_camera_range x50": (None, edit_ranges),
+        "sort_list": (scenes.shuffle_camera_list, lambda scene: run_op(scene, bpy.ops.camera.sort_list)),
+        "erase_all_keyframes": (setup_keyframes, lambda scene: run_op(scene, bpy.ops.camera.erase_all_keyframes)),
+        "panel_draw": (None, lambda scene: draw_panel(scene, drawer)),
+        "cinema_format chain": (None, cycle_cinema_formats),
+        "linked resolution chain x50": (None, drag_linked_resolution),
+        "print_dpi chain x50": (None, sweep_print_dpi),
+        "analyze_shot_culling": (setup_culling, lambda scene: run_op(scene, bpy.ops.cinematography.analyze_shot_culling)),
+    }
+
+def time_benchmark(scene, setup, run, repeat):
+    samples = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup(scene)
+        started = time.perf_counter()
+        run(scene)
+        samples.append((time.perf_counter() - started) * 1000.0)
+    return {
+        "median_ms": statistics.median(samples),
+        "min_ms": min(samples),
+        "max_ms": max(samples),
+        "samples_ms": samples,
+    }
+
+def parse_args():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(prog="blender -b --python benchmarks/run.py --")
+    parser.add_argument("--scales", default="10,100,1000", help="comma separated camera counts")
+    parser.add_argument("--markers-per-camera", type=int, default=2)
+    parser.add_argument("--objects-per-camera", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--only", default="", help="comma separated benchmark names to run")
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--baseline", default="", help="result file to compare against")
+    parser.add_argument("--tolerance", type=float, default=compare.DEFAULT_TOLERANCE)
+    return parser.parse_args(argv)
+
+def main():
+    args = parse_args()
+    import Compositor
+    Compositor.register()
+
+    drawer = panel_drawer()
+    selected = {name.strip() for name in args.only.split(",") if name.strip()}
+    results = {}
+    for cameras in (int(scale) for scale in args.scales.split(",")):
+        markers = cameras * args.markers_per_camera
+        objects = cameras * args.objects_per_camera
+        for name, (setup, run) in benchmarks(drawer).items():
+            if selected and name not in selected:
+                continue
+            key = f"{name} [cameras={cameras} markers={markers} objects={objects}]"
+            scene = scenes.new_scene(f"bench_{cameras}", cameras, markers, objects)
+            results[key] = time_benchmark(scene, setup, run, args.repeat)
+            scenes.remove_scene(scene)
+            print(f"{key:70} {results[key]['median_ms']:10.3f} ms", flush=True)
+
+    report = {
+        "meta": {
+            "blender": bpy.app.version_string,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=1)
+    print(f"Wrote {args.output}")
+
+    exit_code = 0
+    if args.baseline:
+        rows = compare.compare(compare.load(args.baseline), report, args.tolerance)
+        print(compare.format_rows(rows))
+        exit_code = 1 if any(row[4] == "regression" for row in rows) else 0
+    Compositor.unregister()
+    sys.exit(exit_code)
+
+if __name__ == "__main__":
+    main()
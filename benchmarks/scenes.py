@@ -0,0 +1,51 @@
+import random
+
+import bpy
+
+# Synthetic scenes for the benchmarks: cameras with consecutive ranges in
+# the camera list, extra timeline markers and filler objects.
+
+def new_scene(name, cameras, markers, objects, shot_length=24, seed=0):
+    rng = random.Random(seed)
+    scene = bpy.data.scenes.new(name)
+    scene.frame_start = 1
+    scene.frame_end = max(1, cameras * shot_length)
+
+    collection = scene.collection
+    for i in range(cameras):
+        data = bpy.data.cameras.new(f"BenchCam.{i:05d}")
+        camera_obj = bpy.data.objects.new(f"BenchCam.{i:05d}", data)
+        collection.objects.link(camera_obj)
+        item = scene.camera_list.add()
+        item.name = camera_obj.name
+        item.camera = camera_obj
+        camera_obj.location = (rng.uniform(-50, 50), rng.uniform(-50, 50), rng.uniform(1, 20))
+    # Ranges are set once every camera is linked, like a finished staging
+    # scene; marker sync is suspended so setup does not create markers.
+    from Compositor.cinematography.camera_manager import suspend_marker_sync, invalidate_shot_table
+    with suspend_marker_sync():
+        for i, item in enumerate(scene.camera_list):
+            item.camera.camera_range.start_frame = 1 + i * shot_length
+            item.camera.camera_range.end_frame = (i + 1) * shot_length
+    invalidate_shot_table(scene)
+
+    for i in range(markers):
+        scene.timeline_markers.new(f"BenchMarker.{i:05d}", frame=rng.randint(scene.frame_start, scene.frame_end))
+
+    for i in range(objects):
+        empty = bpy.data.objects.new(f"BenchObject.{i:05d}", None)
+        empty.location = (rng.uniform(-100, 100), rng.uniform(-100, 100), rng.uniform(-10, 10))
+        collection.objects.link(empty)
+    return scene
+
+def shuffle_camera_list(scene, seed=0):
+    rng = random.Random(seed)
+    count = len(scene.camera_list)
+    for i in range(count - 1, 0, -1):
+        scene.camera_list.move(i, rng.randint(0, i))
+
+def remove_scene(scene):
+    ids = [obj for obj in scene.objects]
+    ids.extend(obj.data for obj in scene.objects if obj.data is not None)
+    bpy.data.scenes.remove(scene)
+    bpy.data.batch_remove(ids)